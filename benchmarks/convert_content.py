@@ -0,0 +1,235 @@
+"""Measures the cost of converting document content to the kintaro format:
+compiling the schema on every call (``per call``) and once with
+``compile_schema`` (``compiled``), for the root content and a translation.
+
+No requests are made: the content only has basic and nested fields, and the
+document service is given a placeholder google service.
+
+    python benchmarks/convert_content.py [--documents 200] [--repeat 5]
+
+With ``--ref``, the package at a git ref, like the commit before
+``compile_schema``, is measured too, in a subprocess, so both run with the
+same content on the same machine. Versions without ``compile_schema`` only
+have the ``per call`` variant.
+
+    python benchmarks/convert_content.py --ref <commit>
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import tarfile
+from inspect import signature
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, List
+from unittest.mock import MagicMock
+
+
+REPOSITORY: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_schema(models, constants, fields: int = 30, nested_fields: int = 10):
+    field_type = constants.KintaroFieldType
+    basic_fields: List[Dict] = [
+        dict(
+            name=f"field_{i}",
+            type=field_type.STRING,
+            translatable=i % 2 == 0,
+            repeated=i % 5 == 0,
+        )
+        for i in range(fields)
+    ]
+    return models.KintaroSchema(
+        initial_data=dict(
+            name="BenchSchema",
+            schema_fields=[
+                *basic_fields,
+                dict(
+                    name="items",
+                    type=field_type.NESTED,
+                    repeated=True,
+                    schema_fields=[
+                        dict(
+                            name=f"item_{i}",
+                            type=field_type.STRING,
+                            translatable=True,
+                        )
+                        for i in range(nested_fields)
+                    ],
+                ),
+            ],
+        )
+    )
+
+
+def build_content(
+    document: int, prefix: str, fields: int = 30, items: int = 20
+) -> Dict:
+    content: Dict = {
+        f"field_{i}": (
+            [f"{prefix} {document} {i} {j}" for j in range(3)]
+            if i % 5 == 0
+            else f"{prefix} {document} {i}"
+        )
+        for i in range(fields)
+    }
+    content["items"] = [
+        {f"item_{i}": f"{prefix} {document} item {j} {i}" for i in range(10)}
+        for j in range(items)
+    ]
+    return content
+
+
+def measure(fn: Callable, repeat: int) -> float:
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def run(package_path: str, documents_count: int, repeat: int):
+    """Measures the package found in ``package_path``"""
+    sys.path.insert(0, package_path)
+    constants = importlib.import_module("kintaro_client.constants")
+    models = importlib.import_module("kintaro_client.models")
+    services = importlib.import_module("kintaro_client.services")
+    try:
+        compile_schema = importlib.import_module(
+            "kintaro_client.converters"
+        ).compile_schema
+    except (ImportError, AttributeError):
+        compile_schema = None
+
+    service = services.KintaroDocumentService(
+        repo_id="bench", workspace_id="bench", service=MagicMock()
+    )
+    schema = build_schema(models=models, constants=constants)
+    documents: List[Dict] = [
+        dict(
+            root=build_content(document=i, prefix="root"),
+            nl_nl=build_content(document=i, prefix="nl"),
+        )
+        for i in range(documents_count)
+    ]
+
+    # md5 information of the translations, computed once outside of the
+    #  measured conversions
+    translation_kwargs: List[Dict] = [
+        dict(
+            root_md5_info=service.get_structured_content_values(
+                doc_content=content["root"],
+                schema_info=schema.schema_fields,
+                md5_results=True,
+            ),
+            field_name_structure=service.get_structured_content_values(
+                doc_content=content["nl_nl"],
+                schema_info=schema.schema_fields,
+            ),
+        )
+        for content in documents
+    ]
+
+    variants: List[str] = ["per call"]
+    if (
+        compile_schema is not None
+        and "converter"
+        in signature(
+            service.convert_document_content_to_kintaro_format
+        ).parameters
+    ):
+        variants.append("compiled")
+
+    def convert(variant: str, locale: str) -> Callable:
+        def convert_documents():
+            for content, kwargs in zip(documents, translation_kwargs):
+                if locale == "root":
+                    kwargs = {}
+                if variant == "compiled":
+                    kwargs = dict(kwargs, converter=compile_schema(schema))
+                service.convert_document_content_to_kintaro_format(
+                    collection_id="bench",
+                    content=content[locale],
+                    schema_info=schema.schema_fields,
+                    locale=locale,
+                    **kwargs,
+                )
+
+        return convert_documents
+
+    for locale in ["root", "nl_nl"]:
+        for variant in variants:
+            elapsed: float = measure(
+                convert(variant=variant, locale=locale), repeat=repeat
+            )
+            print(
+                f"{locale:>6} {variant:>9}: "
+                f"{elapsed / documents_count * 1e6:10.1f} us/document",
+                flush=True,
+            )
+
+
+def run_ref(ref: str, documents_count: int, repeat: int):
+    """Measures the package at the git ``ref``, exported to a temporary
+    directory, in a subprocess
+    """
+    archive: bytes = subprocess.run(
+        ["git", "archive", "--format=tar", ref, "kintaro_client"],
+        cwd=REPOSITORY,
+        check=True,
+        capture_output=True,
+    ).stdout
+    with TemporaryDirectory() as package_path:
+        with tarfile.open(fileobj=BytesIO(archive)) as tar:
+            tar.extractall(path=package_path)
+        subprocess.run(
+            [
+                sys.executable,
+                os.path.abspath(__file__),
+                "--package-path",
+                package_path,
+                "--documents",
+                str(documents_count),
+                "--repeat",
+                str(repeat),
+            ],
+            check=True,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--ref", help="git ref whose package is measured too, first"
+    )
+    parser.add_argument(
+        "--package-path",
+        default=REPOSITORY,
+        help="directory of the measured kintaro_client package",
+    )
+    args = parser.parse_args()
+
+    if args.package_path == REPOSITORY:
+        print(f"{args.documents} documents, best of {args.repeat} runs")
+    if args.ref:
+        print(f"{args.ref}:", flush=True)
+        run_ref(
+            ref=args.ref, documents_count=args.documents, repeat=args.repeat
+        )
+        print("working tree:", flush=True)
+    run(
+        package_path=args.package_path,
+        documents_count=args.documents,
+        repeat=args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from functools import update_wrapper
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from google.auth.transport.requests import Request as GoogleAuthRequest
+from googleapiclient.errors import HttpError as GoogleApiHttpError
+from googleapiclient.http import HttpRequest
+from httplib2 import Response as Httplib2Response
+
+from kintaro_client.batch import KintaroBatchResult
+from kintaro_client.client import KintaroClient
+from kintaro_client.constants import KINTARO_MAX_CONCURRENCY
+from kintaro_client.services.base import KintaroBaseService
+
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncKintaroService:
+    """Asynchronous view of a kintaro service.
+
+    Every method of the wrapped service becomes a coroutine function that
+    returns the same models, or error dicts, as the original. The method
+    runs in the client's ``executor`` and each kintaro request it makes is
+    awaited, in the event loop, through ``httpx``, so only the
+    ``max_concurrency`` limit of the client bounds the requests in flight.
+
+    Like in ``KintaroBatch``, methods that make several requests are run
+    again, with the responses received so far, after each one. The work
+    that is not one of their kintaro requests, like the files uploaded and
+    the referenced documents written by ``create_document``, is done once,
+    see ``run_once``.
+    """
+
+    def __init__(
+        self, service: KintaroBaseService, client: "AsyncKintaroClient"
+    ):
+        self.service = service
+        self.client = client
+
+    def __repr__(self) -> str:
+        return f"AsyncKintaroService<{type(self.service).__name__}>"
+
+    def __getattr__(self, name: str) -> Any:
+        attr: Any = getattr(self.service, name)
+        if not callable(attr):
+            return attr
+
+        async def async_method(*args, **kwargs):
+            return await self.client.run(attr, *args, **kwargs)
+
+        return update_wrapper(async_method, attr)
+
+
+class AsyncKintaroClient:
+    """Asynchronous version of ``KintaroClient``, with the same services,
+    as ``AsyncKintaroService`` objects, under the same names.
+
+    Requires ``httpx``, installed with the **async** extra.
+
+    >>> async with AsyncKintaroClient(repo_id, workspace_id) as client:
+    ...     documents = await asyncio.gather(
+    ...         *[
+    ...             client.documents.get_document(
+    ...                 document_id=document_id, collection_id="pages"
+    ...             )
+    ...             for document_id in document_ids
+    ...         ]
+    ...     )
+    """
+
+    repositories: Optional[AsyncKintaroService] = None
+    workspaces: Optional[AsyncKintaroService] = None
+    schemas: Optional[AsyncKintaroService] = None
+    collections: Optional[AsyncKintaroService] = None
+    documents: Optional[AsyncKintaroService] = None
+    resources: Optional[AsyncKintaroService] = None
+
+    def __init__(
+        self,
+        repo_id: str,
+        workspace_id: str,
+        use_backend_url: bool = False,
+        max_concurrency: int = KINTARO_MAX_CONCURRENCY,
+        client: Optional[KintaroClient] = None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        repo_id : str
+            The repository/site's string id
+        workspace_id : str
+            The project/workspace's string id
+        use_backend_url : bool
+            Use the backend kintaro host instead of the default one
+        max_concurrency : int
+            Maximum number of requests in flight at the same time
+        client : Optional[KintaroClient]
+            The synchronous client whose services are wrapped. Created
+            with the other parameters when not provided.
+        executor : Optional[Executor]
+            Executor running the synchronous steps of the methods, between
+            their requests, so they do not block the event loop. The
+            loop's default executor when not provided.
+        **kwargs : Dict
+            Arbitrary keyword arguments, forwarded to ``KintaroClient``.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncKintaroClient requires httpx, install it with "
+                "'pip install kintaro-api-client[async]'"
+            )
+
+        self.client = client or KintaroClient(
+            repo_id=repo_id,
+            workspace_id=workspace_id,
+            use_backend_url=use_backend_url,
+            **kwargs,
+        )
+        self.repo_id = self.client.repo_id
+        self.workspace_id = self.client.workspace_id
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            follow_redirects=True,
+        )
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.refresh_lock: Optional[asyncio.Lock] = None
+
+        for attr in [
+            "repositories",
+            "workspaces",
+            "schemas",
+            "collections",
+            "documents",
+            "resources",
+        ]:
+            setattr(
+                self,
+                attr,
+                AsyncKintaroService(
+                    service=getattr(self.client, attr), client=self
+                ),
+            )
+
+    async def __aenter__(self) -> "AsyncKintaroClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.http_client.aclose()
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Runs a service method, awaiting each of its requests"""
+        result: KintaroBatchResult = KintaroBatchResult(
+            fn=lambda _, *a, **kw: fn(*a, **kw),
+            instance=None,
+            args=args,
+            kwargs=kwargs,
+        )
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            request: Optional[HttpRequest] = await loop.run_in_executor(
+                self.executor, result.replay
+            )
+            if request is None:
+                return result.result()
+
+            response, exception = await self.send(request=request)
+            result.add_response(
+                request_id="", response=response, exception=exception
+            )
+
+    async def send(
+        self, request: HttpRequest
+    ) -> Tuple[Any, Optional[Exception]]:
+        """Sends a request built by a google service, returning its parsed
+        response or the error ``execute`` would have raised
+        """
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        headers: Dict[str, str] = dict(request.headers)
+        async with self.semaphore:
+            await self.authorize(request=request, headers=headers)
+            response = await self.http_client.request(
+                request.method,
+                request.uri,
+                content=request.body,
+                headers=headers,
+            )
+
+        info: Dict[str, str] = {
+            key.lower(): value for key, value in response.headers.items()
+        }
+        info.pop("content-encoding", None)
+        info["status"] = str(response.status_code)
+        resp: Httplib2Response = Httplib2Response(info)
+        resp.reason = response.reason_phrase
+
+        if resp.status >= 300:
+            return None, GoogleApiHttpError(
+                resp, response.content, uri=request.uri
+            )
+
+        try:
+            return request.postproc(resp, response.content), None
+        except GoogleApiHttpError as e:
+            return None, e
+
+    async def authorize(self, request: HttpRequest, headers: Dict):
+        credentials = getattr(request.http, "credentials", None)
+        if credentials is None:
+            return
+
+        if not credentials.valid:
+            if self.refresh_lock is None:
+                self.refresh_lock = asyncio.Lock()
+
+            async with self.refresh_lock:
+                if not credentials.valid:
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, credentials.refresh, GoogleAuthRequest()
+                    )
+
+        credentials.apply(headers)
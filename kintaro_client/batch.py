@@ -0,0 +1,273 @@
+import logging
+from threading import local
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from googleapiclient.errors import HttpError as GoogleApiHttpError
+from googleapiclient.http import HttpRequest
+
+from kintaro_client.constants import KINTARO_BATCH_SIZE
+from kintaro_client.transport import get_thread_http
+
+
+logger = logging.getLogger(__name__)
+
+_batch_state = local()
+
+
+class KintaroBatchRequestPending(BaseException):
+    """Raised while replaying a batched call when it needs the response of a
+    request that has not been sent yet. It is not an ``Exception`` so the
+    services' own error handling never swallows it.
+    """
+
+    def __init__(self, request: HttpRequest):
+        super().__init__()
+        self.request = request
+
+
+def get_current_batch() -> Optional["KintaroBatch"]:
+    """Returns the batch active in the current thread, if any"""
+    return getattr(_batch_state, "batch", None)
+
+
+def get_replaying_result() -> Optional["KintaroBatchResult"]:
+    """Returns the batched call being replayed in the current thread, if any"""
+    return getattr(_batch_state, "replaying", None)
+
+
+def run_once(fn: Callable, *args, **kwargs) -> Any:
+    """Calls ``fn``, work of a service method that is not a kintaro request
+    of its own, like uploading files or writing other documents, once per
+    batched call: while the call is replayed, see ``KintaroBatchResult``,
+    the value (or error) of the first step is returned again.
+    """
+    replaying: Optional[KintaroBatchResult] = get_replaying_result()
+    if replaying is None:
+        return fn(*args, **kwargs)
+    return replaying.run_once(fn, *args, **kwargs)
+
+
+class KintaroHttpRequest(HttpRequest):
+    """``HttpRequest`` used by the kintaro services.
+
+    Requests are sent through the current thread's copy of the service's
+    http object, see ``get_thread_http``. While a batched call is being
+    replayed, the response comes from the batch instead.
+    """
+
+    def execute(self, http=None, num_retries: int = 0):
+        replaying: Optional[KintaroBatchResult] = get_replaying_result()
+        if replaying is not None:
+            return replaying.respond(request=self)
+
+        return super().execute(
+            http=http or get_thread_http(self.http),
+            num_retries=num_retries,
+        )
+
+
+class KintaroBatchResult:
+    """The pending result of a service method called inside a batch.
+
+    Once the batch is executed, ``result`` returns exactly what the method
+    would have returned if called outside of it: a model, a list of models,
+    a ``ServiceError``, etc.
+    """
+
+    def __init__(self, fn: Callable, instance: Any, args: Tuple, kwargs: Dict):
+        self.fn = fn
+        self.instance = instance
+        self.args = args
+        self.kwargs = kwargs
+        self.done: bool = False
+        self.value: Any = None
+        self.exception: Optional[BaseException] = None
+        self.responses: List[Tuple[Any, Optional[Exception]]] = []
+        self.position: int = 0
+        # outcomes of the ``run_once`` calls, in the order they are made
+        self.once_results: List[Tuple[Any, Optional[Exception]]] = []
+        self.once_position: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"KintaroBatchResult<{getattr(self.fn, '__name__', self.fn)}"
+            f"{':done' if self.done else ''}>"
+        )
+
+    def result(self) -> Any:
+        """Returns the value of the call
+
+        Raises
+        ------
+        RuntimeError
+            If the batch was not executed yet
+        """
+        if not self.done:
+            raise RuntimeError("The batch containing this call was not run")
+        if self.exception is not None:
+            raise self.exception
+        return self.value
+
+    def add_response(
+        self,
+        request_id: str,
+        response: Any,
+        exception: Optional[Exception],
+    ):
+        self.responses.append((response, exception))
+
+    def respond(self, request: HttpRequest) -> Any:
+        """Answers the n-th request of the call with the n-th response
+        received from the batches, or asks for it to be sent.
+        """
+        position: int = self.position
+        self.position += 1
+
+        if position >= len(self.responses):
+            raise KintaroBatchRequestPending(request=request)
+
+        response, exception = self.responses[position]
+        if exception is not None:
+            raise exception
+        return response
+
+    def run_once(self, fn: Callable, *args, **kwargs) -> Any:
+        """Returns the outcome of the n-th ``run_once`` call of the step
+        being replayed, calling ``fn`` when no previous step got that far.
+
+        ``fn`` runs outside of the batch, its requests are sent right away.
+        """
+        position: int = self.once_position
+        self.once_position += 1
+
+        if position >= len(self.once_results):
+            batch: Optional[KintaroBatch] = get_current_batch()
+            _batch_state.batch = None
+            _batch_state.replaying = None
+            try:
+                self.once_results.append((fn(*args, **kwargs), None))
+            except Exception as e:
+                self.once_results.append((None, e))
+            finally:
+                _batch_state.batch = batch
+                _batch_state.replaying = self
+
+        value, exception = self.once_results[position]
+        if exception is not None:
+            raise exception
+        return value
+
+    def replay(self) -> Optional[HttpRequest]:
+        """Runs the call, with the responses gathered so far, until it either
+        finishes or needs a new request, which is returned.
+        """
+        self.position = 0
+        self.once_position = 0
+        _batch_state.replaying = self
+        try:
+            self.value = self.fn(self.instance, *self.args, **self.kwargs)
+            self.done = True
+        except KintaroBatchRequestPending as e:
+            return e.request
+        except Exception as e:
+            self.exception = e
+            self.done = True
+        finally:
+            _batch_state.replaying = None
+
+
+class KintaroBatch:
+    """Context that queues the calls to the services' api methods, made from
+    the current thread, and sends their requests as http batches.
+
+    >>> with client.batch(batch_size=50) as batch:
+    ...     results = [
+    ...         client.documents.get_document(
+    ...             document_id=document_id, collection_id="pages"
+    ...         )
+    ...         for document_id in document_ids
+    ...     ]
+    >>> documents = [result.result() for result in results]
+
+    Calls that need several requests, like ``update_document``, are replayed
+    after every batch until they finish, each step of every queued call
+    being sent in the same batches. The work of a call that is not one of
+    its kintaro requests, like the files uploaded and the referenced
+    documents written by ``create_document`` and ``update_document``, goes
+    through ``run_once``: it is done, without batching, the first time the
+    call gets to it and reused by the following steps.
+    """
+
+    def __init__(self, service, batch_size: int = KINTARO_BATCH_SIZE):
+        """
+        Parameters
+        ----------
+        service
+            The root google service `Resource`, used to create the http
+            batches.
+        batch_size : int
+            Maximum number of requests sent in each http batch.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size should be greater than 0")
+
+        self.service = service
+        self.batch_size = batch_size
+        self.results: List[KintaroBatchResult] = []
+        self.previous_batch: Optional[KintaroBatch] = None
+
+    def __enter__(self) -> "KintaroBatch":
+        self.previous_batch = get_current_batch()
+        _batch_state.batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _batch_state.batch = self.previous_batch
+        if exc_type is None:
+            self.execute()
+
+    def add(self, fn: Callable, instance: Any, *args, **kwargs):
+        result: KintaroBatchResult = KintaroBatchResult(
+            fn=fn, instance=instance, args=args, kwargs=kwargs
+        )
+        self.results.append(result)
+        return result
+
+    def execute(self) -> List[KintaroBatchResult]:
+        """Sends every queued call, in batches of ``batch_size`` requests,
+        and returns their results in the order they were queued.
+        """
+        pending: List[KintaroBatchResult] = [
+            result for result in self.results if not result.done
+        ]
+
+        while pending:
+            requests: List[Tuple[KintaroBatchResult, HttpRequest]] = []
+            for result in pending:
+                request: Optional[HttpRequest] = result.replay()
+                if request is not None:
+                    requests.append((result, request))
+
+            for start in range(0, len(requests), self.batch_size):
+                http_batch = self.service.new_batch_http_request()
+                for result, request in requests[
+                    start : start + self.batch_size
+                ]:
+                    http_batch.add(request, callback=result.add_response)
+
+                try:
+                    http_batch.execute(
+                        http=get_thread_http(requests[start][1].http)
+                    )
+                except GoogleApiHttpError as e:
+                    # the batch request itself failed, every call that did
+                    #  not get a response from it gets the error instead
+                    for result, _ in requests[start : start + self.batch_size]:
+                        if len(result.responses) < result.position:
+                            result.add_response(
+                                request_id="", response=None, exception=e
+                            )
+
+            pending = [result for result in pending if not result.done]
+
+        return self.results
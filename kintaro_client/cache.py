@@ -0,0 +1,768 @@
+import logging
+import os
+import sqlite3
+from collections import OrderedDict
+from hashlib import sha1, sha256
+from json import (
+    JSONDecodeError,
+    dump as json_dump,
+    dumps as json_dumps,
+    load as json_load,
+)
+from tempfile import NamedTemporaryFile
+from threading import RLock
+from time import monotonic, time
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+from googleapiclient.discovery_cache.base import Cache
+
+from kintaro_client.constants import (
+    KINTARO_DISCOVERY_CACHE_DIR,
+    KINTARO_DISCOVERY_CACHE_TTL,
+    KINTARO_DISCOVERY_CACHE_VERSION,
+    KINTARO_FINGERPRINT_CACHE_SIZE,
+    KINTARO_RESOURCE_CACHE_PATH,
+    KINTARO_RESOURCE_CACHE_SIZE,
+    KINTARO_RESOURCE_CHUNK_SIZE,
+    KINTARO_RESOURCE_READ_CACHE_BYTES,
+    KINTARO_RESOURCE_READ_CACHE_DISK_BYTES,
+    KINTARO_RESOURCE_READ_CACHE_SIZE,
+    KINTARO_SCHEMA_CACHE_SIZE,
+    KINTARO_SCHEMA_CACHE_TTL,
+)
+from kintaro_client.converters import KintaroRootFingerprint
+from kintaro_client.models import KintaroResource, KintaroSchema
+
+
+logger = logging.getLogger(__name__)
+
+
+class KintaroDiscoveryCache(Cache):
+    """File based cache for the kintaro discovery document, to be passed to
+    ``googleapiclient.discovery.build``.
+
+    Each discovery url (regular or backend) gets its own cache file. Entries
+    older than ``ttl`` seconds, or written by a different cache version, are
+    ignored and will be replaced by the next download.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl: int = KINTARO_DISCOVERY_CACHE_TTL,
+    ):
+        self.cache_dir = cache_dir or KINTARO_DISCOVERY_CACHE_DIR
+        self.ttl = ttl
+
+    def get_file_path(self, url: str) -> str:
+        url_hash: str = sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(
+            self.cache_dir,
+            f"discovery-v{KINTARO_DISCOVERY_CACHE_VERSION}-{url_hash}.json",
+        )
+
+    def get(self, url: str) -> Optional[str]:
+        try:
+            with open(self.get_file_path(url=url), encoding="utf-8") as f:
+                entry = json_load(f)
+        except (OSError, ValueError, JSONDecodeError):
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != KINTARO_DISCOVERY_CACHE_VERSION
+            or entry.get("url") != url
+        ):
+            return None
+
+        if self.ttl and time() - entry.get("cached_at", 0) > self.ttl:
+            return None
+
+        return entry.get("content")
+
+    def set(self, url: str, content: str):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # write to a temporary file first so concurrent processes never
+            #  read a half written document
+            with NamedTemporaryFile(
+                "w",
+                dir=self.cache_dir,
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            ) as f:
+                json_dump(
+                    dict(
+                        version=KINTARO_DISCOVERY_CACHE_VERSION,
+                        url=url,
+                        cached_at=time(),
+                        content=content,
+                    ),
+                    f,
+                )
+            os.replace(f.name, self.get_file_path(url=url))
+        except OSError as e:
+            logger.warning(f"Failed to cache discovery document: {e}")
+
+
+class KintaroLRUCache:
+    """Thread safe, in memory, least recently used cache with an optional
+    time to live for its entries. Keeps hit and miss counters.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: Optional[float] = None):
+        """
+        Parameters
+        ----------
+        max_size : int
+            Maximum number of entries, the least recently used ones are
+            evicted first.
+        ttl : Optional[float]
+            Number of seconds an entry stays valid. Never expires if empty.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.entries: OrderedDict = OrderedDict()
+        self.lock: RLock = RLock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and not self.is_expired(entry[0])
+
+    def is_expired(self, stored_at: float) -> bool:
+        return bool(self.ttl) and monotonic() - stored_at > self.ttl
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Returns whether the key is cached and its value, without touching
+        the hit and miss counters
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or self.is_expired(entry[0]):
+                if entry is not None:
+                    self.remove_entry(key)
+                return False, None
+
+            self.entries.move_to_end(key)
+            return True, entry[1]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.lock:
+            found, value = self.lookup(key)
+            if not found:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        if self.max_size <= 0:
+            return
+
+        with self.lock:
+            self.remove_entry(key)
+            self.add_entry(key, value)
+            self.evict()
+
+    def add_entry(self, key: Hashable, value: Any):
+        self.entries[key] = (monotonic(), value)
+
+    def evict(self):
+        """Drops the least recently used entries past ``max_size``"""
+        while len(self.entries) > self.max_size:
+            self.remove_entry(next(iter(self.entries)))
+            self.evictions += 1
+
+    def remove_entry(self, key: Hashable):
+        self.entries.pop(key, None)
+
+    def delete(self, key: Hashable):
+        with self.lock:
+            self.remove_entry(key)
+
+    def clear(self):
+        with self.lock:
+            for key in list(self.entries):
+                self.remove_entry(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit, miss and eviction counters and current size"""
+        with self.lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self.entries),
+            )
+
+
+class KintaroSchemaCache(KintaroLRUCache):
+    """Caches schemas by (base_url, repo_id, schema_id) and the schema id used
+    by each collection by (base_url, repo_id, collection_id), ``base_url``
+    being the kintaro host of the service, so services of different hosts
+    can share the cache.
+
+    Used by ``KintaroDocumentService`` when creating and updating documents
+    and invalidated by the schema and collection services whenever a schema
+    or collection is changed through them.
+    """
+
+    def __init__(
+        self,
+        max_size: int = KINTARO_SCHEMA_CACHE_SIZE,
+        ttl: Optional[float] = KINTARO_SCHEMA_CACHE_TTL,
+    ):
+        super().__init__(max_size=max_size, ttl=ttl)
+
+    def get_schema(
+        self, repo_id: str, schema_id: str, base_url: Optional[str] = None
+    ) -> Optional[KintaroSchema]:
+        return self.get(("schema", base_url, repo_id, schema_id))
+
+    def set_schema(
+        self,
+        repo_id: str,
+        schema: KintaroSchema,
+        base_url: Optional[str] = None,
+    ):
+        self.set(("schema", base_url, repo_id, schema.name), schema)
+
+    def get_collection_schema(
+        self, repo_id: str, collection_id: str, base_url: Optional[str] = None
+    ) -> Optional[KintaroSchema]:
+        with self.lock:
+            schema: Optional[KintaroSchema] = None
+            found, schema_id = self.lookup(
+                ("collection", base_url, repo_id, collection_id)
+            )
+            if found:
+                found, schema = self.lookup(
+                    ("schema", base_url, repo_id, schema_id)
+                )
+
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return schema
+
+    def set_collection_schema(
+        self,
+        repo_id: str,
+        collection_id: str,
+        schema: KintaroSchema,
+        base_url: Optional[str] = None,
+    ):
+        with self.lock:
+            self.set(
+                ("collection", base_url, repo_id, collection_id), schema.name
+            )
+            self.set_schema(repo_id=repo_id, schema=schema, base_url=base_url)
+
+    def invalidate_schema(
+        self, repo_id: str, schema_id: str, base_url: Optional[str] = None
+    ):
+        """Drops the schema and every collection entry pointing to it"""
+        with self.lock:
+            self.delete(("schema", base_url, repo_id, schema_id))
+            for key in [
+                key
+                for key, (_, value) in self.entries.items()
+                if key[:3] == ("collection", base_url, repo_id)
+                and value == schema_id
+            ]:
+                self.delete(key)
+
+    def invalidate_collection(
+        self, repo_id: str, collection_id: str, base_url: Optional[str] = None
+    ):
+        self.delete(("collection", base_url, repo_id, collection_id))
+
+
+class KintaroFingerprintCache(KintaroLRUCache):
+    """Caches the root fingerprint of documents, computed for a schema, by
+    (repo_id, collection_id, document_id, schema_id).
+
+    Each entry keeps the ``updated_at`` of the root content it was computed
+    from and is only returned for that same ``updated_at``, so documents
+    changed since then are fingerprinted again.
+    """
+
+    def __init__(
+        self,
+        max_size: int = KINTARO_FINGERPRINT_CACHE_SIZE,
+        ttl: Optional[float] = None,
+    ):
+        super().__init__(max_size=max_size, ttl=ttl)
+
+    def get_fingerprint(
+        self,
+        repo_id: str,
+        collection_id: str,
+        document_id: str,
+        schema_id: str,
+        updated_at: Any,
+    ) -> Optional[KintaroRootFingerprint]:
+        with self.lock:
+            found, entry = self.lookup(
+                (repo_id, collection_id, document_id, schema_id)
+            )
+            if found and entry[0] == updated_at:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            return None
+
+    def set_fingerprint(
+        self,
+        repo_id: str,
+        collection_id: str,
+        document_id: str,
+        schema_id: str,
+        updated_at: Any,
+        fingerprint: KintaroRootFingerprint,
+    ):
+        self.set(
+            (repo_id, collection_id, document_id, schema_id),
+            (updated_at, fingerprint),
+        )
+
+
+class KintaroResourceCache:
+    """Persistent cache of the resources created in kintaro, in a SQLite
+    file, to avoid uploading the same file more than once.
+
+    Resource paths are kept by (repo_id, workspace_id, collection_id) and by
+    a key identifying the file: the hash of its contents, see
+    ``get_content_key``, or the url it was downloaded from. The least
+    recently used entries are evicted past ``max_size`` entries.
+
+    Used by ``KintaroResourceService`` when given as its ``resource_cache``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_size: int = KINTARO_RESOURCE_CACHE_SIZE,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Parameters
+        ----------
+        path : Optional[str]
+            Path of the SQLite file, ``KINTARO_RESOURCE_CACHE_PATH`` by
+            default. Created if it does not exist.
+        max_size : int
+            Maximum number of entries, the least recently used ones are
+            evicted first.
+        ttl : Optional[float]
+            Number of seconds an entry stays valid. Never expires if empty.
+        """
+        self.path = path or KINTARO_RESOURCE_CACHE_PATH
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.lock: RLock = RLock()
+
+        directory: str = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS resources ("
+            "repo_id TEXT, workspace_id TEXT, collection_id TEXT, "
+            "key TEXT, resource_path TEXT, mime_type TEXT, "
+            "stored_at REAL, used_at REAL, "
+            "PRIMARY KEY (repo_id, workspace_id, collection_id, key))"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS resources_used_at "
+            "ON resources (used_at)"
+        )
+        # number of entries, kept up to date instead of counted on every
+        #  insert, and counted again before evicting
+        self.size: int = self.count()
+
+    def __repr__(self) -> str:
+        return f"KintaroResourceCache<{self.path}>"
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.size
+
+    def count(self) -> int:
+        with self.lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM resources"
+            ).fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    @staticmethod
+    def get_content_key(data: str, mime_type: str) -> str:
+        """Key of a file by its base64 encoded contents and mime type. The
+        contents are hashed a chunk at a time, without copying them whole.
+        """
+        digest = sha256(f"{mime_type.lower()}:".encode("utf-8"))
+        for start in range(0, len(data), KINTARO_RESOURCE_CHUNK_SIZE):
+            digest.update(
+                data[start : start + KINTARO_RESOURCE_CHUNK_SIZE].encode(
+                    "utf-8"
+                )
+            )
+        return "sha256:" + digest.hexdigest()
+
+    @staticmethod
+    def get_source_key(source: Union[bytes, str]) -> str:
+        """Key of a file by the url, or the bytes, it is created from"""
+        if isinstance(source, bytes):
+            return "bytes:" + sha256(source).hexdigest()
+        return f"url:{source}"
+
+    def get_resource(
+        self, repo_id: str, workspace_id: str, collection_id: str, key: str
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """Returns the resource path and mime type of a file, if cached"""
+        with self.lock:
+            row: Optional[Tuple] = self.connection.execute(
+                "SELECT resource_path, mime_type, stored_at FROM resources "
+                "WHERE repo_id = ? AND workspace_id = ? "
+                "AND collection_id = ? AND key = ?",
+                (repo_id, workspace_id, collection_id, key),
+            ).fetchone()
+
+            if row is not None and self.ttl and time() - row[2] > self.ttl:
+                self.delete(
+                    repo_id=repo_id,
+                    workspace_id=workspace_id,
+                    collection_id=collection_id,
+                    key=key,
+                )
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.connection.execute(
+                "UPDATE resources SET used_at = ? "
+                "WHERE repo_id = ? AND workspace_id = ? "
+                "AND collection_id = ? AND key = ?",
+                (time(), repo_id, workspace_id, collection_id, key),
+            )
+            return row[0], row[1]
+
+    def set_resource(
+        self,
+        repo_id: str,
+        workspace_id: str,
+        collection_id: str,
+        key: str,
+        resource_path: str,
+        mime_type: Optional[str] = None,
+    ):
+        if self.max_size <= 0:
+            return
+
+        now: float = time()
+        with self.lock:
+            exists: bool = (
+                self.connection.execute(
+                    "SELECT 1 FROM resources WHERE repo_id = ? "
+                    "AND workspace_id = ? AND collection_id = ? AND key = ?",
+                    (repo_id, workspace_id, collection_id, key),
+                ).fetchone()
+                is not None
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO resources VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    repo_id,
+                    workspace_id,
+                    collection_id,
+                    key,
+                    resource_path,
+                    mime_type,
+                    now,
+                    now,
+                ),
+            )
+            if not exists:
+                self.size += 1
+            if self.size <= self.max_size:
+                return
+
+            # other processes may share the file
+            self.size = self.count()
+            excess: int = self.size - self.max_size
+            if excess > 0:
+                evicted: int = self.connection.execute(
+                    "DELETE FROM resources WHERE rowid IN ("
+                    "SELECT rowid FROM resources ORDER BY used_at LIMIT ?)",
+                    (excess,),
+                ).rowcount
+                self.evictions += evicted
+                self.size -= evicted
+
+    def delete(
+        self, repo_id: str, workspace_id: str, collection_id: str, key: str
+    ):
+        with self.lock:
+            self.size -= self.connection.execute(
+                "DELETE FROM resources WHERE repo_id = ? "
+                "AND workspace_id = ? AND collection_id = ? AND key = ?",
+                (repo_id, workspace_id, collection_id, key),
+            ).rowcount
+
+    def clear(self):
+        with self.lock:
+            self.connection.execute("DELETE FROM resources")
+            self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit, miss and eviction counters and current size"""
+        with self.lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self),
+            )
+
+
+class KintaroResourceReadCache(KintaroLRUCache):
+    """Read-through cache of the resources fetched by ``get_resource``, by
+    (resource_path, resource_type, tmp), as resources at a path do not
+    change.
+
+    Entries are kept in memory, least recently used ones evicted past
+    ``max_size`` entries or ``max_bytes`` of base64 file data. With a
+    ``cache_dir``, they are also written to disk, one file per resource,
+    where they outlive the process and are read from on memory misses, up
+    to ``max_disk_bytes``.
+
+    In ``metadata_only`` mode the file data is not kept in memory: cached
+    resources only have their path, name and mime type, and are fetched
+    again when their file data is asked for and can not be read from
+    ``cache_dir``, see ``get_resource``.
+    """
+
+    def __init__(
+        self,
+        max_size: int = KINTARO_RESOURCE_READ_CACHE_SIZE,
+        max_bytes: int = KINTARO_RESOURCE_READ_CACHE_BYTES,
+        ttl: Optional[float] = None,
+        metadata_only: bool = False,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = KINTARO_RESOURCE_READ_CACHE_DISK_BYTES,
+    ):
+        """
+        Parameters
+        ----------
+        max_size : int
+            Maximum number of resources in memory.
+        max_bytes : int
+            Maximum size of the file data of the resources in memory.
+        ttl : Optional[float]
+            Number of seconds an entry stays valid in memory. Never expires
+            if empty.
+        metadata_only : bool
+            Keep resources in memory without their file data.
+        cache_dir : Optional[str]
+            Directory of the disk cache, none if empty.
+        max_disk_bytes : int
+            Maximum size of the files of the disk cache.
+        """
+        self.max_bytes = max_bytes
+        self.metadata_only = metadata_only
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.size_bytes: int = 0
+        self.disk_hits: int = 0
+        self.disk_size_bytes: int = 0
+        super().__init__(max_size=max_size, ttl=ttl)
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.disk_size_bytes = sum(
+                entry.stat().st_size
+                for entry in os.scandir(cache_dir)
+                if entry.name.endswith(".json")
+            )
+
+    @staticmethod
+    def get_data_size(data: Dict) -> int:
+        return len(data.get("file_data") or "")
+
+    def evict(self):
+        while self.entries and (
+            len(self.entries) > self.max_size
+            or self.size_bytes > self.max_bytes
+        ):
+            self.remove_entry(next(iter(self.entries)))
+            self.evictions += 1
+
+    def add_entry(self, key: Hashable, value: Dict):
+        super().add_entry(key, value)
+        self.size_bytes += self.get_data_size(value)
+
+    def remove_entry(self, key: Hashable):
+        entry: Optional[Tuple[float, Dict]] = self.entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= self.get_data_size(entry[1])
+
+    def set(self, key: Hashable, value: Dict):
+        if self.metadata_only:
+            value = {
+                name: field_value
+                for name, field_value in value.items()
+                if name != "file_data"
+            }
+        super().set(key, value)
+
+    def get_file_path(self, key: Hashable) -> str:
+        key_hash: str = sha1(json_dumps(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"resource-{key_hash}.json")
+
+    def read_disk_entry(self, key: Hashable) -> Optional[Dict]:
+        try:
+            with open(self.get_file_path(key=key), encoding="utf-8") as f:
+                entry = json_load(f)
+        except (OSError, ValueError, JSONDecodeError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("key") != list(key):
+            return None
+        return entry.get("data")
+
+    def write_disk_entry(self, key: Hashable, data: Dict):
+        file_path: str = self.get_file_path(key=key)
+        try:
+            with NamedTemporaryFile(
+                "w",
+                dir=self.cache_dir,
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            ) as f:
+                json_dump(dict(key=list(key), data=data), f, default=str)
+            size: int = os.path.getsize(f.name)
+            previous_size: int = (
+                os.path.getsize(file_path) if os.path.exists(file_path) else 0
+            )
+            os.replace(f.name, file_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache resource: {e}")
+            return
+
+        with self.lock:
+            self.disk_size_bytes += size - previous_size
+            if self.disk_size_bytes > self.max_disk_bytes:
+                self.evict_disk_entries()
+
+    def evict_disk_entries(self):
+        """Deletes the oldest files of the disk cache, until it is back under
+        ``max_disk_bytes``
+        """
+        for entry in sorted(
+            (
+                entry
+                for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith(".json")
+            ),
+            key=lambda entry: entry.stat().st_mtime,
+        ):
+            if self.disk_size_bytes <= self.max_disk_bytes:
+                break
+            try:
+                size: int = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self.disk_size_bytes -= size
+            self.evictions += 1
+
+    def get_resource(
+        self,
+        resource_path: str,
+        resource_type: str,
+        tmp: bool,
+        with_file_data: bool = True,
+    ) -> Optional[KintaroResource]:
+        """Returns the cached resource, ``None`` on a miss.
+
+        In ``metadata_only`` mode, a resource kept without its file data is
+        a miss when ``with_file_data`` is set and the file data is not in
+        ``cache_dir`` either, so it is fetched again.
+        """
+        key: Tuple = (resource_path, resource_type, tmp)
+        with self.lock:
+            found, data = self.lookup(key)
+            if found and (
+                not self.metadata_only
+                or not with_file_data
+                or data.get("file_data") is not None
+            ):
+                self.hits += 1
+                return KintaroResource(initial_data=dict(data))
+
+        disk_data: Optional[Dict] = (
+            self.read_disk_entry(key=key) if self.cache_dir else None
+        )
+        with self.lock:
+            if disk_data is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.disk_hits += 1
+            if not found:
+                self.set(key, disk_data)
+            return KintaroResource(initial_data=dict(disk_data))
+
+    def set_resource(
+        self,
+        resource_path: str,
+        resource_type: str,
+        tmp: bool,
+        resource: KintaroResource,
+    ):
+        key: Tuple = (resource_path, resource_type, tmp)
+        data: Dict = dict(vars(resource))
+        self.set(key, data)
+        if self.cache_dir:
+            self.write_disk_entry(key=key, data=data)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit, miss and eviction counters and current size, in
+        entries and bytes of file data in memory and on disk
+        """
+        with self.lock:
+            return dict(
+                super().stats(),
+                disk_hits=self.disk_hits,
+                size_bytes=self.size_bytes,
+                disk_size_bytes=self.disk_size_bytes,
+            )
+
+
+# process wide caches, used by the services unless told otherwise
+default_schema_cache: KintaroSchemaCache = KintaroSchemaCache()
+default_fingerprint_cache: KintaroFingerprintCache = KintaroFingerprintCache()
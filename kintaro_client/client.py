@@ -1,6 +1,9 @@
 import logging
-from typing import Optional
+from threading import Lock
+from typing import Dict, Optional, Tuple
 
+from .batch import KintaroBatch
+from .constants import KINTARO_BATCH_SIZE, KINTARO_SERVICE_BUILD_PARAMS
 from .exceptions import KintaroClientInitError
 from .services import (
     KintaroCollectionService,
@@ -10,13 +13,14 @@ from .services import (
     KintaroSchemaService,
     KintaroWorkspaceService,
 )
-from .utils import create_kintaro_service
+from .utils import create_kintaro_service, get_kintaro_service
 
 
 logger = logging.getLogger(__name__)
 
 
 class KintaroClient:
+    service = None
     repo_id: Optional[str] = None
     workspace_id: Optional[str] = None
     repositories: Optional[KintaroRepositoryService] = None
@@ -40,8 +44,13 @@ class KintaroClient:
             The repository/site's string id
         workspace_id : str
             The project/workspace's string id
+        use_backend_url : bool
+            Use the backend kintaro host instead of the default one
         **kwargs : Dict
-            Arbitrary keyword arguments.
+            Arbitrary keyword arguments. The discovery document options of
+            ``create_kintaro_service`` (``cache_discovery``,
+            ``discovery_cache_dir``, ``discovery_cache_ttl`` and
+            ``discovery_document``) are forwarded to it.
         """
         if any(not attr for attr in [repo_id, workspace_id]):
             raise KintaroClientInitError(
@@ -51,7 +60,16 @@ class KintaroClient:
 
         self.repo_id = repo_id
         self.workspace_id = workspace_id
-        service = create_kintaro_service(use_backend_url=use_backend_url)
+        service = kwargs.pop("service", None) or create_kintaro_service(
+            use_backend_url=use_backend_url,
+            **{
+                param: kwargs[param]
+                for param in KINTARO_SERVICE_BUILD_PARAMS
+                if param in kwargs
+            },
+        )
+
+        self.service = service
 
         for kwarg in kwargs:
             setattr(self, kwarg, kwargs.get(kwarg))
@@ -61,9 +79,18 @@ class KintaroClient:
             ("workspaces", KintaroWorkspaceService),
             ("schemas", KintaroSchemaService),
             ("collections", KintaroCollectionService),
-            ("documents", KintaroDocumentService),
             ("resources", KintaroResourceService),
+            ("documents", KintaroDocumentService),
         ]:
+            extra_kwargs: Dict = {}
+            if cls is KintaroDocumentService:
+                # reuse the client's services instead of creating new ones
+                extra_kwargs = dict(
+                    schema_service=self.schemas,
+                    collection_service=self.collections,
+                    resource_service=self.resources,
+                )
+
             setattr(
                 self,
                 attr,
@@ -73,7 +100,68 @@ class KintaroClient:
                         repo_id=self.repo_id,
                         workspace_id=self.workspace_id,
                         use_backend_url=use_backend_url,
+                        **extra_kwargs,
                         **kwargs,
                     )
                 ),
             )
+
+    def batch(self, batch_size: int = KINTARO_BATCH_SIZE) -> KintaroBatch:
+        """Returns a context that batches the api calls made inside it,
+        through any of the client's services, see ``KintaroBatch``
+
+        >>> with client.batch() as batch:
+        ...     schema = client.schemas.get_schema(schema_id="page")
+        ...     collection = client.collections.get_collection(
+        ...         collection_id="pages"
+        ...     )
+        >>> schema.result(), collection.result()
+        """
+        return KintaroBatch(service=self.service, batch_size=batch_size)
+
+
+class KintaroClientFactory:
+    """Creates ``KintaroClient`` instances that share a single service
+    `Resource`, and with it the discovery document, credentials and http
+    transport, between every repository and workspace.
+
+    The service comes from ``get_kintaro_service``, so factories with the
+    same host, scopes, credentials, discovery document and transport also
+    share it. Clients are cached per (repo_id, workspace_id) pair.
+    """
+
+    def __init__(self, use_backend_url: bool = False, **kwargs):
+        """
+        Parameters
+        ----------
+        use_backend_url : bool
+            Use the backend kintaro host instead of the default one
+        **kwargs : Dict
+            Arbitrary keyword arguments, forwarded to every created client.
+        """
+        self.use_backend_url = use_backend_url
+        self.kwargs = kwargs
+        self.service = kwargs.pop("service", None) or get_kintaro_service(
+            use_backend_url=use_backend_url,
+            **{
+                param: kwargs[param]
+                for param in KINTARO_SERVICE_BUILD_PARAMS
+                if param in kwargs
+            },
+        )
+        self.clients: Dict[Tuple[str, str], KintaroClient] = {}
+        self.lock: Lock = Lock()
+
+    def get_client(self, repo_id: str, workspace_id: str) -> KintaroClient:
+        """Returns the client for the requested repository and workspace"""
+        key: Tuple[str, str] = (repo_id, workspace_id)
+        with self.lock:
+            if key not in self.clients:
+                self.clients[key] = KintaroClient(
+                    repo_id=repo_id,
+                    workspace_id=workspace_id,
+                    use_backend_url=self.use_backend_url,
+                    service=self.service,
+                    **self.kwargs,
+                )
+            return self.clients[key]
@@ -1,4 +1,5 @@
-from typing import List
+import os
+from typing import List, Optional
 
 
 class KintaroFieldType:
@@ -31,6 +32,21 @@ class KintaroResourceType:
     KNOWN = [RASTER_IMAGE, BLOB_FILE]
 
 
+class KintaroReturnDocument:
+    NONE = "none"
+    SUMMARY = "summary"
+    FULL = "full"
+
+    KNOWN = [NONE, SUMMARY, FULL]
+
+
+class KintaroTransport:
+    HTTPLIB2 = "httplib2"
+    REQUESTS = "requests"
+
+    KNOWN = [HTTPLIB2, REQUESTS]
+
+
 KINTARO_URI: str = "kintaro-content-server.appspot.com"
 KINTARO_BACKEND_URI: str = f"backend-dot-{KINTARO_URI}"
 KINTARO_DISCOVERY_SERVICE_URL: str = (
@@ -41,3 +57,57 @@ GOOGLE_AUTH_SCOPES: List[str] = [
     "https://www.googleapis.com/auth/kintaro",
     "https://www.googleapis.com/auth/userinfo.email",
 ]
+
+KINTARO_DISCOVERY_CACHE_VERSION: int = 1
+KINTARO_DISCOVERY_CACHE_TTL: int = 24 * 60 * 60  # seconds
+KINTARO_DISCOVERY_CACHE_DIR: str = os.environ.get(
+    "KINTARO_DISCOVERY_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "kintaro_client"),
+)
+KINTARO_DISCOVERY_DOCUMENT: Optional[str] = os.environ.get(
+    "KINTARO_DISCOVERY_DOCUMENT"
+)
+
+KINTARO_SCHEMA_CACHE_SIZE: int = 256
+KINTARO_SCHEMA_CACHE_TTL: int = 5 * 60  # seconds
+KINTARO_FINGERPRINT_CACHE_SIZE: int = 1024  # documents
+KINTARO_RESOURCE_CACHE_SIZE: int = 100000  # uploaded files
+KINTARO_RESOURCE_CACHE_PATH: str = os.environ.get(
+    "KINTARO_RESOURCE_CACHE_PATH",
+    os.path.join(KINTARO_DISCOVERY_CACHE_DIR, "resources.sqlite"),
+)
+KINTARO_RESOURCE_READ_CACHE_SIZE: int = 1024  # resources in memory
+KINTARO_RESOURCE_READ_CACHE_BYTES: int = 64 * 1024 * 1024  # of file data
+KINTARO_RESOURCE_READ_CACHE_DISK_BYTES: int = 1024 * 1024 * 1024  # on disk
+
+KINTARO_BATCH_SIZE: int = 100  # requests per http batch
+KINTARO_MAX_WORKERS: int = 8  # concurrent calls of multi document actions
+KINTARO_MAX_UPLOAD_WORKERS: int = 8  # concurrent resource uploads
+KINTARO_MAX_REFERENCE_WORKERS: int = 8  # concurrent referenced writes
+KINTARO_HTTP_POOL_SIZE: int = 10  # connections of the requests transport
+KINTARO_MAX_CONCURRENCY: int = 50  # requests in flight of the async client
+KINTARO_PAGE_SIZE: int = 100  # documents per page of paginated reads
+KINTARO_FIELD_HEADERS_SIZE: int = 100  # fields read per request
+KINTARO_REPEATED_FIELD_CHUNK_SIZE: int = 20  # entries read per request
+KINTARO_UPDATE_CHUNK_SIZE: int = 50  # documents per multiDocumentUpdate
+KINTARO_IMPORT_BATCH_SIZE: int = 100  # documents per import checkpoint
+KINTARO_RESOURCE_MAX_SIZE: int = 256 * 1024 * 1024  # bytes per resource file
+KINTARO_RESOURCE_SPOOL_SIZE: int = 8 * 1024 * 1024  # bytes kept in memory
+KINTARO_RESOURCE_CHUNK_SIZE: int = 3 * 64 * 1024  # bytes read at a time
+KINTARO_IMAGE_QUALITY: int = 85  # quality of optimized JPEG images
+KINTARO_OUT_OF_RANGE_STATUS: int = 400  # read past a repeated field
+KINTARO_OUT_OF_RANGE_MESSAGE: str = "out of range"  # in the error of it
+
+# keyword arguments of services/client that are forwarded to
+#  `create_kintaro_service`
+KINTARO_SERVICE_BUILD_PARAMS: List[str] = [
+    "use_backend_url",
+    "cache_discovery",
+    "discovery_cache_dir",
+    "discovery_cache_ttl",
+    "discovery_document",
+    "scopes",
+    "credentials",
+    "transport",
+    "http_pool_size",
+]
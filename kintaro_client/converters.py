@@ -0,0 +1,152 @@
+from hashlib import md5
+from threading import Lock
+from typing import Any, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+from kintaro_client.constants import KintaroFieldType
+from kintaro_client.models import KintaroSchema, KintaroSchemaField
+
+
+class KintaroFieldConverter:
+    """Conversion details of a schema field, resolved once when its schema is
+    compiled: how its values are written and, for nested fields, the
+    compiled nested schema.
+    """
+
+    BASIC = "basic"
+    FILE = "file"
+    NESTED = "nested"
+    REFERENCE = "reference"
+
+    def __init__(self, schema_field: KintaroSchemaField):
+        self.schema_field = schema_field
+        self.name: str = schema_field.name
+        self.repeated: bool = bool(schema_field.repeated)
+
+        self.kind: str = self.BASIC
+        if schema_field.type in KintaroFieldType.FILE_FIELDS:
+            self.kind = self.FILE
+        elif schema_field.type == KintaroFieldType.NESTED:
+            self.kind = self.NESTED
+        elif schema_field.type == KintaroFieldType.REFERENCE:
+            self.kind = self.REFERENCE
+
+        self.value_type: str = KintaroFieldType.STRING
+        if schema_field.type == KintaroFieldType.NUMBER:
+            self.value_type = "INT"
+        elif schema_field.type == KintaroFieldType.BOOL:
+            self.value_type = "BOOL"
+
+        self.nested: Optional[KintaroSchemaConverter] = (
+            KintaroSchemaConverter(
+                schema_fields=schema_field.schema_fields or []
+            )
+            if self.kind == self.NESTED
+            else None
+        )
+
+    def __repr__(self) -> str:
+        return f"KintaroFieldConverter<{self.name}:{self.kind}>"
+
+    def encode_values(
+        self,
+        field_value: List,
+        root_md5_info: Optional[Dict] = None,
+        field_name_structure: Optional[Dict] = None,
+        field_path: Optional[str] = None,
+    ) -> List[Dict]:
+        """Returns the ``field_values`` of a basic field.
+
+        When both ``root_md5_info`` and ``field_name_structure`` are given,
+        see ``get_structured_content_values``, translated values get the md5
+        of their root value, found by the flattened path of the value. That
+        path is built from ``field_path``, the path of the field in the
+        document, in which case ``field_name_structure`` is not needed.
+        Without it, values are matched to a path by their text, which picks
+        the first field when several share the same text.
+        """
+        is_update: bool = isinstance(root_md5_info, dict) and (
+            field_path is not None or isinstance(field_name_structure, dict)
+        )
+
+        md5_by_value: Optional[Dict] = None
+        if is_update and field_path is None:
+            md5_by_value = {}
+            for key, val in field_name_structure.items():
+                md5_by_value.setdefault(
+                    str(val) if val is not None else None,
+                    root_md5_info.get(key),
+                )
+
+        prepared_field_value: List[Dict] = []
+        for index, entry in enumerate(field_value):
+            entry = str(entry) if entry is not None else None
+            encoded: Dict[str, Any] = dict(value=entry, type=self.value_type)
+
+            root_md5: Optional[str] = None
+            if md5_by_value is not None:
+                root_md5 = md5_by_value.get(entry)
+            elif is_update and entry is not None:
+                root_md5 = root_md5_info.get(
+                    f"{field_path}.{index}" if self.repeated else field_path
+                )
+
+            if root_md5 is not None:
+                encoded["root_md5"] = root_md5
+            prepared_field_value.append(encoded)
+
+        return prepared_field_value
+
+
+class KintaroSchemaConverter:
+    """A schema compiled for the conversion of document content to the format
+    accepted by kintaro, with a ``KintaroFieldConverter`` per field name.
+    See ``compile_schema``.
+    """
+
+    def __init__(self, schema_fields: List[KintaroSchemaField]):
+        self.fields: Dict[str, KintaroFieldConverter] = {
+            field.name: KintaroFieldConverter(schema_field=field)
+            for field in schema_fields
+        }
+
+    def __repr__(self) -> str:
+        return f"KintaroSchemaConverter<{', '.join(self.fields)}>"
+
+
+class KintaroRootFingerprint:
+    """The translatable values of a document's root content, by flattened
+    path, see ``get_structured_content_values``, and the md5 of each one,
+    which the translations of the value refer to.
+    """
+
+    def __init__(self, values: Dict[str, Any]):
+        self.values = values
+        self.md5s: Dict[str, str] = {
+            path: md5(str(value).encode("utf-8")).hexdigest()
+            for path, value in values.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"KintaroRootFingerprint<{len(self.values)} values>"
+
+
+_compiled_schemas: WeakKeyDictionary = WeakKeyDictionary()
+_compiled_schemas_lock: Lock = Lock()
+
+
+def compile_schema(schema: KintaroSchema) -> KintaroSchemaConverter:
+    """Returns the converter of a schema, compiled on its first use and kept
+    for as long as the schema object exists, e.g. while it is in the schema
+    cache
+    """
+    with _compiled_schemas_lock:
+        converter: Optional[KintaroSchemaConverter] = _compiled_schemas.get(
+            schema
+        )
+        if converter is None:
+            converter = KintaroSchemaConverter(
+                schema_fields=schema.schema_fields or []
+            )
+            _compiled_schemas[schema] = converter
+        return converter
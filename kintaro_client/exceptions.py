@@ -20,3 +20,15 @@ class KintaroWrongContentFormatError(Exception):
 
 class NoResourcePathFoundError(Exception):
     pass
+
+
+class KintaroRequestError(Exception):
+    pass
+
+
+class KintaroContentValidationError(Exception):
+    pass
+
+
+class KintaroResourceTooLargeError(Exception):
+    pass
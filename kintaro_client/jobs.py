@@ -0,0 +1,366 @@
+import json
+import logging
+import sqlite3
+from itertools import islice
+from time import monotonic
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from kintaro_client.constants import (
+    KINTARO_IMPORT_BATCH_SIZE,
+    KintaroReturnDocument,
+)
+from kintaro_client.services.document import KintaroDocumentService
+
+
+logger = logging.getLogger(__name__)
+
+
+def iter_ndjson(source: Union[str, IO]) -> Iterator[Tuple[int, str]]:
+    """Yields the non empty lines of a NDJSON file, or file object, with
+    their line number (from 0), without parsing them
+    """
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as f:
+            yield from iter_ndjson(source=f)
+        return
+
+    for position, line in enumerate(source):
+        if line.strip():
+            yield position, line
+
+
+class KintaroImportStats:
+    """Progress of a ``KintaroImportJob`` run"""
+
+    def __init__(self):
+        self.written: int = 0
+        self.failed: int = 0
+        self.skipped: int = 0
+        self.started_at: float = monotonic()
+        self.elapsed: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"KintaroImportStats<written={self.written} "
+            f"failed={self.failed} skipped={self.skipped} "
+            f"{self.documents_per_second:.1f}/s>"
+        )
+
+    @property
+    def processed(self) -> int:
+        return self.written + self.failed
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict:
+        return dict(
+            written=self.written,
+            failed=self.failed,
+            skipped=self.skipped,
+            elapsed=self.elapsed,
+            documents_per_second=self.documents_per_second,
+        )
+
+
+class KintaroImportCheckpoint:
+    """SQLite file with the outcome of each imported item, by its position in
+    the input: the id of the written document or the error
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS items ("
+                "position INTEGER PRIMARY KEY, "
+                "document_id TEXT, "
+                "error TEXT)"
+            )
+
+    def __repr__(self) -> str:
+        return f"KintaroImportCheckpoint<{self.path}>"
+
+    def close(self):
+        self.connection.close()
+
+    def get_done_positions(self, include_failed: bool = False) -> Set[int]:
+        query: str = "SELECT position FROM items"
+        if not include_failed:
+            query += " WHERE error IS NULL"
+        return {row[0] for row in self.connection.execute(query)}
+
+    def save(self, outcomes: List[Tuple[int, Optional[str], Optional[str]]]):
+        """Records the ``(position, document_id, error)`` of some items in one
+        transaction
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO items (position, document_id, error) "
+                "VALUES (?, ?, ?)",
+                outcomes,
+            )
+
+    def get_document_ids(self) -> Dict[int, str]:
+        return dict(
+            self.connection.execute(
+                "SELECT position, document_id FROM items "
+                "WHERE error IS NULL ORDER BY position"
+            )
+        )
+
+    def get_errors(self) -> Dict[int, str]:
+        return dict(
+            self.connection.execute(
+                "SELECT position, error FROM items "
+                "WHERE error IS NOT NULL ORDER BY position"
+            )
+        )
+
+    def get_failed_document_ids(self) -> Dict[int, str]:
+        """Ids of the documents of failed items that were written in part,
+        like a created document whose other locales failed
+        """
+        return dict(
+            self.connection.execute(
+                "SELECT position, document_id FROM items "
+                "WHERE error IS NOT NULL AND document_id IS NOT NULL "
+                "ORDER BY position"
+            )
+        )
+
+
+class KintaroImportJob:
+    """Creates or updates documents from a stream of request bodies, like the
+    ones of ``multi_document_action``, recording the outcome of each one in a
+    ``KintaroImportCheckpoint``, so an interrupted import can be run again
+    and continue where it stopped.
+
+    Items are written in batches of ``batch_size``, whose outcomes are saved
+    together once the batch is done. Documents of a batch that was running
+    when the process stopped are written again on the next run.
+
+    >>> with KintaroImportJob(
+    ...     document_service=client.documents,
+    ...     checkpoint_path="pages-import.sqlite",
+    ... ) as job:
+    ...     stats = job.run(source="pages.ndjson")
+    """
+
+    def __init__(
+        self,
+        document_service: KintaroDocumentService,
+        checkpoint_path: str,
+        action: str = "create",
+        batch_size: int = KINTARO_IMPORT_BATCH_SIZE,
+        max_workers: Optional[int] = None,
+        retry_failed: bool = True,
+        progress_callback: Optional[
+            Callable[[KintaroImportStats], Any]
+        ] = None,
+    ):
+        """
+        Parameters
+        ----------
+        document_service : KintaroDocumentService
+            The service the documents are written with.
+        checkpoint_path : str
+            Path of the SQLite checkpoint file, created if it does not exist.
+        action : str
+            "create" or "update", see ``multi_document_action``.
+        batch_size : int
+            Number of items written, and saved to the checkpoint, together.
+        max_workers : Optional[int]
+            Number of concurrent calls per batch, see
+             ``multi_document_action``.
+        retry_failed : bool
+            Whether the items that failed in a previous run are written
+             again.
+        progress_callback : Optional[Callable[[KintaroImportStats], Any]]
+            Called with the stats after each batch.
+        """
+        if action not in ["create", "update"]:
+            raise ValueError(f'Invalid action provided "{action}"')
+
+        self.document_service = document_service
+        self.checkpoint = KintaroImportCheckpoint(path=checkpoint_path)
+        self.action = action
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.retry_failed = retry_failed
+        self.progress_callback = progress_callback
+        self.stats: KintaroImportStats = KintaroImportStats()
+        # documents created by a failed item of a previous run, updated
+        #  instead of created again when the item is retried
+        self.created_document_ids: Dict[int, str] = {}
+
+    def __repr__(self) -> str:
+        return f"KintaroImportJob<{self.action}:{self.checkpoint.path}>"
+
+    def __enter__(self) -> "KintaroImportJob":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.checkpoint.close()
+
+    def run(
+        self, source: Union[str, IO, Iterable[Dict]]
+    ) -> KintaroImportStats:
+        """Writes the items of ``source`` that are not in the checkpoint yet.
+
+        Parameters
+        ----------
+        source : Union[str, IO, Iterable[Dict]]
+            A NDJSON file path or file object, with one request body per
+             line, or an iterable of request bodies. Items are identified by
+             their position, so it must give the same items, in the same
+             order, on every run.
+
+        Returns
+        -------
+        KintaroImportStats
+            The stats of this run.
+        """
+        self.stats = KintaroImportStats()
+        self.created_document_ids = (
+            self.checkpoint.get_failed_document_ids()
+            if self.action == "create" and self.retry_failed
+            else {}
+        )
+        done: Set[int] = self.checkpoint.get_done_positions(
+            include_failed=not self.retry_failed
+        )
+        items: Iterator[Tuple[int, Any]] = (
+            iter_ndjson(source=source)
+            if isinstance(source, str) or hasattr(source, "readline")
+            else enumerate(source)
+        )
+
+        while True:
+            batch: List[Tuple[int, Any]] = list(
+                islice(self.skip_done(items=items, done=done), self.batch_size)
+            )
+            if not batch:
+                break
+
+            self.checkpoint.save(outcomes=self.write_batch(batch=batch))
+            self.stats.elapsed = monotonic() - self.stats.started_at
+            logger.info(f"{self}: {self.stats}")
+            if self.progress_callback is not None:
+                self.progress_callback(self.stats)
+
+        self.stats.elapsed = monotonic() - self.stats.started_at
+        return self.stats
+
+    def skip_done(
+        self, items: Iterator[Tuple[int, Any]], done: Set[int]
+    ) -> Iterator[Tuple[int, Any]]:
+        for position, item in items:
+            if position in done:
+                self.stats.skipped += 1
+                continue
+            yield position, item
+
+    def write_batch(
+        self, batch: List[Tuple[int, Any]]
+    ) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """Writes the items of a batch, returning the outcome of each one.
+        An item that fails does not fail the others, which are written only
+        once. Items whose document was created by a previous run are
+        updated instead.
+        """
+        outcomes: List[Tuple[int, Optional[str], Optional[str]]] = []
+        request_bodies: Dict[str, List[Tuple[int, Dict]]] = dict(
+            create=[], update=[]
+        )
+        for position, item in batch:
+            try:
+                request: Dict = (
+                    json.loads(item) if isinstance(item, str) else item
+                )
+            except ValueError as e:
+                outcomes.append((position, None, f"Invalid JSON: {e}"))
+                continue
+            if position in self.created_document_ids:
+                request_bodies["update"].append(
+                    (
+                        position,
+                        dict(
+                            request,
+                            document_id=self.created_document_ids[position],
+                        ),
+                    )
+                )
+            else:
+                request_bodies[self.action].append((position, request))
+
+        for action, action_request_bodies in request_bodies.items():
+            if not action_request_bodies:
+                continue
+            results: List = self.document_service.multi_document_action(
+                request_bodies=[
+                    request for _, request in action_request_bodies
+                ],
+                action=action,
+                max_workers=self.max_workers,
+                return_document=KintaroReturnDocument.SUMMARY,
+                return_exceptions=True,
+            )
+            for (position, request), result in zip(
+                action_request_bodies, results
+            ):
+                document_id, error = self.get_outcome(result=result)
+                outcomes.append(
+                    (
+                        position,
+                        document_id or request.get("document_id"),
+                        error,
+                    )
+                )
+
+        for _, _, error in outcomes:
+            if error is None:
+                self.stats.written += 1
+            else:
+                self.stats.failed += 1
+        return outcomes
+
+    @staticmethod
+    def get_outcome(result: Any) -> Tuple[Optional[str], Optional[str]]:
+        """Returns the document id and the error of a written item. A failed
+        item can have a document id too, when its document was created.
+        """
+        if isinstance(result, Exception):
+            return None, f"{type(result).__name__}: {result}"
+        if isinstance(result, dict):
+            if "errors" in result:
+                return result.get("document_id"), json.dumps(
+                    result, default=str
+                )
+            return result.get("document_id"), None
+        return getattr(result, "document_id", None), None
+
+    def get_document_ids(self) -> Dict[int, str]:
+        """Ids of the written documents, by position of their item"""
+        return self.checkpoint.get_document_ids()
+
+    def get_errors(self) -> Dict[int, str]:
+        """Errors of the items that failed, by position"""
+        return self.checkpoint.get_errors()
@@ -18,7 +18,7 @@ class KintaroSchemaField(BaseKintaroEntity):
     locale_varied: bool = False
     validation_rule: Optional[str] = None
     validation_rule_message: Optional[str] = None
-    schema_fields: List[Dict] = []
+    schema_fields: List["KintaroSchemaField"] = []
 
     def __init__(self, initial_data: Optional[Dict] = None):
         if not initial_data:
@@ -38,14 +38,10 @@ class KintaroSchemaField(BaseKintaroEntity):
             ]:
                 continue
             elif key == "schema_fields":
-                setattr(
-                    self,
-                    "schema_fields",
-                    [
-                        KintaroSchemaField(initial_data=field)
-                        for field in initial_data.get("schema_fields", [])
-                    ],
-                )
+                value = [
+                    KintaroSchemaField(initial_data=field)
+                    for field in initial_data.get("schema_fields", [])
+                ]
             elif key == "default":
                 field_values: List = initial_data.get("default", {}).get(
                     "field_values", []
@@ -0,0 +1,150 @@
+from json import dumps
+from typing import Any, Dict, List, Optional, Tuple
+
+from kintaro_client.converters import KintaroSchemaConverter
+
+
+def has_new_references(content: Any) -> bool:
+    """Whether the content has references with content, whatever the
+    schema, which tells if it is worth reading schemas to plan their writes
+    """
+    if isinstance(content, list):
+        return any(has_new_references(value) for value in content)
+    if not isinstance(content, dict):
+        return False
+    if "collection_id" in content and "content" in content:
+        return True
+    return any(has_new_references(value) for value in content.values())
+
+
+class KintaroReferenceWrite:
+    """A referenced document to create, or update when it has a
+    ``document_id``, before the documents that refer to it.
+
+    ``entries`` are the references to it in the content of those documents,
+    which get its ``document_id`` once it is written.
+    """
+
+    def __init__(
+        self,
+        collection_id: str,
+        locale: str,
+        content: Dict,
+        level: int,
+        repo_id: str,
+        workspace_id: str,
+        document_id: Optional[str] = None,
+    ):
+        self.collection_id = collection_id
+        self.locale = locale
+        self.content = content
+        self.level = level
+        self.repo_id = repo_id
+        self.workspace_id = workspace_id
+        self.document_id = document_id
+        self.entries: List[Dict] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"KintaroReferenceWrite<{self.collection_id}:"
+            f"{self.document_id or 'new'}:{self.locale}>"
+        )
+
+    @property
+    def action(self) -> str:
+        return "update" if self.document_id else "create"
+
+    def get_request_body(self) -> Dict:
+        request_body: Dict = dict(
+            repo_id=self.repo_id,
+            workspace_id=self.workspace_id,
+            collection_id=self.collection_id,
+            content={self.locale: self.content},
+        )
+        if self.document_id:
+            request_body["document_id"] = self.document_id
+        return request_body
+
+    def add_entry(self) -> Dict:
+        """Returns a new reference to the document, to use in place of the
+        one found in the content
+        """
+        entry: Dict = dict(collection_id=self.collection_id)
+        if self.document_id:
+            entry["document_id"] = self.document_id
+        self.entries.append(entry)
+        return entry
+
+    def set_document_id(self, document_id: str):
+        self.document_id = document_id
+        for entry in self.entries:
+            entry["document_id"] = document_id
+
+
+class KintaroReferencePlan:
+    """The referenced documents found in some content, with the level of
+    each one in the dependency graph: documents at level 0 only refer to
+    existing documents, the ones at level ``n`` refer to documents of lower
+    levels. See ``KintaroDocumentService.plan_reference_writes``.
+
+    The same document, with the same content, referenced more than once is
+    written once.
+    """
+
+    def __init__(self):
+        self.writes: Dict[Tuple, KintaroReferenceWrite] = {}
+        # compiled schemas by repo and collection, read once per plan
+        self.converters: Dict[Tuple, KintaroSchemaConverter] = {}
+
+    def __repr__(self) -> str:
+        return f"KintaroReferencePlan<{len(self.writes)} writes>"
+
+    def __len__(self) -> int:
+        return len(self.writes)
+
+    def add_write(
+        self,
+        collection_id: str,
+        locale: str,
+        content: Dict,
+        source_content: Dict,
+        level: int,
+        repo_id: str,
+        workspace_id: str,
+        document_id: Optional[str] = None,
+    ) -> KintaroReferenceWrite:
+        """Returns the write of the document, added to the plan unless an
+        identical one already is. Writes are identified by
+        ``source_content``, the content as found in the reference, since in
+        ``content`` the references to new documents are not resolved yet.
+        """
+        key: Tuple = (
+            repo_id,
+            workspace_id,
+            collection_id,
+            document_id,
+            locale,
+            dumps(source_content, sort_keys=True, default=str),
+        )
+        write: Optional[KintaroReferenceWrite] = self.writes.get(key)
+        if write is None:
+            write = KintaroReferenceWrite(
+                collection_id=collection_id,
+                locale=locale,
+                content=content,
+                level=level,
+                repo_id=repo_id,
+                workspace_id=workspace_id,
+                document_id=document_id,
+            )
+            self.writes[key] = write
+        return write
+
+    def get_waves(self) -> List[List[KintaroReferenceWrite]]:
+        """Returns the writes grouped by level, lowest first. The writes of
+        a wave only depend on the ones of the previous waves.
+        """
+        waves: Dict[int, List[KintaroReferenceWrite]] = {}
+        for write in self.writes.values():
+            waves.setdefault(write.level, []).append(write)
+        return [waves[level] for level in sorted(waves)]
@@ -1,5 +1,11 @@
 from typing import Optional
 
+from kintaro_client.batch import KintaroBatch
+from kintaro_client.cache import KintaroSchemaCache, default_schema_cache
+from kintaro_client.constants import (
+    KINTARO_BATCH_SIZE,
+    KINTARO_SERVICE_BUILD_PARAMS,
+)
 from kintaro_client.exceptions import KintaroServiceInitError
 from kintaro_client.utils import create_kintaro_service
 
@@ -8,6 +14,8 @@ class KintaroBaseService:
     repo_id: Optional[str] = None
     workspace_id: Optional[str] = None
     service = None
+    root_service = None
+    schema_cache: Optional[KintaroSchemaCache] = None
 
     def __init__(self, **kwargs):
         for param in ["repo_id", "workspace_id"]:
@@ -16,8 +24,31 @@ class KintaroBaseService:
 
         if "service" not in kwargs or not kwargs.get("service"):
             kwargs["service"] = create_kintaro_service(
-                use_backend_url=kwargs.get("use_backend_url", False),
+                **{
+                    param: kwargs[param]
+                    for param in KINTARO_SERVICE_BUILD_PARAMS
+                    if param in kwargs
+                }
             )
 
         for key in kwargs:
             setattr(self, key, kwargs[key])
+
+        # services replace `service` with their own namespace, the root one
+        #  is kept to create http batches
+        self.root_service = self.service
+
+        if self.schema_cache is None and kwargs.get("use_schema_cache", True):
+            self.schema_cache = default_schema_cache
+
+    def get_base_url(self) -> Optional[str]:
+        """The url of the kintaro host the service sends its requests to,
+        part of the keys of the ``schema_cache``
+        """
+        return getattr(self.root_service, "_baseUrl", None)
+
+    def batch(self, batch_size: int = KINTARO_BATCH_SIZE) -> KintaroBatch:
+        """Returns a context that batches the api calls made inside it, from
+        this or any other service, see ``KintaroBatch``
+        """
+        return KintaroBatch(service=self.root_service, batch_size=batch_size)
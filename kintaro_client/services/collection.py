@@ -123,19 +123,41 @@ class KintaroCollectionService(KintaroBaseService):
         if len(request_body.keys()) == 2:
             return
 
-        return KintaroCollection(
+        collection: KintaroCollection = KintaroCollection(
             initial_data=(
                 self.service.updateCollection(body=request_body).execute()
             )
         )
+        self.invalidate_cached_collection(
+            collection_id=current_collection_id,
+            repo_id=repo_id or self.repo_id,
+        )
+        return collection
 
     @api_request
     def delete_collection(
         self, collection_id: str, repo_id: Optional[str]
     ) -> Optional[ServiceError]:
-        return self.service.deleteCollection(
+        result = self.service.deleteCollection(
             body=dict(
                 repo_id=repo_id or self.repo_id,
                 collection_id=collection_id,
             )
+        ).execute()
+        self.invalidate_cached_collection(
+            collection_id=collection_id, repo_id=repo_id or self.repo_id
         )
+        return result
+
+    def invalidate_cached_collection(
+        self, collection_id: str, repo_id: Optional[str] = None
+    ):
+        """Removes the collection's schema from the schema cache shared with
+        the document service
+        """
+        if self.schema_cache is not None:
+            self.schema_cache.invalidate_collection(
+                repo_id=repo_id or self.repo_id,
+                collection_id=collection_id,
+                base_url=self.get_base_url(),
+            )
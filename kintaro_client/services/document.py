@@ -1,24 +1,63 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from hashlib import md5
-from multiprocessing import cpu_count
-from typing import Any, Dict, List, Optional, Union
+from math import ceil
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from dry_pyutils import convert_dict_keys_case, convert_string_case
 from googleapiclient.errors import HttpError as GoogleApiHttpError
-from joblib import Parallel, delayed
 
-from kintaro_client.constants import KintaroFieldType
+from kintaro_client.batch import (
+    KintaroBatchResult,
+    get_current_batch,
+    get_replaying_result,
+    run_once,
+)
+from kintaro_client.cache import (
+    KintaroFingerprintCache,
+    KintaroSchemaCache,
+    default_fingerprint_cache,
+)
+from kintaro_client.constants import (
+    KINTARO_FIELD_HEADERS_SIZE,
+    KINTARO_MAX_REFERENCE_WORKERS,
+    KINTARO_MAX_UPLOAD_WORKERS,
+    KINTARO_MAX_WORKERS,
+    KINTARO_OUT_OF_RANGE_MESSAGE,
+    KINTARO_OUT_OF_RANGE_STATUS,
+    KINTARO_PAGE_SIZE,
+    KINTARO_REPEATED_FIELD_CHUNK_SIZE,
+    KINTARO_UPDATE_CHUNK_SIZE,
+    KintaroFieldType,
+    KintaroReturnDocument,
+)
+from kintaro_client.converters import (
+    KintaroFieldConverter,
+    KintaroRootFingerprint,
+    KintaroSchemaConverter,
+    compile_schema,
+)
 from kintaro_client.exceptions import (
+    KintaroContentValidationError,
     KintaroCreateDocumentError,
+    KintaroRequestError,
     KintaroWrongContentFormatError,
     NoResourcePathFoundError,
 )
 from kintaro_client.models import (
+    KintaroCollection,
     KintaroDocument,
     KintaroDocumentSummary,
     KintaroDocumentVersion,
+    KintaroResource,
     KintaroSchema,
     KintaroSchemaField,
 )
+from kintaro_client.references import (
+    KintaroReferencePlan,
+    KintaroReferenceWrite,
+    has_new_references,
+)
 from kintaro_client.services.base import KintaroBaseService
 from kintaro_client.services.collection import KintaroCollectionService
 from kintaro_client.services.resource import KintaroResourceService
@@ -28,9 +67,7 @@ from kintaro_client.utils import (
     api_request,
     prepare_google_api_error_response,
 )
-
-
-NUM_CORES = cpu_count()
+from kintaro_client.validation import KintaroSchemaValidator, compile_validator
 
 
 class KintaroDocumentService(KintaroBaseService):
@@ -41,13 +78,38 @@ class KintaroDocumentService(KintaroBaseService):
     schema_service: Optional[KintaroSchemaService] = None
     collection_service: Optional[KintaroCollectionService] = None
     resource_service: Optional[KintaroResourceService] = None
+    executor: Optional[Executor] = None
+    max_workers: int = KINTARO_MAX_WORKERS
+    fingerprint_cache: Optional[KintaroFingerprintCache] = None
+    # pool shared by the resource uploads of every document written
+    upload_executor: Optional[Executor] = None
+    max_upload_workers: int = KINTARO_MAX_UPLOAD_WORKERS
+    # pool of the documents written for the references of other documents,
+    #  apart from ``executor``, which may be running the writes referring
+    #  to them
+    reference_executor: Optional[Executor] = None
+    max_reference_workers: int = KINTARO_MAX_REFERENCE_WORKERS
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.collection_service = KintaroCollectionService(**kwargs)
-        self.resource_service = KintaroResourceService(**kwargs)
-        self.schema_service = KintaroSchemaService(**kwargs)
+        # the root service is shared with the auxiliary services, which can
+        #  also be given directly to avoid creating them again
+        kwargs["service"] = self.service
+        for attr, cls in [
+            ("collection_service", KintaroCollectionService),
+            ("resource_service", KintaroResourceService),
+            ("schema_service", KintaroSchemaService),
+        ]:
+            if not getattr(self, attr, None):
+                setattr(self, attr, cls(**kwargs))
         self.service = self.service.documents()
+        self.upload_executor_lock: Lock = Lock()
+        self.reference_executor_lock: Lock = Lock()
+
+        if self.fingerprint_cache is None and kwargs.get(
+            "use_fingerprint_cache", True
+        ):
+            self.fingerprint_cache = default_fingerprint_cache
 
     @api_request
     def get_collection_documents(
@@ -117,6 +179,221 @@ class KintaroDocumentService(KintaroBaseService):
 
         return [KintaroDocument(initial_data=doc) for doc in documents]
 
+    def iter_collection_documents(
+        self,
+        collection_id: str,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        locale: str = "root",
+        page_size: int = KINTARO_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[KintaroDocument]:
+        """Yields the documents of a collection, in the requested locale,
+        fetching them ``page_size`` at a time instead of all at once.
+
+        Parameters
+        ----------
+        collection_id : str
+            The collection id string.
+        repo_id : Optional[str]
+            The repo id string. If not provided, the **repo_id** attribute from
+             the class will be used.
+        workspace_id : Optional[str]
+            The workspace id string. If not provided, the **workspace_id**
+             attribute from the class will be used.
+        locale : str
+            The kintaro locale string that specifies the language of the
+             fetched documents.
+        page_size : int
+            Number of documents requested at a time.
+        prefetch : bool
+            Fetch the next page, in a background thread, while the current
+             one is being consumed.
+
+        Raises
+        ------
+        KintaroRequestError
+            If fetching a page fails, with the error dict as argument
+        """
+        if page_size < 1:
+            raise ValueError("page_size should be greater than 0")
+
+        def fetch_page(offset: int) -> List[KintaroDocument]:
+            page = self.get_collection_documents(
+                collection_id=collection_id,
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                locale=locale,
+                take=page_size,
+                skip=offset,
+            )
+            if not isinstance(page, list):
+                raise KintaroRequestError(page)
+            return page
+
+        executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1) if prefetch else None
+        )
+        try:
+            offset: int = 0
+            page: List[KintaroDocument] = fetch_page(offset)
+            while page:
+                next_page: Optional[Future] = None
+                if executor is not None and len(page) == page_size:
+                    next_page = executor.submit(fetch_page, offset + page_size)
+
+                yield from page
+
+                if len(page) < page_size:
+                    break
+
+                offset += page_size
+                page = (
+                    next_page.result()
+                    if next_page is not None
+                    else fetch_page(offset)
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def get_all_collection_documents(
+        self,
+        collection_id: str,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        locale: str = "root",
+        page_size: int = KINTARO_PAGE_SIZE,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> Union[ServiceError, List[KintaroDocument]]:
+        """Gets every document of a collection, in the requested locale, by
+        fetching pages of ``page_size`` documents concurrently. See
+        ``fetch_pages_concurrently``.
+        """
+        return self.fetch_pages_concurrently(
+            fetch_page=lambda offset: self.get_collection_documents(
+                collection_id=collection_id,
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                locale=locale,
+                take=page_size,
+                skip=offset,
+            ),
+            collection_id=collection_id,
+            repo_id=repo_id or self.repo_id,
+            page_size=page_size,
+            executor=executor,
+            max_workers=max_workers,
+        )
+
+    def get_all_document_summaries(
+        self,
+        collection_id: str,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        page_size: int = KINTARO_PAGE_SIZE,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> Union[ServiceError, List[KintaroDocumentSummary]]:
+        """Gets every document summary of a collection by fetching pages of
+        ``page_size`` summaries concurrently. See
+        ``fetch_pages_concurrently``.
+        """
+        return self.fetch_pages_concurrently(
+            fetch_page=lambda offset: self.get_document_summaries(
+                collection_id=collection_id,
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                take=page_size,
+                skip=offset,
+            ),
+            collection_id=collection_id,
+            repo_id=repo_id or self.repo_id,
+            page_size=page_size,
+            executor=executor,
+            max_workers=max_workers,
+        )
+
+    def fetch_pages_concurrently(
+        self,
+        fetch_page: Callable[[int], Union[ServiceError, List]],
+        collection_id: str,
+        repo_id: Optional[str] = None,
+        page_size: int = KINTARO_PAGE_SIZE,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> Union[ServiceError, List]:
+        """Reads a whole collection with concurrent paginated requests.
+
+        The collection's ``total_document_count`` gives the number of pages,
+        which are fetched at the same time, see ``map_concurrently``, and
+        merged in order. Should the collection have grown in the meantime,
+        the remaining pages are fetched in further rounds, until a page is
+        not full.
+
+        Parameters
+        ----------
+        fetch_page : Callable[[int], Union[ServiceError, List]]
+            Function receiving the offset of a page and returning its
+             entries, or an error dict.
+        collection_id : str
+            The collection id string.
+        repo_id : Optional[str]
+            The repo id string. If not provided, the **repo_id** attribute from
+             the class will be used.
+        page_size : int
+            Number of entries requested per page.
+        executor : Optional[Executor]
+            The executor fetching the pages.
+        max_workers : Optional[int]
+            Maximum number of concurrent requests, when no executor is given.
+
+        Returns
+        -------
+        Union[ServiceError, List]
+            Every entry of the collection, or the error dict of the first
+             failed request
+        """
+        if page_size < 1:
+            raise ValueError("page_size should be greater than 0")
+
+        collection = self.collection_service.get_collection(
+            collection_id=collection_id,
+            repo_id=repo_id or self.repo_id,
+            include_document_count=True,
+        )
+        if not isinstance(collection, KintaroCollection):
+            return collection
+
+        number_of_pages: int = max(
+            1, ceil(int(collection.total_document_count or 0) / page_size)
+        )
+
+        entries: List = []
+        offset: int = 0
+        while True:
+            pages: List[Union[ServiceError, List]] = self.map_concurrently(
+                fn=fetch_page,
+                items=[
+                    offset + page_idx * page_size
+                    for page_idx in range(number_of_pages)
+                ],
+                executor=executor,
+                max_workers=max_workers,
+            )
+
+            for page in pages:
+                if not isinstance(page, list):
+                    return page
+                entries.extend(page)
+
+            if len(pages[-1]) < page_size:
+                return entries
+
+            offset += number_of_pages * page_size
+            number_of_pages = max_workers or self.max_workers
+
     @api_request
     def get_document_summaries(
         self,
@@ -232,13 +509,13 @@ class KintaroDocumentService(KintaroBaseService):
         ).execute()
 
         if include_document_versions:
-            versions: List[
-                KintaroDocumentVersion
-            ] = self.get_document_versions(
-                repo_id=repo_id or self.repo_id,
-                workspace_id=workspace_id or self.workspace_id,
-                collection_id=collection_id,
-                document_id=document_id,
+            versions: List[KintaroDocumentVersion] = (
+                self.get_document_versions(
+                    repo_id=repo_id or self.repo_id,
+                    workspace_id=workspace_id or self.workspace_id,
+                    collection_id=collection_id,
+                    document_id=document_id,
+                )
             )
 
             if isinstance(versions, list):
@@ -258,33 +535,21 @@ class KintaroDocumentService(KintaroBaseService):
         workspace_id: Optional[str] = None,
         locale: str = "root",
     ) -> Any:
+        field_header: Dict = dict(
+            repo_id=repo_id or self.repo_id,
+            project_id=workspace_id or self.workspace_id,
+            collection_id=collection_id,
+            document_id=document_id,
+            field_descriptor=field_name,
+            locale=locale,
+        )
+
         error_msg = None
         current_field_value: Any = None
         try:
             current_field_value = next(
-                iter(
-                    (
-                        self.service.getFieldsByDescriptor(
-                            body=dict(
-                                field_headers=[
-                                    dict(
-                                        repo_id=repo_id or self.repo_id,
-                                        project_id=workspace_id
-                                        or self.workspace_id,
-                                        collection_id=collection_id,
-                                        document_id=document_id,
-                                        field_descriptor=field_name,
-                                        locale=locale,
-                                    )
-                                ]
-                            )
-                        )
-                        .execute()
-                        .get("field_values", [])
-                    )
-                ),
-                {},
-            ).get("value")
+                iter(self.fetch_field_values(field_headers=[field_header]))
+            )
         except GoogleApiHttpError as e:
             error = prepare_google_api_error_response(error=e.content)
             error_msg = next(iter(error.get("errors", [])), {}).get("message")
@@ -294,37 +559,290 @@ class KintaroDocumentService(KintaroBaseService):
 
         if error_msg:
             if "is repeated and should be followed by an index" in error_msg:
-                i = 0
-                current_values: List = []
-                while True:
-                    try:
-                        values = iter(
-                            self.service.documents()
-                            .getFieldsByDescriptor(
-                                body=dict(
-                                    field_headers=[
-                                        dict(
-                                            repo_id=self.repo_id,
-                                            project_id=self.workspace_id,
-                                            collection_id=collection_id,
-                                            document_id=document_id,
-                                            field_descriptor=(
-                                                f"{field_name}.{i}"
-                                            ),
-                                            locale=locale,
-                                        )
-                                    ]
-                                )
-                            )
-                            .execute()
-                            .get("field_values", [])
+                return self.fetch_repeated_field_values(
+                    field_header=field_header
+                )
+
+    @api_request
+    def get_documents_fields_values(
+        self,
+        field_headers: List[Dict],
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        chunk_size: int = KINTARO_FIELD_HEADERS_SIZE,
+        repeated_chunk_size: int = KINTARO_REPEATED_FIELD_CHUNK_SIZE,
+    ) -> Union[ServiceError, List[Any]]:
+        """Reads the values of many fields, of one or more documents, in
+        one or more locales, with as few requests as possible.
+
+        [
+            {
+                "collection_id": "pages",
+                "document_id": "document-one",
+                "field_name": "title",
+                "locale": "nl_nl"
+            },
+            {
+                "collection_id": "pages",
+                "document_id": "document-one",
+                "field_name": "links.0.label"
+            }
+        ]
+
+        Fields are read ``chunk_size`` at a time. Repeated fields, which
+        kintaro only returns one entry at a time, are detected with the
+        collections' schemas and read ``repeated_chunk_size`` entries per
+        request, see ``fetch_repeated_field_values``.
+
+        Parameters
+        ----------
+        field_headers : List[Dict]
+            The fields to read. ``field_name`` is a field descriptor, like the
+             one of ``update_document_field``, and ``locale`` defaults to
+             **root**.
+        repo_id : Optional[str]
+            The repo id string. If not provided, the **repo_id** attribute from
+             the class will be used.
+        workspace_id : Optional[str]
+            The workspace id string. If not provided, the **workspace_id**
+             attribute from the class will be used.
+        chunk_size : int
+            Maximum number of fields read per request.
+        repeated_chunk_size : int
+            Number of entries of a repeated field read per request.
+
+        Returns
+        -------
+        Union[ServiceError, List[Any]]
+            The value of each field, in the order of ``field_headers``.
+             ``None`` for empty fields and a list for repeated ones.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be greater than 0")
+
+        headers: List[Dict] = [
+            dict(
+                repo_id=repo_id or self.repo_id,
+                project_id=workspace_id or self.workspace_id,
+                collection_id=header["collection_id"],
+                document_id=header["document_id"],
+                field_descriptor=self.prepare_field_name(
+                    field_name=header["field_name"]
+                ),
+                locale=header.get("locale", "root"),
+            )
+            for header in field_headers
+        ]
+
+        schemas: Dict[str, KintaroSchema] = {}
+        for header in headers:
+            if header["collection_id"] not in schemas:
+                schemas[header["collection_id"]] = self.get_document_schema(
+                    collection_id=header["collection_id"],
+                    repo_id=repo_id or self.repo_id,
+                )
+
+        repeated: List[int] = []
+        single: List[int] = []
+        for position, header in enumerate(headers):
+            if self.is_repeated_field_descriptor(
+                schema_info=schemas[header["collection_id"]].schema_fields,
+                field_descriptor=header["field_descriptor"],
+            ):
+                repeated.append(position)
+            else:
+                single.append(position)
+
+        values: List[Any] = [None] * len(headers)
+        for start in range(0, len(single), chunk_size):
+            positions: List[int] = single[start : start + chunk_size]
+            for position, value in zip(
+                positions,
+                self.fetch_field_values(
+                    field_headers=[headers[pos] for pos in positions]
+                ),
+            ):
+                values[position] = value
+
+        for position in repeated:
+            values[position] = self.fetch_repeated_field_values(
+                field_header=headers[position],
+                chunk_size=repeated_chunk_size,
+            )
+
+        return values
+
+    def fetch_field_values(self, field_headers: List[Dict]) -> List[Any]:
+        """Reads the given fields with a single ``getFieldsByDescriptor``
+        request, returning their values in the same order, ``None`` for
+        missing ones.
+
+        Returned values are matched to the requested fields by document,
+        locale and field descriptor, as kintaro leaves out the empty ones.
+
+        Raises
+        ------
+        googleapiclient.errors.HttpError
+            If the request fails
+        KintaroRequestError
+            If some values can not be matched to the requested fields
+        """
+        field_values: List[Dict] = (
+            self.service.getFieldsByDescriptor(
+                body=dict(field_headers=field_headers)
+            )
+            .execute()
+            .get("field_values", [])
+        )
+        values: List[Any] = [None] * len(field_headers)
+        unmatched: List[int] = list(range(len(field_headers)))
+        for entry in field_values:
+            entry_header: Dict = self.get_field_value_header(entry=entry)
+            position: Optional[int] = None
+            if entry_header:
+                position = next(
+                    (
+                        candidate
+                        for candidate in unmatched
+                        if all(
+                            field_headers[candidate].get(key) == value
+                            for key, value in entry_header.items()
                         )
+                    ),
+                    None,
+                )
+            elif len(field_values) == len(field_headers):
+                # values without a header come in the order of the fields
+                position = unmatched[0]
+            if position is None:
+                raise KintaroRequestError(
+                    f"Could not match the field value {entry} to any of the "
+                    "requested fields"
+                )
 
-                        current_values.append(next(values, {}).get("value"))
-                        i += 1
-                    except (AttributeError, ValueError, IndexError, TypeError):
-                        break
-                return current_values
+            unmatched.remove(position)
+            values[position] = entry.get("value")
+
+        return values
+
+    @staticmethod
+    def get_field_value_header(entry: Dict) -> Dict:
+        """The document, locale and field descriptor a value returned by
+        ``getFieldsByDescriptor`` belongs to, as far as the entry tells
+        """
+        header: Dict = entry.get("field_header") or entry
+        return {
+            key: header[key]
+            for key in ["document_id", "locale", "field_descriptor"]
+            if header.get(key) is not None
+        }
+
+    def fetch_repeated_field_values(
+        self,
+        field_header: Dict,
+        chunk_size: int = KINTARO_REPEATED_FIELD_CHUNK_SIZE,
+    ) -> List[Any]:
+        """Reads every entry of a repeated field, asking for ``chunk_size``
+        indexes per request.
+
+        Entries are read until kintaro answers that an index is past the
+        last entry, see ``is_out_of_range_error``, empty entries being kept
+        as ``None``. A request that fails that way is retried with half of
+        its indexes, so the whole field takes about
+        ``len / chunk_size + 2 * log2(chunk_size)`` requests. A chunk where
+        every entry is empty also ends the field, without them.
+
+        Raises
+        ------
+        googleapiclient.errors.HttpError
+            If a request fails for another reason than reading past the last
+             entry
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be greater than 0")
+
+        field_descriptor: str = field_header["field_descriptor"]
+        values: List[Any] = []
+        size: int = chunk_size
+
+        while True:
+            try:
+                chunk: List[Any] = self.fetch_field_values(
+                    field_headers=[
+                        dict(
+                            field_header,
+                            field_descriptor=f"{field_descriptor}.{index}",
+                        )
+                        for index in range(len(values), len(values) + size)
+                    ]
+                )
+            except GoogleApiHttpError as e:
+                if not self.is_out_of_range_error(error=e):
+                    raise
+                if size == 1:
+                    return values
+                size = ceil(size / 2)
+                continue
+
+            if all(value is None for value in chunk):
+                return values
+            values.extend(chunk)
+
+    @staticmethod
+    def is_out_of_range_error(error: GoogleApiHttpError) -> bool:
+        """Whether a failed read of field values asked for an index past the
+        last entry of a repeated field, rather than failing for another
+        reason, like an invalid field descriptor
+        """
+        if error.resp.status != KINTARO_OUT_OF_RANGE_STATUS:
+            return False
+
+        try:
+            messages: List[str] = [
+                str(entry.get("message", ""))
+                for entry in prepare_google_api_error_response(
+                    error=error.content
+                ).get("errors", [])
+            ]
+        except (ValueError, TypeError, AttributeError):
+            messages = [str(error)]
+        return any(
+            KINTARO_OUT_OF_RANGE_MESSAGE in message.lower()
+            for message in messages
+        )
+
+    @staticmethod
+    def is_repeated_field_descriptor(
+        schema_info: List[KintaroSchemaField], field_descriptor: str
+    ) -> bool:
+        """Whether a field descriptor, like ``links`` or ``links.0.tags``,
+        points to a whole repeated field instead of one of its entries
+        """
+        schema_fields: Dict[str, KintaroSchemaField] = {
+            field.name: field for field in schema_info
+        }
+        parts: List[str] = field_descriptor.split(".")
+
+        position: int = 0
+        while position < len(parts):
+            schema_field: Optional[KintaroSchemaField] = schema_fields.get(
+                parts[position]
+            )
+            if schema_field is None:
+                return False
+
+            position += 1
+            if schema_field.repeated:
+                if position == len(parts):
+                    return True
+                if parts[position].isdigit():
+                    position += 1
+
+            schema_fields = {
+                field.name: field for field in schema_field.schema_fields or []
+            }
+
+        return False
 
     @api_request
     def execute_update_document_field(
@@ -350,6 +868,7 @@ class KintaroDocumentService(KintaroBaseService):
         ).execute()
         return
 
+    @api_request
     def update_document_field(
         self,
         collection_id: str,
@@ -358,6 +877,7 @@ class KintaroDocumentService(KintaroBaseService):
         field_values: Dict[str, Any],
         repo_id: Optional[str] = None,
         workspace_id: Optional[str] = None,
+        schema_id: Optional[str] = None,
     ) -> Optional[ServiceError]:
         """Updates the value of a document's field, in one or more locales.
 
@@ -369,15 +889,25 @@ class KintaroDocumentService(KintaroBaseService):
             "pt-PT_pt": "Novo título",
             "es_ar": "Nuevo título"
         }
+
+        Top level fields are written, in every locale, with a single
+        ``multiDocumentUpdate`` request, see ``update_documents_field``.
+        Field descriptors pointing inside a field, like ``links.0.title``,
+        are written with one ``editField`` request per locale, root first
+        and the others together in a batch. Their current root value is
+        read when not given, and the error of that read returned.
         """
-        field_name = convert_string_case(
-            (
-                ".".join(field_name.split("--"))
-                if "--" in field_name
-                else field_name
-            ),
-            case_style="SNAKE",
-        )
+        field_name = self.prepare_field_name(field_name=field_name)
+
+        if "." not in field_name:
+            return self.update_documents_field(
+                collection_id=collection_id,
+                field_name=field_name,
+                documents_field_values={document_id: field_values},
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                schema_id=schema_id,
+            )
 
         # Convert case of possible nested fields
         for key in field_values.keys():
@@ -389,7 +919,7 @@ class KintaroDocumentService(KintaroBaseService):
             # update root first if it's present because the other locales
             #  depend on it
             root_value = field_values["root"]
-            self.execute_update_document_field(
+            result = self.execute_update_document_field(
                 document_id=document_id,
                 collection_id=collection_id,
                 repo_id=repo_id or self.repo_id,
@@ -398,41 +928,215 @@ class KintaroDocumentService(KintaroBaseService):
                 field_name=field_name,
                 field_value=dict(value=root_value),
             )
+            if result is not None:
+                return result
         else:
-            root_value = self.get_document_current_field_value(
-                document_id=document_id,
-                collection_id=collection_id,
+            current_values = self.get_documents_fields_values(
+                field_headers=[
+                    dict(
+                        collection_id=collection_id,
+                        document_id=document_id,
+                        field_name=field_name,
+                    )
+                ],
                 repo_id=repo_id or self.repo_id,
                 workspace_id=workspace_id or self.workspace_id,
-                locale="root",
-                field_name=field_name,
             )
-
-        # check if root_value is error
-        if isinstance(root_value, ServiceError) and "errors" in root_value:
-            return root_value
+            if isinstance(current_values, dict) and "errors" in current_values:
+                return current_values
+            root_value = current_values[0]
 
         non_root_locales: List[str] = [
             loc for loc in field_values.keys() if loc != "root"
         ]
 
-        if len(non_root_locales) == 0:
+        if len(non_root_locales) == 0 or not isinstance(root_value, str):
             return
 
         root_md5 = md5(root_value.encode("utf-8")).hexdigest()
 
-        for locale in non_root_locales:
-            self.execute_update_document_field(
-                document_id=document_id,
-                collection_id=collection_id,
-                repo_id=repo_id or self.repo_id,
-                workspace_id=workspace_id or self.workspace_id,
-                locale=locale,
-                field_name=field_name,
-                field_value=dict(
-                    value=field_values[locale], root_md5=root_md5
-                ),
-            )
+        # while replayed by a batch, the calls are answered by that one and
+        #  return their value instead of being queued
+        with self.batch():
+            results: List = [
+                self.execute_update_document_field(
+                    document_id=document_id,
+                    collection_id=collection_id,
+                    repo_id=repo_id or self.repo_id,
+                    workspace_id=workspace_id or self.workspace_id,
+                    locale=locale,
+                    field_name=field_name,
+                    field_value=dict(
+                        value=field_values[locale], root_md5=root_md5
+                    ),
+                )
+                for locale in non_root_locales
+            ]
+
+        for result in results:
+            if isinstance(result, KintaroBatchResult):
+                result = result.result()
+            if result is not None:
+                return result
+
+    @api_request
+    def update_documents_field(
+        self,
+        collection_id: str,
+        field_name: str,
+        documents_field_values: Dict[str, Dict[str, Any]],
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        schema_id: Optional[str] = None,
+        chunk_size: int = KINTARO_UPDATE_CHUNK_SIZE,
+    ) -> Optional[ServiceError]:
+        """Updates the same top level field of several documents of a
+        collection, in one or more locales each, with ``multiDocumentUpdate``
+        requests of up to ``chunk_size`` documents.
+
+        {
+            "document-one": {"root": "New title", "nl_nl": "Nieuwe titel"},
+            "document-two": {"root": "Other title", "nl_nl": "Andere titel"}
+        }
+
+        The ``root_md5`` of the non-root values is computed once per document,
+        from the new root value when one is given or from the current one.
+        Current root values are read with ``get_documents_fields_values``.
+
+        Parameters
+        ----------
+        collection_id : str
+            The collection id string.
+        field_name : str
+            The name of the field, as defined in the collection's schema.
+        documents_field_values : Dict[str, Dict[str, Any]]
+            The field's new values, per locale, by document id.
+        repo_id : Optional[str]
+            The repo id string. If not provided, the **repo_id** attribute from
+             the class will be used.
+        workspace_id : Optional[str]
+            The workspace id string. If not provided, the **workspace_id**
+             attribute from the class will be used.
+        schema_id : Optional[str]
+            The id of the collection's schema. Read from the collection if not
+             provided.
+        chunk_size : int
+            Maximum number of documents per request. Requests are sent one
+             after the other, until one fails.
+
+        Returns
+        -------
+        Optional[ServiceError]
+            The error of the first request that failed, the documents of the
+             following ones are not updated.
+
+        Raises
+        ------
+        ValueError
+            If the schema could not be retrieved or has no such field, or
+             ``chunk_size`` is not positive
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be greater than 0")
+
+        field_name = self.prepare_field_name(field_name=field_name)
+        schema: KintaroSchema = self.get_document_schema(
+            collection_id=collection_id,
+            schema_id=schema_id,
+            repo_id=repo_id or self.repo_id,
+        )
+        if not any(field.name == field_name for field in schema.schema_fields):
+            raise ValueError(
+                f"Field '{field_name}' is not part of schema '{schema.name}'"
+            )
+
+        # current root values of the documents without a new one, read in
+        #  bulk
+        root_values: Dict[str, Any] = {}
+        missing_root: List[str] = [
+            document_id
+            for document_id, field_values in documents_field_values.items()
+            if "root" not in field_values and field_values
+        ]
+        if missing_root:
+            current_values = self.get_documents_fields_values(
+                field_headers=[
+                    dict(
+                        collection_id=collection_id,
+                        document_id=document_id,
+                        field_name=field_name,
+                    )
+                    for document_id in missing_root
+                ],
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+            )
+            if isinstance(current_values, dict) and "errors" in current_values:
+                return current_values
+            root_values = dict(zip(missing_root, current_values))
+
+        updated_content: List[Dict] = []
+        for document_id, field_values in documents_field_values.items():
+            content: Dict = {
+                locale: {
+                    field_name: convert_dict_keys_case(
+                        value, case_style="SNAKE"
+                    )
+                }
+                for locale, value in field_values.items()
+            }
+            root_value: Any = (
+                content["root"][field_name]
+                if "root" in content
+                else root_values.get(document_id)
+            )
+
+            # files are uploaded once, even when the call is replayed by a
+            #  batch
+            contents: List[Dict] = run_once(
+                self.convert_document_contents,
+                collection_id=collection_id,
+                converter=compile_schema(schema),
+                content=content,
+                schema_info=schema.schema_fields,
+                root_content=(
+                    {field_name: root_value} if root_value is not None else {}
+                ),
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+            )
+            if contents:
+                updated_content.append(
+                    dict(document_id=document_id, contents=contents)
+                )
+
+        for start in range(0, len(updated_content), chunk_size):
+            result = self.execute_update_command(
+                request_body=dict(
+                    repo_id=repo_id or self.repo_id,
+                    project_id=workspace_id or self.workspace_id,
+                    collection_id=collection_id,
+                    updated_content=updated_content[
+                        start : start + chunk_size
+                    ],
+                )
+            )
+            if result is not None:
+                return result
+
+    @staticmethod
+    def prepare_field_name(field_name: str) -> str:
+        """Converts a field name, or a field descriptor using ``--`` as
+        separator, to the snake case, dot separated, form used by kintaro
+        """
+        return convert_string_case(
+            (
+                ".".join(field_name.split("--"))
+                if "--" in field_name
+                else field_name
+            ),
+            case_style="SNAKE",
+        )
 
     @api_request
     def copy_document_content_to_other_locales(
@@ -484,6 +1188,77 @@ class KintaroDocumentService(KintaroBaseService):
             ).execute()
         )
 
+    def get_document_schema(
+        self,
+        collection_id: str,
+        schema_id: Optional[str] = None,
+        repo_id: Optional[str] = None,
+    ) -> KintaroSchema:
+        """Gets the schema of the documents in a collection, either by its
+        ``schema_id`` or through the collection. Results are kept in the
+        service's ``schema_cache``, when there is one.
+
+        Raises
+        ------
+        ValueError
+            If the schema could not be retrieved
+        """
+        repo_id = repo_id or self.repo_id
+        cache: Optional[KintaroSchemaCache] = self.schema_cache
+        base_url: Optional[str] = self.get_base_url()
+
+        schema: Optional[Union[ServiceError, KintaroSchema]]
+        if schema_id:
+            schema = (
+                cache.get_schema(
+                    repo_id=repo_id,
+                    schema_id=schema_id,
+                    base_url=base_url,
+                )
+                if cache is not None
+                else None
+            )
+            if schema is None:
+                schema = self.schema_service.get_schema(
+                    schema_id=schema_id,
+                    repo_id=repo_id,
+                )
+                if cache is not None and isinstance(schema, KintaroSchema):
+                    cache.set_schema(
+                        repo_id=repo_id,
+                        schema=schema,
+                        base_url=base_url,
+                    )
+        else:
+            schema = (
+                cache.get_collection_schema(
+                    repo_id=repo_id,
+                    collection_id=collection_id,
+                    base_url=base_url,
+                )
+                if cache is not None
+                else None
+            )
+            if schema is None:
+                collection = self.collection_service.get_collection(
+                    collection_id=collection_id,
+                    repo_id=repo_id,
+                    include_schema=True,
+                )
+                schema = getattr(collection, "schema", None)
+                if cache is not None and isinstance(schema, KintaroSchema):
+                    cache.set_collection_schema(
+                        repo_id=repo_id,
+                        collection_id=collection_id,
+                        schema=schema,
+                        base_url=base_url,
+                    )
+
+        if not isinstance(schema, KintaroSchema):
+            raise ValueError("Failed to retrieve schema")
+
+        return schema
+
     @api_request
     def create_document(
         self,
@@ -492,27 +1267,58 @@ class KintaroDocumentService(KintaroBaseService):
         schema_id: Optional[str] = None,
         repo_id: Optional[str] = None,
         workspace_id: Optional[str] = None,
-    ) -> Union[ServiceError, KintaroDocument]:
+        return_document: str = KintaroReturnDocument.FULL,
+        depth: int = 6,
+        validate: bool = False,
+    ) -> Optional[
+        Union[ServiceError, KintaroDocument, KintaroDocumentSummary]
+    ]:
+        """Creates a document with the given content, per locale. The root
+        locale is created first, and the others added with an update. If
+        that update fails, its ``ServiceError`` is returned with the
+        ``document_id`` of the created document.
+
+        Parameters
+        ----------
+        return_document : str
+            What to return once the document is created, one of
+             ``KintaroReturnDocument``. See ``get_written_document``.
+        depth : int
+            The depth of the document returned by the **full** mode.
+        validate : bool
+            Check the content against the schema first, see
+             ``validate_document_content``, and raise a
+             ``KintaroContentValidationError`` with the errors found instead
+             of sending it.
+        """
         if "root" not in content.keys():
             raise KintaroCreateDocumentError(
                 "Can not create document without content for root locale"
             )
 
-        schema: KintaroSchema
-        if schema_id:
-            schema = self.schema_service.get_schema(
-                schema_id=schema_id,
-                repo_id=repo_id or self.repo_id,
+        schema: KintaroSchema = self.get_document_schema(
+            collection_id=collection_id,
+            schema_id=schema_id,
+            repo_id=repo_id or self.repo_id,
+        )
+        if validate:
+            self.check_document_content(
+                schema=schema, content=content, partial=False
             )
-        else:
-            schema = self.collection_service.get_collection(
-                collection_id=collection_id,
-                repo_id=repo_id or self.repo_id,
-                include_schema=True,
-            ).schema
-
-        if not isinstance(schema, KintaroSchema):
-            raise ValueError("Failed to retrieve schema")
+        # uploads and referenced documents are written once, even when
+        #  the call is replayed by a batch
+        content = run_once(
+            self.prepare_request_bodies,
+            request_bodies=[
+                dict(
+                    collection_id=collection_id,
+                    content=content,
+                    repo_id=repo_id or self.repo_id,
+                    workspace_id=workspace_id or self.workspace_id,
+                )
+            ],
+            converter=compile_schema(schema),
+        )[0]["content"]
 
         # create first for "root" and then update other locales
         root_fields = self.convert_document_content_to_kintaro_format(
@@ -520,6 +1326,7 @@ class KintaroDocumentService(KintaroBaseService):
             content=content.get("root", {}),
             schema_info=schema.schema_fields,
             locale="root",
+            converter=compile_schema(schema),
         )
 
         document_dict: Dict = self.service.createDocument(
@@ -535,111 +1342,1518 @@ class KintaroDocumentService(KintaroBaseService):
         if "document_id" not in document_dict:
             raise KintaroCreateDocumentError("Failed to create document")
 
-        non_root_locales_contents: Dict[str, Dict] = {
-            loc: loc_content
-            for loc, loc_content in content.items()
-            if loc != "root"
-        }
+        non_root_locales_contents: Dict[str, Dict] = {
+            loc: loc_content
+            for loc, loc_content in content.items()
+            if loc != "root"
+        }
+
+        if non_root_locales_contents:
+            result = self.update_document(
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                collection_id=collection_id,
+                document_id=document_dict.get("document_id"),
+                content=non_root_locales_contents,
+                schema_id=schema.name,
+                return_document=KintaroReturnDocument.NONE,
+                current_root_content=content.get("root", {}),
+            )
+            if result is not None:
+                # the document exists already, its id is kept with the error
+                #  so it can be updated instead of created again
+                return dict(result, document_id=document_dict["document_id"])
+
+        return self.get_written_document(
+            document_id=document_dict.get("document_id"),
+            collection_id=collection_id,
+            schema_id=schema.name,
+            repo_id=repo_id or self.repo_id,
+            workspace_id=workspace_id or self.workspace_id,
+            return_document=return_document,
+            depth=depth,
+        )
+
+    def validate_document_content(
+        self,
+        collection_id: str,
+        content: Dict,
+        schema_id: Optional[str] = None,
+        repo_id: Optional[str] = None,
+        partial: bool = False,
+    ) -> List[str]:
+        """Checks the content of a document, per locale, against the schema
+        of its collection without sending anything, see
+        ``KintaroSchemaValidator``.
+
+        Parameters
+        ----------
+        collection_id : str
+            The collection id string.
+        content : Dict
+            The content of the document, per locale.
+        schema_id : Optional[str]
+            The id of the collection's schema. Read from the collection if not
+             provided.
+        repo_id : Optional[str]
+            The repo id string. If not provided, the **repo_id** attribute from
+             the class will be used.
+        partial : bool
+            Whether the content is an update, where required fields can be
+             left out.
+
+        Returns
+        -------
+        List[str]
+            The errors found, as ``"<locale>.<field path>: <message>"``
+             strings. Empty when the content is valid.
+        """
+        schema: KintaroSchema = self.get_document_schema(
+            collection_id=collection_id,
+            schema_id=schema_id,
+            repo_id=repo_id or self.repo_id,
+        )
+        return compile_validator(schema).validate_document(
+            content=content, partial=partial
+        )
+
+    @staticmethod
+    def check_document_content(
+        schema: KintaroSchema, content: Dict, partial: bool
+    ):
+        """Raises a ``KintaroContentValidationError``, with the list of errors,
+        if the content of a document is not valid for the schema
+        """
+        errors: List[str] = compile_validator(schema).validate_document(
+            content=content, partial=partial
+        )
+        if errors:
+            raise KintaroContentValidationError(errors)
+
+    @staticmethod
+    def check_documents_content(
+        schema: KintaroSchema, documents: Dict[str, Dict[str, Dict]]
+    ):
+        """Raises a ``KintaroContentValidationError``, with the errors by
+        document id, if the update of any of the documents is not valid for
+        the schema
+        """
+        validator: KintaroSchemaValidator = compile_validator(schema)
+        errors: Dict[str, List[str]] = {}
+        for document_id, content in documents.items():
+            document_errors: List[str] = validator.validate_document(
+                content=content, partial=True
+            )
+            if document_errors:
+                errors[document_id] = document_errors
+        if errors:
+            raise KintaroContentValidationError(errors)
+
+    def get_written_document(
+        self,
+        document_id: str,
+        collection_id: str,
+        schema_id: Optional[str] = None,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        return_document: str = KintaroReturnDocument.FULL,
+        depth: int = 6,
+    ) -> Optional[
+        Union[ServiceError, KintaroDocument, KintaroDocumentSummary]
+    ]:
+        """Returns what ``create_document`` and ``update_document`` give
+        back once the document was written, depending on ``return_document``:
+
+        - **full**: the document, read again with ``get_document`` at the
+          requested ``depth``
+        - **summary**: a ``KintaroDocumentSummary`` with the document's
+          identifiers, without any request
+        - **none**: nothing
+
+        Raises
+        ------
+        ValueError
+            If ``return_document`` is none of the above
+        """
+        if return_document not in KintaroReturnDocument.KNOWN:
+            raise ValueError(f"Invalid return_document {return_document}")
+
+        if return_document == KintaroReturnDocument.NONE:
+            return
+
+        if return_document == KintaroReturnDocument.SUMMARY:
+            return KintaroDocumentSummary(
+                initial_data=dict(
+                    document_id=document_id,
+                    collection_id=collection_id,
+                    schema_id=schema_id,
+                    repo_id=repo_id or self.repo_id,
+                    project_id=workspace_id or self.workspace_id,
+                )
+            )
+
+        return self.get_document(
+            document_id=document_id,
+            collection_id=collection_id,
+            repo_id=repo_id or self.repo_id,
+            workspace_id=workspace_id or self.workspace_id,
+            depth=depth,
+            locale="root",
+        )
+
+    @api_request
+    def execute_update_command(self, request_body: Dict):
+        self.service.multiDocumentUpdate(body=request_body).execute()
+
+    @api_request
+    def update_document(
+        self,
+        document_id: str,
+        collection_id: str,
+        content: Dict,
+        schema_id: Optional[str] = None,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        return_document: str = KintaroReturnDocument.FULL,
+        depth: int = 6,
+        current_root_content: Optional[Dict] = None,
+        only_changed: bool = False,
+        current_content: Optional[Dict[str, Dict]] = None,
+        validate: bool = False,
+    ) -> Optional[
+        Union[ServiceError, KintaroDocument, KintaroDocumentSummary]
+    ]:
+        """Updates the content of a document, per locale, with a single
+        ``multiDocumentUpdate`` request.
+
+        Parameters
+        ----------
+        current_root_content : Optional[Dict]
+            The document's current root content, when already known. Used
+             to update other locales without the root one, instead of
+             reading the document.
+        only_changed : bool
+            Only send the fields whose value differs from the current one,
+             see ``get_changed_content``, and skip the request when none
+             does. The current content of each locale is read, unless found
+             in ``current_content``.
+        current_content : Optional[Dict[str, Dict]]
+            The document's current content, per locale, when already known,
+             for instance from a local copy.
+        validate : bool
+            Check the content against the schema first, see
+             ``validate_document_content``, and raise a
+             ``KintaroContentValidationError`` with the errors found instead
+             of sending it.
+        return_document : str
+            What to return once the document is updated, one of
+             ``KintaroReturnDocument``. See ``get_written_document``.
+        depth : int
+            The depth of the document returned by the **full** mode.
+        """
+        schema: KintaroSchema = self.get_document_schema(
+            collection_id=collection_id,
+            schema_id=schema_id,
+            repo_id=repo_id or self.repo_id,
+        )
+        if validate:
+            self.check_document_content(
+                schema=schema, content=content, partial=True
+            )
+        converter: KintaroSchemaConverter = compile_schema(schema)
+
+        current_content = dict(current_content or {})
+        if current_root_content:
+            current_content.setdefault("root", current_root_content)
+
+        root_updated_at: Any = None
+        for locale in self.get_locales_to_read(
+            content=content,
+            current_content=current_content,
+            only_changed=only_changed,
+        ):
+            current_document = self.get_document(
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                document_id=document_id,
+                collection_id=collection_id,
+                locale=locale,
+                depth=0,
+            )
+            if not isinstance(current_document, KintaroDocument):
+                return current_document
+            current_content[locale] = current_document.content or {}
+            if locale == "root":
+                root_updated_at = (
+                    current_document.modification_info or {}
+                ).get("updated_at")
+
+        root_fingerprint: Optional[KintaroRootFingerprint] = None
+        if any(locale != "root" for locale in content):
+            root_fingerprint = self.get_root_fingerprint(
+                root_content={
+                    **current_content.get("root", {}),
+                    **(content.get("root") or {}),
+                },
+                schema=schema,
+                collection_id=collection_id,
+                document_id=document_id,
+                repo_id=repo_id or self.repo_id,
+                updated_at=root_updated_at if "root" not in content else None,
+            )
+        if only_changed:
+            content = self.get_changed_content(
+                content=content,
+                current_content=current_content,
+                converter=converter,
+            )
+
+        if content:
+            # uploads and referenced documents are written once, even when
+            #  the call is replayed by a batch
+            content = run_once(
+                self.prepare_request_bodies,
+                request_bodies=[
+                    dict(
+                        collection_id=collection_id,
+                        content=content,
+                        repo_id=repo_id or self.repo_id,
+                        workspace_id=workspace_id or self.workspace_id,
+                    )
+                ],
+                converter=converter,
+            )[0]["content"]
+            result = self.execute_update_command(
+                request_body=dict(
+                    repo_id=repo_id or self.repo_id,
+                    project_id=workspace_id or self.workspace_id,
+                    collection_id=collection_id,
+                    updated_content=[
+                        dict(
+                            document_id=document_id,
+                            contents=self.convert_document_contents(
+                                collection_id=collection_id,
+                                converter=converter,
+                                content=content,
+                                schema_info=schema.schema_fields,
+                                root_fingerprint=root_fingerprint,
+                                repo_id=repo_id or self.repo_id,
+                                workspace_id=(
+                                    workspace_id or self.workspace_id
+                                ),
+                            ),
+                        )
+                    ],
+                )
+            )
+            if result is not None:
+                return result
+
+        return self.get_written_document(
+            document_id=document_id,
+            collection_id=collection_id,
+            schema_id=schema.name,
+            repo_id=repo_id or self.repo_id,
+            workspace_id=workspace_id or self.workspace_id,
+            return_document=return_document,
+            depth=depth,
+        )
+
+    @api_request
+    def update_documents(
+        self,
+        collection_id: str,
+        documents: Dict[str, Dict],
+        schema_id: Optional[str] = None,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        chunk_size: int = KINTARO_UPDATE_CHUNK_SIZE,
+        current_root_contents: Optional[Dict[str, Dict]] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        only_changed: bool = False,
+        current_contents: Optional[Dict[str, Dict[str, Dict]]] = None,
+        validate: bool = False,
+    ) -> Dict[str, Optional[ServiceError]]:
+        """Updates the content, per locale, of many documents of a
+        collection, sending ``chunk_size`` documents in each
+        ``multiDocumentUpdate`` request.
+
+        {
+            "document-one": {"root": {"title": "Title"}},
+            "document-two": {"nl_nl": {"title": "Titel"}}
+        }
+
+        Requests are sent concurrently, see ``map_concurrently``. When one
+        fails, its documents are split in halves that are sent again, until
+        the failing documents are isolated, so they do not prevent the
+        others from being updated. Documents whose files could not be
+        uploaded are not sent, and get the error of the upload.
+
+        Parameters
+        ----------
+        collection_id : str
+            The collection id string.
+        documents : Dict[str, Dict]
+            The new content of each document, per locale, by document id.
+        schema_id : Optional[str]
+            The id of the collection's schema. Read from the collection if not
+             provided.
+        repo_id : Optional[str]
+            The repo id string. If not provided, the **repo_id** attribute from
+             the class will be used.
+        workspace_id : Optional[str]
+            The workspace id string. If not provided, the **workspace_id**
+             attribute from the class will be used.
+        chunk_size : int
+            Maximum number of documents per request.
+        current_root_contents : Optional[Dict[str, Dict]]
+            The current root content of documents updated without the root
+             locale, by document id. Documents missing from it are read.
+        executor : Optional[Executor]
+            The executor sending the requests, see ``map_concurrently``.
+        max_workers : Optional[int]
+            Maximum number of concurrent requests, see ``map_concurrently``.
+        only_changed : bool
+            Only send the fields whose value differs from the current one,
+             see ``get_changed_content``, leaving out the documents where
+             none does. Current contents missing from ``current_contents``
+             are read, concurrently.
+        current_contents : Optional[Dict[str, Dict[str, Dict]]]
+            The current content of documents, per locale, by document id,
+             when already known.
+        validate : bool
+            Check the content of every document against the schema first,
+             see ``validate_document_content``, and raise a
+             ``KintaroContentValidationError`` with the errors found by
+             document id, before any document is sent.
+
+        Returns
+        -------
+        Dict[str, Optional[ServiceError]]
+            The error of each document, by document id, ``None`` for the ones
+             that were updated.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be greater than 0")
+
+        schema: KintaroSchema = self.get_document_schema(
+            collection_id=collection_id,
+            schema_id=schema_id,
+            repo_id=repo_id or self.repo_id,
+        )
+        converter: KintaroSchemaConverter = compile_schema(schema)
+        if validate:
+            self.check_documents_content(schema=schema, documents=documents)
+        errors: Dict[str, Optional[ServiceError]] = {}
+
+        contents: Dict[str, Dict[str, Dict]] = {
+            document_id: dict(locale_contents)
+            for document_id, locale_contents in (
+                current_contents or {}
+            ).items()
+        }
+        for document_id, root_content in (current_root_contents or {}).items():
+            contents.setdefault(document_id, {}).setdefault(
+                "root", root_content
+            )
+
+        root_updated_at: Dict[str, Any] = {}
+        to_read: List[Tuple[str, str]] = [
+            (document_id, locale)
+            for document_id, content in documents.items()
+            for locale in self.get_locales_to_read(
+                content=content,
+                current_content=contents.get(document_id, {}),
+                only_changed=only_changed,
+            )
+        ]
+        for (document_id, locale), current_document in zip(
+            to_read,
+            self.map_concurrently(
+                fn=lambda entry: self.get_document(
+                    repo_id=repo_id or self.repo_id,
+                    workspace_id=workspace_id or self.workspace_id,
+                    document_id=entry[0],
+                    collection_id=collection_id,
+                    locale=entry[1],
+                    depth=0,
+                ),
+                items=to_read,
+                executor=executor,
+                max_workers=max_workers,
+            ),
+        ):
+            if isinstance(current_document, KintaroDocument):
+                contents.setdefault(document_id, {})[locale] = (
+                    current_document.content or {}
+                )
+                if locale == "root":
+                    root_updated_at[document_id] = (
+                        current_document.modification_info or {}
+                    ).get("updated_at")
+            else:
+                errors[document_id] = current_document
+
+        changed_documents: Dict[str, Dict] = {}
+        root_fingerprints: Dict[str, Optional[KintaroRootFingerprint]] = {}
+        for document_id, content in documents.items():
+            if document_id in errors:
+                continue
+
+            current_content: Dict[str, Dict] = contents.get(document_id, {})
+            root_fingerprint: Optional[KintaroRootFingerprint] = None
+            if any(locale != "root" for locale in content):
+                root_fingerprint = self.get_root_fingerprint(
+                    root_content={
+                        **current_content.get("root", {}),
+                        **(content.get("root") or {}),
+                    },
+                    schema=schema,
+                    collection_id=collection_id,
+                    document_id=document_id,
+                    repo_id=repo_id or self.repo_id,
+                    updated_at=(
+                        root_updated_at.get(document_id)
+                        if "root" not in content
+                        else None
+                    ),
+                )
+            if only_changed:
+                content = self.get_changed_content(
+                    content=content,
+                    current_content=current_content,
+                    converter=converter,
+                )
+
+            if content:
+                changed_documents[document_id] = content
+                root_fingerprints[document_id] = root_fingerprint
+
+        # only the files and referenced documents of the changed content are
+        #  written, once even when the call is replayed by a batch
+        updated_content, upload_errors = run_once(
+            self.prepare_updated_content,
+            collection_id=collection_id,
+            documents=changed_documents,
+            schema=schema,
+            converter=converter,
+            root_fingerprints=root_fingerprints,
+            repo_id=repo_id,
+            workspace_id=workspace_id,
+            executor=executor,
+            max_workers=max_workers,
+        )
+        errors.update(upload_errors)
+
+        def write_chunk(chunk: List[Dict]) -> Dict:
+            error: Optional[ServiceError] = self.execute_update_command(
+                request_body=dict(
+                    repo_id=repo_id or self.repo_id,
+                    project_id=workspace_id or self.workspace_id,
+                    collection_id=collection_id,
+                    updated_content=chunk,
+                )
+            )
+            if error is None or len(chunk) == 1:
+                return {entry["document_id"]: error for entry in chunk}
+
+            half: int = ceil(len(chunk) / 2)
+            return {**write_chunk(chunk[:half]), **write_chunk(chunk[half:])}
+
+        for chunk_errors in self.map_concurrently(
+            fn=write_chunk,
+            items=[
+                updated_content[start : start + chunk_size]
+                for start in range(0, len(updated_content), chunk_size)
+            ],
+            executor=executor,
+            max_workers=max_workers,
+        ):
+            errors.update(chunk_errors)
+
+        return {
+            document_id: errors.get(document_id) for document_id in documents
+        }
+
+    def prepare_updated_content(
+        self,
+        collection_id: str,
+        documents: Dict[str, Dict],
+        schema: KintaroSchema,
+        converter: KintaroSchemaConverter,
+        root_fingerprints: Dict[str, Optional[KintaroRootFingerprint]],
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> Tuple[List[Dict], Dict[str, ServiceError]]:
+        """Writes the referenced documents and uploads the files of the
+        content of documents, per locale, by document id, and returns their
+        ``updated_content`` entries of ``multiDocumentUpdate``. Documents
+        whose files could not be uploaded are left out, and returned with
+        the error of the upload, by document id.
+        """
+        upload_errors: Dict[int, Exception] = {}
+        prepared_request_bodies: List[Dict] = self.prepare_request_bodies(
+            request_bodies=[
+                dict(
+                    collection_id=collection_id,
+                    content=content,
+                    repo_id=repo_id or self.repo_id,
+                    workspace_id=workspace_id or self.workspace_id,
+                )
+                for content in documents.values()
+            ],
+            converter=converter,
+            executor=executor,
+            max_workers=max_workers,
+            upload_errors=upload_errors,
+        )
+
+        updated_content: List[Dict] = []
+        errors: Dict[str, ServiceError] = {}
+        for position, (document_id, request) in enumerate(
+            zip(documents, prepared_request_bodies)
+        ):
+            if position in upload_errors:
+                errors[document_id] = self.get_upload_error(
+                    error=upload_errors[position]
+                )
+                continue
+
+            updated_content.append(
+                dict(
+                    document_id=document_id,
+                    contents=self.convert_document_contents(
+                        collection_id=collection_id,
+                        converter=converter,
+                        content=request["content"],
+                        schema_info=schema.schema_fields,
+                        root_fingerprint=root_fingerprints.get(document_id),
+                        repo_id=repo_id or self.repo_id,
+                        workspace_id=workspace_id or self.workspace_id,
+                    ),
+                )
+            )
+        return updated_content, errors
+
+    @api_request
+    def delete_document(
+        self,
+        collection_id: str,
+        document_id: str,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+    ) -> Optional[ServiceError]:
+        """Deletes the requested document"""
+        self.service.deleteDocument(
+            body=dict(
+                repo_id=repo_id or self.repo_id,
+                project_id=workspace_id or self.workspace_id,
+                collection_id=collection_id,
+                document_id=document_id,
+            )
+        ).execute()
+        return
+
+    def multi_document_action(
+        self,
+        request_bodies: List[Dict],
+        action: str = "create",
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        return_document: str = KintaroReturnDocument.SUMMARY,
+        chunk_size: Optional[int] = None,
+        validate: bool = False,
+        return_exceptions: bool = False,
+    ) -> List[
+        Optional[
+            Union[
+                ServiceError,
+                KintaroDocument,
+                KintaroDocumentSummary,
+                Exception,
+            ]
+        ]
+    ]:
+        """Creates or updates documents concurrently.
+
+        Inside a batch, see ``KintaroBatch``, each call is queued in it
+        instead, and its ``KintaroBatchResult`` returned: the batch sends
+        the requests of every call together, so ``executor``,
+        ``max_workers`` and ``chunk_size`` are not used, and each call
+        validates its content and writes the documents it refers to itself.
+
+        Parameters
+        ----------
+        request_bodies : List[Dict]
+            The keyword arguments of each ``create_document`` or
+            ``update_document`` call.
+        action : str
+            Either **create** or **update**.
+        executor : Optional[Executor]
+            The executor running the calls. Defaults to the service's
+            ``executor`` or, when it has none, to a thread pool of
+            ``max_workers`` threads created for this call.
+        max_workers : Optional[int]
+            Maximum number of concurrent calls of the created thread pool.
+            Defaults to the service's ``max_workers``.
+        return_document : str
+            What each call returns, unless its request body says otherwise.
+            Only a summary by default, to avoid reading every written
+            document again.
+        chunk_size : Optional[int]
+            When given, updates of documents of the same collection are
+            grouped in ``multiDocumentUpdate`` requests of up to
+            ``chunk_size`` documents, see ``update_documents``, instead of
+            one ``update_document`` call per document.
+        validate : bool
+            Check the content of every call against its schema first, see
+            ``validate_document_content``, and raise a
+            ``KintaroContentValidationError`` with the errors found by
+            position in ``request_bodies``, before any call is made.
+        return_exceptions : bool
+            Return the exception raised by a call as its result, instead of
+            raising it once the other calls are done, so the calls that
+            succeeded are known and are not made again. Each call then
+            writes the documents it refers to itself. Does not apply to the
+            ``chunk_size`` updates.
+
+        Returns
+        -------
+        List[Optional[Union[ServiceError, KintaroDocument,
+        KintaroDocumentSummary, Exception]]]
+            The result of each call, in the same order as ``request_bodies``
+        """
+        if action not in ["create", "update"]:
+            raise ValueError(f'Invalid action provided "{action}"')
+
+        action_fn: Callable = getattr(self, f"{action}_document")
+        if get_current_batch() is not None and get_replaying_result() is None:
+            return [
+                action_fn(
+                    **{
+                        "return_document": return_document,
+                        "validate": validate,
+                        **request,
+                    }
+                )
+                for request in request_bodies
+            ]
+
+        if validate:
+            validation_errors: Dict[int, List[str]] = {}
+            for position, request in enumerate(request_bodies):
+                request_errors: List[str] = self.validate_document_content(
+                    collection_id=request["collection_id"],
+                    content=request["content"],
+                    schema_id=request.get("schema_id"),
+                    repo_id=request.get("repo_id") or self.repo_id,
+                    partial=action == "update",
+                )
+                if request_errors:
+                    validation_errors[position] = request_errors
+            if validation_errors:
+                raise KintaroContentValidationError(validation_errors)
+
+        # write the documents they refer to first, in as few waves as the
+        #  depth of the references allows, unless a failure there should
+        #  only fail the calls it belongs to
+        if not return_exceptions:
+            request_bodies = self.resolve_references(
+                request_bodies=request_bodies,
+                executor=executor,
+                max_workers=max_workers,
+            )
+
+        if action == "update" and chunk_size:
+            return self.update_documents_in_chunks(
+                request_bodies=request_bodies,
+                chunk_size=chunk_size,
+                executor=executor,
+                max_workers=max_workers,
+                return_document=return_document,
+            )
+
+        def call(request: Dict):
+            try:
+                return action_fn(
+                    **{"return_document": return_document, **request}
+                )
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        return self.map_concurrently(
+            fn=call,
+            items=request_bodies,
+            executor=executor,
+            max_workers=max_workers,
+        )
+
+    def update_documents_in_chunks(
+        self,
+        request_bodies: List[Dict],
+        chunk_size: int,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        return_document: str = KintaroReturnDocument.SUMMARY,
+    ) -> List[
+        Optional[Union[ServiceError, KintaroDocument, KintaroDocumentSummary]]
+    ]:
+        """Runs the ``update_document`` calls of ``multi_document_action``
+        with one ``update_documents`` call per collection, and per
+        ``only_changed`` and ``validate`` options of the calls
+        """
+        groups: Dict = {}
+        for request in request_bodies:
+            key = (
+                request["collection_id"],
+                request.get("schema_id"),
+                request.get("repo_id") or self.repo_id,
+                request.get("workspace_id") or self.workspace_id,
+                bool(request.get("only_changed")),
+                bool(request.get("validate")),
+            )
+            groups.setdefault(key, []).append(request)
+
+        errors: Dict = {}
+        for (
+            collection_id,
+            schema_id,
+            repo_id,
+            workspace_id,
+            only_changed,
+            validate,
+        ), requests in groups.items():
+            group_errors = self.update_documents(
+                collection_id=collection_id,
+                documents={
+                    request["document_id"]: request["content"]
+                    for request in requests
+                },
+                schema_id=schema_id,
+                repo_id=repo_id,
+                workspace_id=workspace_id,
+                chunk_size=chunk_size,
+                current_root_contents={
+                    request["document_id"]: request["current_root_content"]
+                    for request in requests
+                    if request.get("current_root_content")
+                },
+                executor=executor,
+                max_workers=max_workers,
+                only_changed=only_changed,
+                current_contents={
+                    request["document_id"]: request["current_content"]
+                    for request in requests
+                    if request.get("current_content")
+                },
+                validate=validate,
+            )
+            for document_id, error in group_errors.items():
+                errors[(repo_id, workspace_id, collection_id, document_id)] = (
+                    error
+                )
+
+        def get_result(request: Dict):
+            repo_id: str = request.get("repo_id") or self.repo_id
+            workspace_id: str = (
+                request.get("workspace_id") or self.workspace_id
+            )
+            error = errors.get(
+                (
+                    repo_id,
+                    workspace_id,
+                    request["collection_id"],
+                    request["document_id"],
+                )
+            )
+            if error is not None:
+                return error
+
+            return self.get_written_document(
+                document_id=request["document_id"],
+                collection_id=request["collection_id"],
+                schema_id=request.get("schema_id"),
+                repo_id=repo_id,
+                workspace_id=workspace_id,
+                return_document=request.get(
+                    "return_document", return_document
+                ),
+                depth=request.get("depth", 6),
+            )
+
+        return self.map_concurrently(
+            fn=get_result,
+            items=request_bodies,
+            executor=executor,
+            max_workers=max_workers,
+        )
+
+    def prepare_request_bodies(
+        self,
+        request_bodies: List[Dict],
+        converter: KintaroSchemaConverter,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        upload_errors: Optional[Dict[int, Exception]] = None,
+    ) -> List[Dict]:
+        """Writes the documents referenced by the create or update request
+        bodies of a collection, see ``resolve_references``, and uploads their
+        files, see ``upload_files``, before the documents are converted
+        """
+        return self.upload_files(
+            request_bodies=self.resolve_references(
+                request_bodies=request_bodies,
+                converter=converter,
+                executor=executor,
+                max_workers=max_workers,
+            ),
+            converter=converter,
+            errors=upload_errors,
+        )
+
+    def upload_files(
+        self,
+        request_bodies: List[Dict],
+        converter: KintaroSchemaConverter,
+        errors: Optional[Dict[int, Exception]] = None,
+    ) -> List[Dict]:
+        """Creates the resources of the file field entries with the contents
+        or the url of a file, in every locale of the request bodies of a
+        collection, all at once in the ``upload_executor``. Returns the
+        request bodies with the paths of the created resources instead.
+
+        A url used by several entries is downloaded and uploaded once.
+
+        Parameters
+        ----------
+        request_bodies : List[Dict]
+            Create or update request bodies of documents of a collection.
+        converter : KintaroSchemaConverter
+            The compiled schema of the collection.
+        errors : Optional[Dict[int, Exception]]
+            When given, the first upload error of each request body is added
+             to it, by position in ``request_bodies``, instead of being
+             raised, so the other request bodies can still be written.
+        """
+        uploads: List[Tuple[int, Dict, Future]] = []
+        url_uploads: Dict[Tuple[str, str, str, str], Future] = {}
+        prepared_request_bodies: List[Dict] = []
+        for position, request in enumerate(request_bodies):
+            entries: List[Tuple[Any, Dict]] = []
+            content: Dict = {
+                locale: self.collect_file_uploads(
+                    content=locale_content,
+                    converter=converter,
+                    entries=entries,
+                )
+                for locale, locale_content in request["content"].items()
+            }
+            if not entries:
+                prepared_request_bodies.append(request)
+                continue
+
+            prepared_request_bodies.append(dict(request, content=content))
+            repo_id: str = request.get("repo_id") or self.repo_id
+            workspace_id: str = (
+                request.get("workspace_id") or self.workspace_id
+            )
+            for entry, replacement in entries:
+                key: Optional[Tuple[str, str, str, str]] = (
+                    (
+                        repo_id,
+                        workspace_id,
+                        request["collection_id"],
+                        entry["url"],
+                    )
+                    if self.is_url_entry(entry=entry)
+                    else None
+                )
+                upload: Optional[Future] = url_uploads.get(key)
+                if upload is None:
+                    upload = self.get_upload_executor().submit(
+                        self.create_file_resource,
+                        entry=entry,
+                        collection_id=request["collection_id"],
+                        repo_id=repo_id,
+                        workspace_id=workspace_id,
+                    )
+                    if key is not None:
+                        url_uploads[key] = upload
+                uploads.append((position, replacement, upload))
+
+        for position, replacement, upload in uploads:
+            try:
+                replacement["resource_path"] = upload.result()
+            except Exception as e:
+                if errors is None:
+                    raise
+                errors.setdefault(position, e)
+        return prepared_request_bodies
+
+    @staticmethod
+    def is_url_entry(entry: Dict) -> bool:
+        """Whether the resource of a file field entry is created from its
+        **url**, see ``create_file_resource``
+        """
+        return bool(entry.get("url")) and not any(
+            field in entry for field in ["mimetype", "name", "data"]
+        )
+
+    @staticmethod
+    def get_upload_error(error: Exception) -> ServiceError:
+        """The ``ServiceError`` of a document whose files could not be
+        uploaded
+        """
+        if isinstance(error, KintaroWrongContentFormatError) and isinstance(
+            error.args[0] if error.args else None, dict
+        ):
+            return error.args[0]
+        return ServiceError(
+            dict(errors=[dict(message=f"{type(error).__name__}: {error}")])
+        )
+
+    def collect_file_uploads(
+        self,
+        content: Dict,
+        converter: KintaroSchemaConverter,
+        entries: List[Tuple[Any, Dict]],
+    ) -> Dict:
+        """Returns a copy of the content of a locale where the file field
+        entries that need a new resource, see ``get_file_entry_path``, are
+        replaced by empty dicts, added to ``entries`` with the entry they
+        replace, to be given the path of the resource once it is created
+        """
+        collected_content: Dict = dict(content or {})
+        for field_name, field_value in collected_content.items():
+            field: Optional[KintaroFieldConverter] = converter.fields.get(
+                field_name
+            )
+            if field is None or field.kind not in [
+                KintaroFieldConverter.NESTED,
+                KintaroFieldConverter.FILE,
+            ]:
+                continue
+
+            collected_values: List = []
+            for value in (
+                field_value if isinstance(field_value, list) else [field_value]
+            ):
+                if field.kind == KintaroFieldConverter.NESTED:
+                    if isinstance(value, dict):
+                        value = self.collect_file_uploads(
+                            content=value,
+                            converter=field.nested,
+                            entries=entries,
+                        )
+                elif value and not self.get_file_entry_path(entry=value):
+                    replacement: Dict = {}
+                    entries.append((value, replacement))
+                    value = replacement
+                collected_values.append(value)
+
+            collected_content[field_name] = (
+                collected_values
+                if isinstance(field_value, list)
+                else collected_values[0]
+            )
+
+        return collected_content
+
+    def resolve_references(
+        self,
+        request_bodies: List[Dict],
+        converter: Optional[KintaroSchemaConverter] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict]:
+        """Writes the documents referenced with their content by the create or
+        update request bodies, see ``plan_reference_writes`` and
+        ``write_reference_plan``, and returns the request bodies with
+        references to the written documents instead.
+
+        Parameters
+        ----------
+        request_bodies : List[Dict]
+            Arguments of ``create_document`` or ``update_document`` calls,
+             with at least **collection_id** and **content**.
+        converter : Optional[KintaroSchemaConverter]
+            The compiled schema of all the request bodies, when known.
+             Otherwise it is read for the collection of each one.
+        executor : Optional[Executor]
+            Executor in which the documents of each wave are written. Their
+             ``reference_executor`` by default, see
+             ``get_reference_executor``.
+        max_workers : Optional[int]
+            Not used, the ``reference_executor`` has ``max_reference_workers``
+             threads.
+        """
+        plan: KintaroReferencePlan = KintaroReferencePlan()
+        request_bodies = [
+            self.plan_reference_writes(
+                request=request, plan=plan, converter=converter
+            )
+            for request in request_bodies
+        ]
+        if plan:
+            self.write_reference_plan(
+                plan=plan, executor=executor, max_workers=max_workers
+            )
+        return request_bodies
+
+    def plan_reference_writes(
+        self,
+        request: Dict,
+        plan: KintaroReferencePlan,
+        converter: Optional[KintaroSchemaConverter] = None,
+    ) -> Dict:
+        """Adds the documents referenced, at any depth, by the content of a
+        request body to ``plan``, and returns the request body with the
+        references to them that are resolved when they are written
+        """
+        if not has_new_references(request.get("content")):
+            return request
+
+        repo_id: str = request.get("repo_id") or self.repo_id
+        workspace_id: str = request.get("workspace_id") or self.workspace_id
+        converter = converter or self.get_reference_converter(
+            plan=plan,
+            collection_id=request["collection_id"],
+            schema_id=request.get("schema_id"),
+            repo_id=repo_id,
+        )
+        return dict(
+            request,
+            content={
+                locale: self.plan_content_references(
+                    content=locale_content,
+                    converter=converter,
+                    locale=locale,
+                    plan=plan,
+                    repo_id=repo_id,
+                    workspace_id=workspace_id,
+                )[0]
+                for locale, locale_content in request["content"].items()
+            },
+        )
+
+    def plan_content_references(
+        self,
+        content: Dict,
+        converter: KintaroSchemaConverter,
+        locale: str,
+        plan: KintaroReferencePlan,
+        repo_id: str,
+        workspace_id: str,
+    ) -> Tuple[Dict, int]:
+        """Returns a copy of the content of a locale where the references with
+        content are replaced by the ones of their writes, added to ``plan``,
+        and the level of the content: one more than the highest level of
+        those writes, 0 when there are none
+        """
+        level: int = 0
+        planned_content: Dict = dict(content or {})
+        for field_name, field_value in planned_content.items():
+            field: Optional[KintaroFieldConverter] = converter.fields.get(
+                field_name
+            )
+            if field is None or field.kind not in [
+                KintaroFieldConverter.NESTED,
+                KintaroFieldConverter.REFERENCE,
+            ]:
+                continue
+
+            planned_values: List = []
+            for value in (
+                field_value if isinstance(field_value, list) else [field_value]
+            ):
+                if field.kind == KintaroFieldConverter.NESTED and isinstance(
+                    value, dict
+                ):
+                    value, value_level = self.plan_content_references(
+                        content=value,
+                        converter=field.nested,
+                        locale=locale,
+                        plan=plan,
+                        repo_id=repo_id,
+                        workspace_id=workspace_id,
+                    )
+                    level = max(level, value_level)
+                elif (
+                    field.kind == KintaroFieldConverter.REFERENCE
+                    and isinstance(value, dict)
+                    and value.get("collection_id")
+                    and "content" in value
+                ):
+                    referred_content, referred_level = (
+                        self.plan_content_references(
+                            content=value["content"],
+                            converter=self.get_reference_converter(
+                                plan=plan,
+                                collection_id=value["collection_id"],
+                                repo_id=repo_id,
+                            ),
+                            locale=locale,
+                            plan=plan,
+                            repo_id=repo_id,
+                            workspace_id=workspace_id,
+                        )
+                    )
+                    write: KintaroReferenceWrite = plan.add_write(
+                        collection_id=value["collection_id"],
+                        document_id=value.get("document_id"),
+                        locale=locale,
+                        content=referred_content,
+                        source_content=value["content"],
+                        level=referred_level,
+                        repo_id=repo_id,
+                        workspace_id=workspace_id,
+                    )
+                    value = write.add_entry()
+                    level = max(level, write.level + 1)
+                planned_values.append(value)
+
+            planned_content[field_name] = (
+                planned_values
+                if isinstance(field_value, list)
+                else planned_values[0]
+            )
+
+        return planned_content, level
+
+    def get_reference_converter(
+        self,
+        plan: KintaroReferencePlan,
+        collection_id: str,
+        repo_id: str,
+        schema_id: Optional[str] = None,
+    ) -> KintaroSchemaConverter:
+        """Returns the compiled schema of a collection, read once per plan"""
+        key: Tuple = (repo_id, collection_id, schema_id)
+        if key not in plan.converters:
+            plan.converters[key] = compile_schema(
+                self.get_document_schema(
+                    collection_id=collection_id,
+                    schema_id=schema_id,
+                    repo_id=repo_id,
+                )
+            )
+        return plan.converters[key]
+
+    def write_reference_plan(
+        self,
+        plan: KintaroReferencePlan,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """Writes the documents of a plan, the ones of each level concurrently
+        and after the ones of lower levels, giving the references to each
+        document its ``document_id``.
+
+        Documents are written in ``executor`` or, by default, in the
+        ``reference_executor``, never in the service's ``executor``, whose
+        threads may all be waiting for them.
+
+        Raises
+        ------
+        KintaroWrongContentFormatError
+            If a document could not be written
+        """
+        for wave in plan.get_waves():
+            results: List = self.map_concurrently(
+                fn=lambda write: getattr(self, f"{write.action}_document")(
+                    return_document=KintaroReturnDocument.SUMMARY,
+                    **write.get_request_body(),
+                ),
+                items=wave,
+                executor=executor or self.get_reference_executor(),
+                max_workers=max_workers,
+            )
+
+            for write, result in zip(wave, results):
+                if isinstance(result, dict) and "errors" in result:
+                    raise KintaroWrongContentFormatError(result)
+
+                document_id: Optional[str] = (
+                    result.get("document_id")
+                    if isinstance(result, dict)
+                    else getattr(result, "document_id", None)
+                )
+                if not document_id:
+                    raise AttributeError(
+                        f"Impossible to read property 'document_id' from "
+                        f"type {type(result)}"
+                    )
+                write.set_document_id(document_id)
+
+    def map_concurrently(
+        self,
+        fn: Callable,
+        items: List,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> List:
+        """Calls ``fn`` for each of the items in the given executor, the
+        service's ``executor`` or a thread pool of ``max_workers`` threads,
+        and returns the results in the same order as the items.
+
+        While a batched call is replayed, see ``KintaroBatch``, the items are
+        processed one after the other in the current thread instead, where
+        the batch answers their requests.
+        """
+        if get_replaying_result() is not None:
+            return [fn(item) for item in items]
+
+        own_executor: bool = not (executor or self.executor)
+        executor = (
+            executor
+            or self.executor
+            or ThreadPoolExecutor(max_workers=max_workers or self.max_workers)
+        )
+        try:
+            return list(executor.map(fn, items))
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+    @staticmethod
+    def get_locales_to_read(
+        content: Dict, current_content: Dict, only_changed: bool
+    ) -> List[str]:
+        """Returns the locales whose current content is needed to update a
+        document with ``content`` and is missing from ``current_content``:
+        root when only other locales are updated, to compute their root
+        md5, and every updated locale when only changed fields are sent
+        """
+        locales: List[str] = list(content.keys()) if only_changed else []
+        if content and "root" not in content and "root" not in locales:
+            locales.append("root")
+        return [locale for locale in locales if locale not in current_content]
+
+    @classmethod
+    def get_changed_content(
+        cls,
+        content: Dict,
+        current_content: Dict[str, Dict],
+        converter: Optional[KintaroSchemaConverter] = None,
+    ) -> Dict:
+        """Keeps, from the content of a document per locale, the fields whose
+        value differs from the one in ``current_content``, dropping the
+        locales left without fields.
+
+        Fields of other locales are also kept when their root value
+        changed, so their root md5 points to the new one.
+
+        Given the ``converter`` of the schema, reference and file fields are
+        compared by the id of the document or the path of the resource, so
+        the current content can be read at depth 0, and the content can be
+        compared before its files are uploaded and its referenced documents
+        written.
+        """
+        fields: Dict[str, KintaroFieldConverter] = (
+            converter.fields if converter else {}
+        )
+        current_root: Dict = current_content.get("root") or {}
+        changed_root: List[str] = [
+            field_name
+            for field_name, value in (content.get("root") or {}).items()
+            if not cls.is_same_field_value(
+                value=value,
+                current_value=current_root.get(field_name),
+                field=fields.get(field_name),
+            )
+        ]
+
+        changed_content: Dict = {}
+        for locale, locale_content in content.items():
+            current_locale_content: Dict = current_content.get(locale) or {}
+            changed_fields: Dict = {
+                field_name: value
+                for field_name, value in (locale_content or {}).items()
+                if field_name in changed_root
+                or field_name not in current_locale_content
+                or not cls.is_same_field_value(
+                    value=value,
+                    current_value=current_locale_content[field_name],
+                    field=fields.get(field_name),
+                )
+            }
+            if changed_fields:
+                changed_content[locale] = changed_fields
+
+        return changed_content
+
+    @classmethod
+    def is_same_field_value(
+        cls,
+        value: Any,
+        current_value: Any,
+        field: Optional[KintaroFieldConverter] = None,
+    ) -> bool:
+        """Compares a new field value with the current one. Scalars are
+        compared by their string value, which is how kintaro stores them.
+
+        Entries of reference fields are compared by document id and the ones
+        of file fields by resource path, when the ``field`` is given. New
+        referenced documents and files to upload are always different.
+        """
+        if isinstance(value, list) and isinstance(current_value, list):
+            return len(value) == len(current_value) and all(
+                cls.is_same_field_value(
+                    value=entry, current_value=current, field=field
+                )
+                for entry, current in zip(value, current_value)
+            )
+
+        if value is None or current_value is None:
+            return value is None and current_value is None
+
+        if field is not None and field.kind == KintaroFieldConverter.REFERENCE:
+            document_id: Optional[str] = cls.get_reference_document_id(
+                entry=value
+            )
+            return document_id is not None and (
+                document_id
+                == cls.get_reference_document_id(entry=current_value)
+            )
+
+        if field is not None and field.kind == KintaroFieldConverter.FILE:
+            resource_path: Optional[str] = cls.get_file_entry_path(entry=value)
+            return resource_path is not None and (
+                resource_path == cls.get_resource_path(entry=current_value)
+            )
+
+        if isinstance(value, dict) and isinstance(current_value, dict):
+            nested: Dict[str, KintaroFieldConverter] = (
+                field.nested.fields
+                if field is not None and field.nested is not None
+                else {}
+            )
+            return value.keys() == current_value.keys() and all(
+                cls.is_same_field_value(
+                    value=value[key],
+                    current_value=current_value[key],
+                    field=nested.get(key),
+                )
+                for key in value
+            )
+
+        if isinstance(value, (dict, list)) or isinstance(
+            current_value, (dict, list)
+        ):
+            return False
+
+        return str(value) == str(current_value)
+
+    def get_root_fingerprint(
+        self,
+        root_content: Dict,
+        schema: KintaroSchema,
+        collection_id: Optional[str] = None,
+        document_id: Optional[str] = None,
+        repo_id: Optional[str] = None,
+        updated_at: Any = None,
+    ) -> KintaroRootFingerprint:
+        """Returns the fingerprint of a document's root content, used to
+        write its translations.
+
+        When the ``updated_at`` of the root content, from its modification
+        info, is given the fingerprint is kept in the service's
+        ``fingerprint_cache`` and reused by the following updates of the
+        document's other locales, until the root changes.
+        """
+        cache: Optional[KintaroFingerprintCache] = self.fingerprint_cache
+        use_cache: bool = (
+            cache is not None
+            and updated_at is not None
+            and document_id is not None
+        )
+
+        if use_cache:
+            fingerprint: Optional[KintaroRootFingerprint] = (
+                cache.get_fingerprint(
+                    repo_id=repo_id or self.repo_id,
+                    collection_id=collection_id,
+                    document_id=document_id,
+                    schema_id=schema.name,
+                    updated_at=updated_at,
+                )
+            )
+            if fingerprint is not None:
+                return fingerprint
 
-        if non_root_locales_contents:
-            self.update_document(
+        fingerprint = KintaroRootFingerprint(
+            values=self.get_structured_content_values(
+                doc_content=root_content or {},
+                schema_info=schema.schema_fields,
+            )
+        )
+        if use_cache:
+            cache.set_fingerprint(
                 repo_id=repo_id or self.repo_id,
-                project_id=workspace_id or self.workspace_id,
                 collection_id=collection_id,
-                document_id=document_dict.get("document_id"),
-                content=non_root_locales_contents,
+                document_id=document_id,
+                schema_id=schema.name,
+                updated_at=updated_at,
+                fingerprint=fingerprint,
             )
+        return fingerprint
 
-        return self.get_document(
-            document_id=document_dict.get("document_id"),
-            collection_id=collection_id,
-            repo_id=repo_id or self.repo_id,
-            project_id=workspace_id or self.workspace_id,
-            locale="root",
-        )
-
-    @api_request
-    def execute_update_command(self, request_body: Dict):
-        self.service.multiDocumentUpdate(body=request_body).execute()
-
-    @api_request
-    def update_document(
+    def convert_document_contents(
         self,
-        document_id: str,
         collection_id: str,
         content: Dict,
-        schema_id: Optional[str] = None,
+        schema_info: List[KintaroSchemaField],
+        root_content: Optional[Dict] = None,
         repo_id: Optional[str] = None,
         workspace_id: Optional[str] = None,
-    ) -> Union[ServiceError, KintaroDocument]:
-        schema: KintaroSchema
-        if schema_id:
-            schema = self.schema_service.get_schema(
-                repo_id=repo_id or self.repo_id,
-                schema_id=schema_id,
-            )
-        else:
-            schema = self.collection_service.get_collection(
-                collection_id=collection_id,
-                repo_id=repo_id or self.repo_id,
-                include_schema=True,
-            ).schema
-
-        if not isinstance(schema, KintaroSchema):
-            raise ValueError("Failed to retrieve schema")
-
-        root_content: Dict = {}
-
-        if "root" in content.keys():
-            root_content = content.get("root", {})
+        converter: Optional[KintaroSchemaConverter] = None,
+        root_fingerprint: Optional[KintaroRootFingerprint] = None,
+    ) -> List[Dict]:
+        """Converts the content of a document, per locale, to the
+        ``contents`` of a ``multiDocumentUpdate`` request, root first.
 
-            # processing root content
-            fields = self.convert_document_content_to_kintaro_format(
-                repo_id=repo_id or self.repo_id,
-                workspace_id=workspace_id or self.workspace_id,
-                collection_id=collection_id,
-                content=root_content,
-                schema_info=schema.schema_fields,
-                locale="root",
-            )
+        The values of the other locales refer to the ones of
+        ``root_content``, the document's root content once updated, through
+        their md5. ``root_fingerprint`` replaces ``root_content`` when its
+        fingerprint is already known, see ``get_root_fingerprint``.
+        """
+        if converter is None:
+            converter = KintaroSchemaConverter(schema_fields=schema_info)
 
-            result = self.execute_update_command(
-                request_body=dict(
-                    collection_id=collection_id,
-                    repo_id=repo_id or self.repo_id,
-                    project_id=workspace_id or self.workspace_id,
-                    updated_content=[
-                        dict(
-                            document_id=document_id,
-                            contents=[dict(locale="root", fields=fields)],
-                        )
-                    ],
+        non_root_locales: List[str] = [
+            locale for locale in content.keys() if locale != "root"
+        ]
+        if non_root_locales and root_fingerprint is None:
+            root_fingerprint = KintaroRootFingerprint(
+                values=self.get_structured_content_values(
+                    doc_content=root_content or {}, schema_info=schema_info
                 )
             )
-            if result is not None:
-                return result
 
-        non_root_locales = [loc for loc in content.keys() if loc != "root"]
-        root_md5_info = None
-        if non_root_locales:
-            if "root" not in content.keys():
-                root_content = self.get_document(
-                    repo_id=repo_id or self.repo_id,
-                    workspace_id=workspace_id or self.workspace_id,
-                    document_id=document_id,
-                    collection_id=collection_id,
+        contents: List[Dict] = []
+        if "root" in content.keys():
+            contents.append(
+                dict(
                     locale="root",
-                ).content.get("root")
-
-            root_md5_info = self.get_structured_content_values(
-                doc_content=root_content,
-                schema_info=schema.schema_fields,
-                md5_results=True,
+                    fields=self.convert_document_content_to_kintaro_format(
+                        repo_id=repo_id or self.repo_id,
+                        workspace_id=workspace_id or self.workspace_id,
+                        collection_id=collection_id,
+                        content=content["root"],
+                        schema_info=schema_info,
+                        locale="root",
+                        converter=converter,
+                    ),
+                )
             )
 
-        locale_contents_list: List[Dict] = []
         for locale in non_root_locales:
-            locale_contents_list.append(
+            contents.append(
                 dict(
                     locale=locale,
                     fields=self.convert_document_content_to_kintaro_format(
@@ -647,74 +2861,15 @@ class KintaroDocumentService(KintaroBaseService):
                         workspace_id=workspace_id or self.workspace_id,
                         collection_id=collection_id,
                         content=content[locale],
-                        schema_info=schema.schema_fields,
+                        schema_info=schema_info,
                         locale=locale,
-                        root_md5_info=root_md5_info,
-                        field_name_structure=(
-                            self.get_structured_content_values(
-                                doc_content=content[locale],
-                                schema_info=schema.schema_fields,
-                                md5_results=False,
-                            )
-                        ),
+                        converter=converter,
+                        root_md5_info=root_fingerprint.md5s,
                     ),
                 )
             )
 
-        if locale_contents_list:
-            self.execute_update_command(
-                request_body=dict(
-                    repo_id=repo_id or self.repo_id,
-                    project_id=workspace_id or self.workspace_id,
-                    collection_id=collection_id,
-                    updated_content=[
-                        dict(
-                            document_id=document_id,
-                            contents=locale_contents_list,
-                        )
-                    ],
-                )
-            )
-
-        return self.get_document(
-            repo_id=repo_id or self.repo_id,
-            workspace_id=workspace_id or self.workspace_id,
-            document_id=document_id,
-            collection_id=collection_id,
-            locale="root",
-        )
-
-    @api_request
-    def delete_document(
-        self,
-        collection_id: str,
-        document_id: str,
-        repo_id: Optional[str] = None,
-        workspace_id: Optional[str] = None,
-    ) -> Optional[ServiceError]:
-        """Deletes the requested document"""
-        self.service.deleteDocument(
-            body=dict(
-                repo_id=repo_id or self.repo_id,
-                project_id=workspace_id or self.workspace_id,
-                collection_id=collection_id,
-                document_id=document_id,
-            )
-        ).execute()
-        return
-
-    def multi_document_action(
-        self,
-        request_bodies: List[Dict],
-        action: str = "create",
-    ) -> List[Union[ServiceError, KintaroDocument]]:
-        """Creates or updates documents in batches of 20"""
-        if action not in ["create", "update"]:
-            raise ValueError(f'Invalid action provided "{action}"')
-        return Parallel(n_jobs=NUM_CORES - 1, batch_size=20)(
-            delayed(getattr(self, f"{action}_document"))(**request)
-            for request in request_bodies
-        )
+        return contents
 
     def convert_document_content_to_kintaro_format(
         self,
@@ -726,31 +2881,47 @@ class KintaroDocumentService(KintaroBaseService):
         locale: str = "root",
         repo_id: Optional[str] = None,
         workspace_id: Optional[str] = None,
+        converter: Optional[KintaroSchemaConverter] = None,
+        field_path_prefix: str = "",
     ) -> List[Dict]:
         """
-        Converts the request body to the format that is accepted by kintaro
-        """
-        is_update: bool = isinstance(root_md5_info, dict) and isinstance(
-            field_name_structure, dict
-        )
+        Converts the request body to the format that is accepted by kintaro.
 
-        schema_info: Dict = {field.name: field for field in schema_info}
+        ``converter`` is ``schema_info`` compiled by ``compile_schema``.
+        When not given, the schema is compiled for this call only.
+        ``field_path_prefix`` is the flattened path of nested content, like
+        ``links.0.``, used to find the ``root_md5`` of its values.
+        """
+        if converter is None:
+            converter = KintaroSchemaConverter(schema_fields=schema_info)
 
         fields = []
         if not content:
             content = {}
 
-        for field_name in content.keys():
-            if field_name not in schema_info:
+        for field_name, field_value in content.items():
+            field: Optional[KintaroFieldConverter] = converter.fields.get(
+                field_name
+            )
+            if field is None:
                 continue
 
-            field_value = content[field_name]
-            schema_field_info: KintaroSchemaField = schema_info.get(field_name)
-
             if not isinstance(field_value, list):
                 field_value = [field_value]
 
-            if schema_field_info.type in KintaroFieldType.FILE_FIELDS:
+            if field.kind == KintaroFieldConverter.BASIC:
+                fields.append(
+                    dict(
+                        field_name=field_name,
+                        field_values=field.encode_values(
+                            field_value=field_value,
+                            root_md5_info=root_md5_info,
+                            field_name_structure=field_name_structure,
+                            field_path=f"{field_path_prefix}{field_name}",
+                        ),
+                    )
+                )
+            elif field.kind == KintaroFieldConverter.FILE:
                 fields.extend(
                     self.convert_file_field(
                         field_name=field_name,
@@ -760,33 +2931,44 @@ class KintaroDocumentService(KintaroBaseService):
                         collection_id=collection_id,
                     )
                 )
-            elif schema_field_info.type == KintaroFieldType.NESTED:
-                nested_fields_info_list = [
-                    self.convert_document_content_to_kintaro_format(
-                        repo_id=repo_id or self.repo_id,
-                        workspace_id=workspace_id or self.workspace_id,
-                        collection_id=collection_id,
-                        content=item,
-                        schema_info=schema_info.get(
-                            field_name
-                        ).schema_fields,  # NOQA
-                        locale=locale,
-                        root_md5_info=root_md5_info,
-                        field_name_structure=field_name_structure,
-                    )
-                    for item in field_value
-                ]
-
+            elif field.kind == KintaroFieldConverter.NESTED:
                 fields.append(
                     dict(
                         field_name=field_name,
                         nested_field_values=[
-                            dict(fields=entry)
-                            for entry in nested_fields_info_list
+                            dict(
+                                fields=(
+                                    self.convert_document_content_to_kintaro_format(  # NOQA
+                                        repo_id=repo_id or self.repo_id,
+                                        workspace_id=(
+                                            workspace_id or self.workspace_id
+                                        ),
+                                        collection_id=collection_id,
+                                        content=item,
+                                        schema_info=(
+                                            field.schema_field.schema_fields
+                                        ),
+                                        locale=locale,
+                                        root_md5_info=root_md5_info,
+                                        field_name_structure=(
+                                            field_name_structure
+                                        ),
+                                        converter=field.nested,
+                                        field_path_prefix=(
+                                            f"{field_path_prefix}{field_name}"
+                                            f".{index}."
+                                            if field.repeated
+                                            else f"{field_path_prefix}"
+                                            f"{field_name}."
+                                        ),
+                                    )
+                                )
+                            )
+                            for index, item in enumerate(field_value)
                         ],
                     )
                 )
-            elif schema_field_info.type == KintaroFieldType.REFERENCE:
+            elif field.kind == KintaroFieldConverter.REFERENCE:
                 fields.append(
                     self.convert_reference_field(
                         field_name=field_name,
@@ -796,17 +2978,6 @@ class KintaroDocumentService(KintaroBaseService):
                         locale=locale,
                     )
                 )
-            else:
-                fields.append(
-                    self.convert_basic_field(
-                        schema_field_info=schema_field_info,
-                        field_name=field_name,
-                        field_value=field_value,
-                        field_name_structure=field_name_structure,
-                        root_md5_info=root_md5_info,
-                        is_update=is_update,
-                    )
-                )
         return fields
 
     def convert_file_field(
@@ -817,81 +2988,193 @@ class KintaroDocumentService(KintaroBaseService):
         repo_id: Optional[str] = None,
         workspace_id: Optional[str] = None,
     ) -> List[Dict]:
-        fields: List[Dict] = []
+        """Converts the entries of a file field, creating the resources of
+        the ones with the contents or the url of a file concurrently, see
+        ``create_file_resources``
+        """
+        entries: List = [entry for entry in field_value if entry]
+        resource_paths: List[Optional[str]] = [
+            self.get_file_entry_path(entry=entry) for entry in entries
+        ]
+        to_create: List[int] = [
+            index
+            for index, resource_path in enumerate(resource_paths)
+            if not resource_path
+        ]
+        for index, resource_path in zip(
+            to_create,
+            self.create_file_resources(
+                entries=[entries[index] for index in to_create],
+                collection_id=collection_id,
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+            ),
+        ):
+            resource_paths[index] = resource_path
 
-        for entry in field_value:
-            if not entry:
-                continue
+        return [
+            dict(
+                field_name=field_name,
+                nested_field_values=[
+                    dict(
+                        fields=[
+                            dict(
+                                field_name="file_path",
+                                field_values=[
+                                    dict(type="STRING", value=resource_path)
+                                ],
+                            )
+                        ]
+                    )
+                ],
+            )
+            for resource_path in resource_paths
+        ]
 
-            expected_file_fields: List[str] = ["mimetype", "name", "data"]
-            resource_path = None
+    @classmethod
+    def get_file_entry_path(cls, entry: Any) -> Optional[str]:
+        """Returns the resource path of a file field entry, either the entry
+        itself or its **image_path**, **file_path**, **resource_path** or
+        **path**. ``None`` when a resource has to be created for it, from
+        its **data** or **url**.
+        """
+        if not isinstance(entry, dict):
+            return entry
 
-            if isinstance(entry, dict):
-                if any(field in entry for field in expected_file_fields):
-                    result = self.resource_service.create_resource(
-                        repo_id=repo_id or self.repo_id,
-                        workspace_id=workspace_id or self.workspace_id,
-                        collection_id=collection_id,
-                        file_info=entry,
-                    )
+        expected_file_fields: List[str] = ["mimetype", "name", "data"]
+        if any(field in entry for field in expected_file_fields):
+            return None
 
-                    if isinstance(result, dict) and "errors" in result:
-                        raise KintaroWrongContentFormatError(result)
+        return cls.get_resource_path(entry=entry)
 
-                    resource_path = result.resource_path
-                else:
-                    for alternative_field_name in [
-                        "image_path",
-                        "file_path",
-                        "resource_path",
-                        "path",
-                    ]:
-                        if alternative_field_name in entry:
-                            resource_path = entry.get(alternative_field_name)
-                            if resource_path:
-                                break
+    @staticmethod
+    def get_resource_path(entry: Any) -> Optional[str]:
+        """Returns the resource path of a file field entry as kintaro returns
+        it, either the entry itself or its **image_path**, **file_path**,
+        **resource_path** or **path**
+        """
+        if not isinstance(entry, dict):
+            return entry
+
+        for alternative_field_name in [
+            "image_path",
+            "file_path",
+            "resource_path",
+            "path",
+        ]:
+            if entry.get(alternative_field_name):
+                return entry[alternative_field_name]
+        return None
 
-            else:
-                resource_path = entry
+    @staticmethod
+    def get_reference_document_id(entry: Any) -> Optional[str]:
+        """Returns the id of the document a reference field entry points to,
+        ``None`` for documents written with the entry's **content**
+        """
+        if not isinstance(entry, dict):
+            return entry
+        if "content" in entry:
+            return None
+        return entry.get("document_id")
 
-            if not resource_path:
-                if isinstance(entry, dict) and entry.get("url"):
-                    result = self.resource_service.create_resource_from_url_or_bytes(  # NOQA
-                        repo_id=repo_id or self.repo_id,
-                        workspace_id=(workspace_id or self.workspace_id),
-                        collection_id=collection_id,
-                        source=entry["url"],
-                    )
+    def create_file_resources(
+        self,
+        entries: List[Dict],
+        collection_id: str,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+    ) -> List[str]:
+        """Creates the resources of file field entries, at the same time in
+        the ``upload_executor`` when there are several, and returns their
+        paths in the same order
+        """
+        if len(entries) <= 1:
+            return [
+                self.create_file_resource(
+                    entry=entry,
+                    collection_id=collection_id,
+                    repo_id=repo_id,
+                    workspace_id=workspace_id,
+                )
+                for entry in entries
+            ]
 
-                    if isinstance(result, dict) and "errors" in result:
-                        raise KintaroWrongContentFormatError(result)
+        uploads: List[Future] = [
+            self.get_upload_executor().submit(
+                self.create_file_resource,
+                entry=entry,
+                collection_id=collection_id,
+                repo_id=repo_id,
+                workspace_id=workspace_id,
+            )
+            for entry in entries
+        ]
+        return [upload.result() for upload in uploads]
 
-                    resource_path = result.resource_path
-                else:
-                    raise NoResourcePathFoundError(
-                        "No information available to create resource"
-                    )
+    def create_file_resource(
+        self,
+        entry: Dict,
+        collection_id: str,
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+    ) -> str:
+        """Creates the resource of a file field entry from its **data**, with
+        its **mimetype** and **name**, or from its **url**, and returns its
+        path
+
+        Raises
+        ------
+        NoResourcePathFoundError
+            If the entry has neither
+        KintaroWrongContentFormatError
+            If the resource could not be created
+        """
+        result: Union[ServiceError, KintaroResource]
+        if any(field in entry for field in ["mimetype", "name", "data"]):
+            result = self.resource_service.create_resource(
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                collection_id=collection_id,
+                file_info=entry,
+            )
+        elif entry.get("url"):
+            result = self.resource_service.create_resource_from_url_or_bytes(
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                collection_id=collection_id,
+                source=entry["url"],
+            )
+        else:
+            raise NoResourcePathFoundError(
+                "No information available to create resource"
+            )
 
-            fields.append(
-                dict(
-                    field_name=field_name,
-                    nested_field_values=[
-                        dict(
-                            fields=[
-                                dict(
-                                    field_name="file_path",
-                                    field_values=[
-                                        dict(
-                                            type="STRING", value=resource_path
-                                        )
-                                    ],
-                                )
-                            ]
-                        )
-                    ],
+        if isinstance(result, dict) and "errors" in result:
+            raise KintaroWrongContentFormatError(result)
+        return result.resource_path
+
+    def get_upload_executor(self) -> Executor:
+        """Returns the ``upload_executor``, a pool of ``max_upload_workers``
+        threads created on its first use unless one was given
+        """
+        with self.upload_executor_lock:
+            if self.upload_executor is None:
+                self.upload_executor = ThreadPoolExecutor(
+                    max_workers=self.max_upload_workers
                 )
-            )
-        return fields
+            return self.upload_executor
+
+    def get_reference_executor(self) -> Executor:
+        """Returns the ``reference_executor``, a pool of
+        ``max_reference_workers`` threads created on its first use unless one
+        was given
+        """
+        with self.reference_executor_lock:
+            if self.reference_executor is None:
+                self.reference_executor = ThreadPoolExecutor(
+                    max_workers=self.max_reference_workers
+                )
+            return self.reference_executor
 
     def convert_reference_field(
         self,
@@ -903,12 +3186,23 @@ class KintaroDocumentService(KintaroBaseService):
     ) -> Dict:
         to_create_list: List = []
         to_update_list: List = []
+        references: List = []
+        # position of each entry's document in the lists above
+        positions: List[Tuple[str, int]] = []
 
         for entry in field_value:
             if not entry:
                 continue
 
-            if not entry.get("collection_id") or "content" not in entry:
+            if not entry.get("collection_id"):
+                continue
+
+            # existing documents, like the ones written by
+            #  ``write_reference_plan``, are referred to as they are
+            if "content" not in entry:
+                if entry.get("document_id"):
+                    positions.append(("reference", len(references)))
+                    references.append(entry)
                 continue
 
             request_body: Dict = dict(
@@ -919,6 +3213,7 @@ class KintaroDocumentService(KintaroBaseService):
             )
 
             if entry.get("document_id"):
+                positions.append(("update", len(to_update_list)))
                 to_update_list.append(
                     dict(
                         document_id=entry["document_id"],
@@ -926,23 +3221,23 @@ class KintaroDocumentService(KintaroBaseService):
                     )
                 )
             else:
+                positions.append(("create", len(to_create_list)))
                 to_create_list.append(request_body)
 
-        nested_documents: List = []
+        written: Dict[str, List] = dict(reference=references)
         if to_create_list:
-            nested_documents.extend(
-                self.multi_document_action(
-                    action="create",
-                    request_bodies=to_create_list,
-                )
+            written["create"] = self.multi_document_action(
+                action="create",
+                request_bodies=to_create_list,
             )
         if to_update_list:
-            nested_documents.extend(
-                self.multi_document_action(
-                    action="update",
-                    request_bodies=to_update_list,
-                )
+            written["update"] = self.multi_document_action(
+                action="update",
+                request_bodies=to_update_list,
             )
+        nested_documents: List = [
+            written[kind][index] for kind, index in positions
+        ]
 
         referred_document: Union[KintaroDocument, ServiceError]
         field_entries: List = []
@@ -1015,38 +3310,17 @@ class KintaroDocumentService(KintaroBaseService):
         root_md5_info: Optional[Dict] = None,
         field_name_structure: Optional[Dict] = None,
     ) -> Dict:
-        field_type = KintaroFieldType.STRING
-        if schema_field_info.type == KintaroFieldType.NUMBER:
-            field_type = "INT"
-        elif schema_field_info.type == KintaroFieldType.BOOL:
-            field_type = "BOOL"
-
-        prepared_field_value = []
-        for entry in field_value:
-            entry = str(entry) if entry is not None else None
-            field_value = dict(
-                value=entry,
-                type=field_type,
-            )
-            if is_update and isinstance(field_name_structure, dict):
-                for key in field_name_structure.keys():
-                    val = (
-                        str(field_name_structure[key])
-                        if field_name_structure[key] is not None
-                        else None
-                    )
-                    if val == entry:
-                        if (
-                            isinstance(root_md5_info, dict)
-                            and key in root_md5_info
-                        ):
-                            field_value["root_md5"] = root_md5_info.get(key)
-                        break
-            prepared_field_value.append(field_value)
-
         return dict(
             field_name=field_name,
-            field_values=prepared_field_value,
+            field_values=KintaroFieldConverter(
+                schema_field=schema_field_info
+            ).encode_values(
+                field_value=field_value,
+                root_md5_info=root_md5_info if is_update else None,
+                field_name_structure=(
+                    field_name_structure if is_update else None
+                ),
+            ),
         )
 
     def get_structured_content_values(
@@ -1114,21 +3388,21 @@ class KintaroDocumentService(KintaroBaseService):
                 for eidx, entry in enumerate(field_value):
                     nested_result = self.get_structured_content_values(
                         doc_content=entry,
-                        schema_info=schema_field_info.schema_fields,  # noqa
+                        schema_info=schema_field.schema_fields,
                         md5_results=md5_results,
                     )
 
                     if is_repeated:
                         for nested_key in nested_result.keys():
-                            result[
-                                f"{field_name}.{eidx}.{nested_key}"
-                            ] = nested_result[nested_key]
+                            result[f"{field_name}.{eidx}.{nested_key}"] = (
+                                nested_result[nested_key]
+                            )
 
                     else:
                         for nested_key in nested_result.keys():
-                            result[
-                                f"{field_name}.{nested_key}"
-                            ] = nested_result[nested_key]
+                            result[f"{field_name}.{nested_key}"] = (
+                                nested_result[nested_key]
+                            )
 
             else:
                 if not any(
@@ -1,16 +1,30 @@
-from base64 import b64encode
-from io import BytesIO
+from binascii import b2a_base64
+from io import SEEK_END, BytesIO
+from math import ceil
+from tempfile import SpooledTemporaryFile
 from time import time
-from typing import Dict, Optional, Union
+from typing import IO, Dict, Optional, Tuple, Union
 from uuid import uuid4
 
 from magic import from_buffer
-from PIL import Image
 from requests import get as http_get
 
-from kintaro_client.constants import KintaroResourceType
+from kintaro_client.cache import KintaroResourceCache, KintaroResourceReadCache
+from kintaro_client.constants import (
+    KINTARO_IMAGE_QUALITY,
+    KINTARO_RESOURCE_CHUNK_SIZE,
+    KINTARO_RESOURCE_MAX_SIZE,
+    KINTARO_RESOURCE_SPOOL_SIZE,
+    KintaroResourceType,
+)
+from kintaro_client.exceptions import KintaroResourceTooLargeError
 from kintaro_client.models import KintaroResource
 from kintaro_client.services.base import KintaroBaseService
+from kintaro_client.transcoding import (
+    KINTARO_OPTIMIZED_IMAGE_TYPES,
+    KintaroImageTranscoder,
+    save_optimized_image,
+)
 from kintaro_client.utils import ServiceError, api_request
 
 
@@ -19,6 +33,15 @@ class KintaroResourceService(KintaroBaseService):
     **repos** and the **projects** services of the kintaro API
     """
 
+    # optimization of images uploaded by `create_resource_from_url_or_bytes`
+    transcoder: Optional[KintaroImageTranscoder] = None
+    image_quality: int = KINTARO_IMAGE_QUALITY
+    skip_optimized_images: bool = False
+    # resources created before, to not upload the same file twice
+    resource_cache: Optional[KintaroResourceCache] = None
+    # resources read before, returned by `get_resource` without a request
+    resource_read_cache: Optional[KintaroResourceReadCache] = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.service = self.service.resource()
@@ -29,8 +52,19 @@ class KintaroResourceService(KintaroBaseService):
         resource_path: str,
         resource_type: str = "RASTER_IMAGE",
         tmp: bool = True,
+        with_file_data: bool = True,
     ) -> Union[ServiceError, KintaroResource]:
-        """Fetches a resource given its path and type
+        """Fetches a resource given its path and type. With a
+        ``resource_read_cache``, resources are only fetched the first time,
+        see ``KintaroResourceReadCache``.
+
+        Parameters
+        ----------
+        with_file_data : bool
+            Whether the file data is needed. Without it, a cache in
+             ``metadata_only`` mode returns the resources it keeps without
+             their file data, with an empty ``file_data``, instead of
+             fetching them again.
 
         Raises
         ------
@@ -40,13 +74,32 @@ class KintaroResourceService(KintaroBaseService):
         if resource_type not in KintaroResourceType.KNOWN:
             raise ValueError(f"Invalid resource type {resource_type}")
 
-        return KintaroResource(
+        cache: Optional[KintaroResourceReadCache] = self.resource_read_cache
+        if cache is not None:
+            cached: Optional[KintaroResource] = cache.get_resource(
+                resource_path=resource_path,
+                resource_type=resource_type,
+                tmp=tmp,
+                with_file_data=with_file_data,
+            )
+            if cached is not None:
+                return cached
+
+        resource: KintaroResource = KintaroResource(
             initial_data=self.service.resourceGet(
                 resource_path=resource_path,
                 resource_type=resource_type,
                 tmp=tmp,
             ).execute()
         )
+        if cache is not None:
+            cache.set_resource(
+                resource_path=resource_path,
+                resource_type=resource_type,
+                tmp=tmp,
+                resource=resource,
+            )
+        return resource
 
     def create_resource_from_url_or_bytes(
         self,
@@ -54,52 +107,192 @@ class KintaroResourceService(KintaroBaseService):
         collection_id: str,
         repo_id: Optional[str] = None,
         workspace_id: Optional[str] = None,
+        max_size: Optional[int] = KINTARO_RESOURCE_MAX_SIZE,
     ) -> Union[ServiceError, KintaroResource]:
+        """Creates a resource from the contents of a file, or of the file at
+        an url. JPEG, PNG and WebP images are optimized first.
+
+        Downloads are streamed to a temporary file, kept in memory up to
+        ``KINTARO_RESOURCE_SPOOL_SIZE`` bytes, so only the base64 string sent
+        to kintaro has to fit in memory. Images are optimized by the
+        service's ``transcoder``, when it has one, see ``optimize_image``.
+
+        With a ``resource_cache``, the resource created before from the same
+        url or bytes is returned instead, and ``create_resource`` also finds
+        the ones created before with the same contents.
+
+        Parameters
+        ----------
+        max_size : Optional[int]
+            Maximum size of the file, in bytes. No limit when ``None``.
+
+        Raises
+        ------
+        KintaroResourceTooLargeError
+            If the file is larger than ``max_size``
+        """
+        cache_key: Optional[str] = (
+            self.resource_cache.get_source_key(source=source)
+            if self.resource_cache is not None
+            else None
+        )
+        cached: Optional[KintaroResource] = self.get_cached_resource(
+            collection_id=collection_id,
+            key=cache_key,
+            repo_id=repo_id,
+            workspace_id=workspace_id,
+        )
+        if cached is not None:
+            return cached
+
         mime_type: str
         file_name: str = f"{int(time() * 1000)}-{uuid4()}"
-        file_data: bytes = bytes("", encoding="utf-8")
 
-        if isinstance(source, bytes):
-            mime_type = from_buffer(source[:2049])
-            file_data = source
-        else:
-            with http_get(source, allow_redirects=True, stream=True) as res:
-                res.raise_for_status()
-                mime_type = res.headers.get("content-type").lower()
-                for chunk in res.iter_content(chunk_size=8192):
-                    file_data += chunk
-
-        if mime_type in ["image/jpeg", "image/png", "image/webp"]:
-            img = Image.open(BytesIO(file_data))
-            resulting_file_data = BytesIO()
-            if mime_type == "image/jpeg":
-                img.save(
-                    resulting_file_data,
-                    "JPEG",
-                    quality=85,
-                    progressive=True,
-                    optimize=True,
-                )
+        with SpooledTemporaryFile(
+            max_size=KINTARO_RESOURCE_SPOOL_SIZE
+        ) as downloaded_data:
+            file_data: IO
+            if isinstance(source, bytes):
+                if max_size is not None and len(source) > max_size:
+                    raise KintaroResourceTooLargeError(
+                        f"File of {len(source)} bytes, the maximum is "
+                        f"{max_size}"
+                    )
+                mime_type = from_buffer(source[:2049], mime=True)
+                file_data = BytesIO(source)
             else:
-                if mime_type == "image/webp":
-                    mime_type = "image/png"
-                    img = img.convert("RGB")
-                else:
-                    img = img.convert(mode="P", palette=Image.ADAPTIVE)
-                img.save(resulting_file_data, "PNG", optimize=True)
+                mime_type = self.download_file(
+                    url=source, file_data=downloaded_data, max_size=max_size
+                )
+                file_data = downloaded_data
 
-            file_data = resulting_file_data.getvalue()
+            with SpooledTemporaryFile(
+                max_size=KINTARO_RESOURCE_SPOOL_SIZE
+            ) as optimized_data:
+                if mime_type in KINTARO_OPTIMIZED_IMAGE_TYPES:
+                    file_data, mime_type = self.optimize_image(
+                        file_data=file_data,
+                        mime_type=mime_type,
+                        optimized_data=optimized_data,
+                    )
 
-        return self.create_resource(
+                encoded_data: str = self.encode_file(file_data=file_data)
+
+        resource: Union[ServiceError, KintaroResource] = self.create_resource(
             repo_id=repo_id or self.repo_id,
-            project_id=workspace_id or self.workspace_id,
+            workspace_id=workspace_id or self.workspace_id,
             collection_id=collection_id,
             file_info=dict(
                 mimetype=mime_type,
                 name=file_name,
-                data=b64encode(file_data).decode("utf-8"),
+                data=encoded_data,
             ),
         )
+        self.cache_resource(
+            collection_id=collection_id,
+            key=cache_key,
+            resource=resource,
+            repo_id=repo_id,
+            workspace_id=workspace_id,
+            mime_type=mime_type,
+        )
+        return resource
+
+    @staticmethod
+    def download_file(
+        url: str, file_data: IO, max_size: Optional[int] = None
+    ) -> str:
+        """Writes the file at an url to ``file_data``, one chunk at a time,
+        and returns its mime type
+
+        Raises
+        ------
+        KintaroResourceTooLargeError
+            If the file is larger than ``max_size``
+        """
+        with http_get(url, allow_redirects=True, stream=True) as res:
+            res.raise_for_status()
+            content_length: int = int(res.headers.get("content-length") or 0)
+            if max_size is not None and content_length > max_size:
+                raise KintaroResourceTooLargeError(
+                    f"File of {content_length} bytes at {url}, the maximum "
+                    f"is {max_size}"
+                )
+
+            size: int = 0
+            for chunk in res.iter_content(
+                chunk_size=KINTARO_RESOURCE_CHUNK_SIZE
+            ):
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise KintaroResourceTooLargeError(
+                        f"File at {url} larger than the maximum of "
+                        f"{max_size} bytes"
+                    )
+                file_data.write(chunk)
+
+            file_data.seek(0)
+            return res.headers.get("content-type").lower()
+
+    def optimize_image(
+        self, file_data: IO, mime_type: str, optimized_data: IO
+    ) -> Tuple[IO, str]:
+        """Returns the file to upload for an image and its mime type: the
+        optimized image, see ``save_optimized_image``, written to
+        ``optimized_data``, or ``file_data`` when it is kept as it is.
+
+        The image is optimized in the process pool of the service's
+        ``transcoder`` when there is one, and in the calling thread, with the
+        ``image_quality`` and ``skip_optimized_images`` settings, otherwise.
+        """
+        optimized_mime_type: Optional[str]
+        if self.transcoder is not None:
+            data: Optional[bytes]
+            data, optimized_mime_type = self.transcoder.transcode(
+                data=file_data.read(), mime_type=mime_type
+            )
+            if data is None:
+                optimized_mime_type = None
+            else:
+                optimized_data.write(data)
+        else:
+            optimized_mime_type = save_optimized_image(
+                source=file_data,
+                mime_type=mime_type,
+                target=optimized_data,
+                quality=self.image_quality,
+                skip_optimized=self.skip_optimized_images,
+            )
+
+        if optimized_mime_type is None:
+            file_data.seek(0)
+            return file_data, mime_type
+
+        optimized_data.seek(0)
+        return optimized_data, optimized_mime_type
+
+    @staticmethod
+    def encode_file(file_data: IO) -> str:
+        """Returns the base64 string of a file, encoded a chunk at a time
+        into a buffer of the final size, read from its current position
+        """
+        start: int = file_data.tell()
+        size: int = file_data.seek(0, SEEK_END) - start
+        file_data.seek(start)
+
+        encoded: bytearray = bytearray(4 * ceil(size / 3))
+        position: int = 0
+        # chunks are a multiple of 3 bytes long, so no padding is added
+        #  before the last one
+        while True:
+            chunk: bytes = file_data.read(KINTARO_RESOURCE_CHUNK_SIZE)
+            if not chunk:
+                break
+            encoded_chunk: bytes = b2a_base64(chunk, newline=False)
+            encoded[position : position + len(encoded_chunk)] = encoded_chunk
+            position += len(encoded_chunk)
+
+        return encoded.decode("ascii")
 
     @api_request
     def create_resource(
@@ -121,6 +314,10 @@ class KintaroResourceService(KintaroBaseService):
         - BLOB_FILE
         - RASTER_IMAGE
         - UNKNOWN
+
+        With a ``resource_cache``, a resource created before with the same
+        contents and mime type, in the same collection, is returned without
+        uploading the file again.
         """
         expected_resource_keys = ["name", "data", "mimetype"]
         if any(field not in file_info for field in expected_resource_keys):
@@ -142,7 +339,25 @@ class KintaroResourceService(KintaroBaseService):
             else KintaroResourceType.BLOB_FILE
         )
 
-        return KintaroResource(
+        cache_key: Optional[str] = (
+            self.resource_cache.get_content_key(
+                data=file_info.get("data"), mime_type=mimetype
+            )
+            if self.resource_cache is not None
+            else None
+        )
+        cached: Optional[KintaroResource] = self.get_cached_resource(
+            collection_id=collection_id,
+            key=cache_key,
+            repo_id=repo_id,
+            workspace_id=workspace_id,
+            file_data=file_info.get("data"),
+            file_name=file_info.get("name"),
+        )
+        if cached is not None:
+            return cached
+
+        resource: KintaroResource = KintaroResource(
             initial_data=dict(
                 file_data=file_info.get("data"),
                 **self.service.resourceCreate(
@@ -158,3 +373,74 @@ class KintaroResourceService(KintaroBaseService):
                 ).execute(),
             )
         )
+        self.cache_resource(
+            collection_id=collection_id,
+            key=cache_key,
+            resource=resource,
+            repo_id=repo_id,
+            workspace_id=workspace_id,
+            mime_type=mimetype,
+        )
+        return resource
+
+    def get_cached_resource(
+        self,
+        collection_id: str,
+        key: Optional[str],
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        **initial_data,
+    ) -> Optional[KintaroResource]:
+        """Returns the resource created before for the cache ``key``, see
+        ``KintaroResourceCache``, built from its cached path and mime type
+        and ``initial_data``, when the service has a ``resource_cache``
+        """
+        if self.resource_cache is None or key is None:
+            return None
+
+        cached: Optional[Tuple[str, Optional[str]]] = (
+            self.resource_cache.get_resource(
+                repo_id=repo_id or self.repo_id,
+                workspace_id=workspace_id or self.workspace_id,
+                collection_id=collection_id,
+                key=key,
+            )
+        )
+        if cached is None:
+            return None
+
+        resource_path, mime_type = cached
+        return KintaroResource(
+            initial_data=dict(
+                resource_path=resource_path,
+                mime_type=mime_type,
+                **initial_data,
+            )
+        )
+
+    def cache_resource(
+        self,
+        collection_id: str,
+        key: Optional[str],
+        resource: Union[ServiceError, KintaroResource],
+        repo_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        mime_type: Optional[str] = None,
+    ):
+        """Keeps the path of a created resource in the ``resource_cache``"""
+        if (
+            self.resource_cache is None
+            or key is None
+            or not isinstance(resource, KintaroResource)
+            or not resource.resource_path
+        ):
+            return
+
+        self.resource_cache.set_resource(
+            repo_id=repo_id or self.repo_id,
+            workspace_id=workspace_id or self.workspace_id,
+            collection_id=collection_id,
+            key=key,
+            resource_path=resource.resource_path,
+            mime_type=resource.mime_type or mime_type,
+        )
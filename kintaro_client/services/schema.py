@@ -76,15 +76,36 @@ class KintaroSchemaService(KintaroBaseService):
         if new_schema_id and new_schema_id != schema_id:
             request_body["updated_name"] = new_schema_id
 
-        return self.service.updateSchema(body=request_body).execute()
+        result = self.service.updateSchema(body=request_body).execute()
+        self.invalidate_cached_schema(
+            schema_id=schema_id, repo_id=repo_id or self.repo_id
+        )
+        return result
 
     @api_request
     def delete_schema(
         self, schema_id: str, repo_id: Optional[str] = None
     ) -> Optional[ServiceError]:
-        return self.service.deleteSchema(
+        result = self.service.deleteSchema(
             body=dict(
                 repo_id=repo_id or self.repo_id,
                 name=schema_id,
             )
         ).execute()
+        self.invalidate_cached_schema(
+            schema_id=schema_id, repo_id=repo_id or self.repo_id
+        )
+        return result
+
+    def invalidate_cached_schema(
+        self, schema_id: str, repo_id: Optional[str] = None
+    ):
+        """Removes the schema, and the collections using it, from the schema
+        cache shared with the document service
+        """
+        if self.schema_cache is not None:
+            self.schema_cache.invalidate_schema(
+                repo_id=repo_id or self.repo_id,
+                schema_id=schema_id,
+                base_url=self.get_base_url(),
+            )
@@ -0,0 +1,165 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from io import BytesIO
+from threading import Lock
+from typing import IO, Optional, Tuple, Union
+
+from PIL import Image
+
+from kintaro_client.constants import KINTARO_IMAGE_QUALITY
+
+
+# mime types of the images optimized before they are uploaded
+KINTARO_OPTIMIZED_IMAGE_TYPES = ["image/jpeg", "image/png", "image/webp"]
+
+
+def is_optimized_image(img: Image.Image, mime_type: str) -> bool:
+    """Whether an image is already saved the way ``save_optimized_image``
+    would: progressive JPEG or palette PNG
+    """
+    if mime_type == "image/jpeg":
+        return bool(img.info.get("progressive") or img.info.get("progression"))
+    if mime_type == "image/png":
+        return img.mode == "P"
+    return False
+
+
+def save_optimized_image(
+    source: Union[bytes, IO],
+    mime_type: str,
+    target: IO,
+    quality: int = KINTARO_IMAGE_QUALITY,
+    skip_optimized: bool = False,
+) -> Optional[str]:
+    """Writes the optimized version of an image to ``target`` and returns its
+    mime type: JPEG images are saved as progressive JPEG of the given
+    ``quality``, PNG and WebP ones as PNG.
+
+    Returns ``None``, without writing anything, when ``skip_optimized`` is
+    set and the image is already optimized.
+    """
+    img = Image.open(BytesIO(source) if isinstance(source, bytes) else source)
+    if skip_optimized and is_optimized_image(img=img, mime_type=mime_type):
+        return None
+
+    if mime_type == "image/jpeg":
+        img.save(
+            target,
+            "JPEG",
+            quality=quality,
+            progressive=True,
+            optimize=True,
+        )
+    else:
+        if mime_type == "image/webp":
+            mime_type = "image/png"
+            img = img.convert("RGB")
+        else:
+            img = img.convert(mode="P", palette=Image.ADAPTIVE)
+        img.save(target, "PNG", optimize=True)
+
+    return mime_type
+
+
+def transcode_image(
+    data: bytes,
+    mime_type: str,
+    quality: int = KINTARO_IMAGE_QUALITY,
+    skip_optimized: bool = False,
+) -> Tuple[Optional[bytes], str]:
+    """``save_optimized_image`` for worker processes, returning the
+    optimized image, or ``None`` when skipped, and its mime type
+    """
+    target: BytesIO = BytesIO()
+    optimized_mime_type: Optional[str] = save_optimized_image(
+        source=data,
+        mime_type=mime_type,
+        target=target,
+        quality=quality,
+        skip_optimized=skip_optimized,
+    )
+    if optimized_mime_type is None:
+        return None, mime_type
+    return target.getvalue(), optimized_mime_type
+
+
+class KintaroImageTranscoder:
+    """Optimizes images in a pool of processes, so the encoding of images
+    does not hold the GIL of the threads uploading resources, and several
+    images are encoded at once. Given to ``KintaroResourceService`` as its
+    ``transcoder``.
+
+    >>> with KintaroImageTranscoder(max_workers=4, quality=80) as transcoder:
+    ...     client = KintaroClient(
+    ...         repo_id=repo_id, workspace_id=workspace_id,
+    ...         transcoder=transcoder,
+    ...     )
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        quality: int = KINTARO_IMAGE_QUALITY,
+        skip_optimized: bool = False,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Parameters
+        ----------
+        max_workers : Optional[int]
+            Number of worker processes, the number of CPUs by default.
+        quality : int
+            Quality of the JPEG images, from 1 to 95.
+        skip_optimized : bool
+            Keep images that are already progressive JPEG or palette PNG as
+             they are, see ``is_optimized_image``.
+        executor : Optional[Executor]
+            Executor to run the encoding in instead of a new process pool.
+        """
+        self.max_workers = max_workers
+        self.quality = quality
+        self.skip_optimized = skip_optimized
+        self.executor = executor
+        self.own_executor: bool = executor is None
+        self.lock: Lock = Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"KintaroImageTranscoder<quality={self.quality}, "
+            f"workers={self.max_workers}>"
+        )
+
+    def __enter__(self) -> "KintaroImageTranscoder":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def get_executor(self) -> Executor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            return self.executor
+
+    def submit(self, data: bytes, mime_type: str) -> Future:
+        """Starts the optimization of an image, see ``transcode_image``"""
+        return self.get_executor().submit(
+            transcode_image,
+            data,
+            mime_type,
+            self.quality,
+            self.skip_optimized,
+        )
+
+    def transcode(
+        self, data: bytes, mime_type: str
+    ) -> Tuple[Optional[bytes], str]:
+        """Optimizes an image in the pool, waiting for the result"""
+        return self.submit(data=data, mime_type=mime_type).result()
+
+    def shutdown(self):
+        with self.lock:
+            if self.own_executor and self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
@@ -0,0 +1,105 @@
+from threading import local
+from typing import Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from google.auth.transport.requests import AuthorizedSession
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import build_http
+from httplib2 import Response as Httplib2Response
+from requests.adapters import HTTPAdapter
+
+from kintaro_client.constants import KINTARO_HTTP_POOL_SIZE
+
+
+_thread_state = local()
+
+
+def get_thread_http(http):
+    """Returns the current thread's own copy of an authorized ``http``
+    object, sharing its credentials but not its connections.
+
+    httplib2 connections can not be used by several threads at the same
+    time, so every thread making requests through the same service gets its
+    own. Objects that are not an ``AuthorizedHttp``, like the thread safe
+    ``KintaroRequestsHttp``, are returned unchanged.
+    """
+    if not isinstance(http, AuthorizedHttp):
+        return http
+
+    thread_https: Optional[WeakKeyDictionary] = getattr(
+        _thread_state, "https", None
+    )
+    if thread_https is None:
+        thread_https = _thread_state.https = WeakKeyDictionary()
+
+    if http not in thread_https:
+        thread_https[http] = AuthorizedHttp(
+            http.credentials, http=build_http()
+        )
+    return thread_https[http]
+
+
+class KintaroRequestsHttp:
+    """Thread safe replacement for the httplib2 ``Http`` object used by the
+    google services, backed by a ``requests`` session that keeps a pool of
+    keep-alive connections shared by every thread.
+    """
+
+    def __init__(
+        self,
+        credentials,
+        pool_size: int = KINTARO_HTTP_POOL_SIZE,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Parameters
+        ----------
+        credentials
+            The google auth credentials, refreshed by the session when needed.
+        pool_size : int
+            Maximum number of connections kept open per host.
+        timeout : Optional[float]
+            Number of seconds to wait for each response.
+        """
+        self.credentials = credentials
+        self.timeout = timeout
+        self.session = AuthorizedSession(credentials)
+
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body=None,
+        headers: Optional[Dict] = None,
+        redirections: int = 5,
+        connection_type=None,
+    ) -> Tuple[Httplib2Response, bytes]:
+        """Same signature and return value as ``httplib2.Http.request``"""
+        response = self.session.request(
+            method,
+            uri,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            allow_redirects=redirections > 0,
+        )
+
+        info: Dict[str, str] = {
+            key.lower(): value for key, value in response.headers.items()
+        }
+        # the content is already decoded by requests
+        info.pop("content-encoding", None)
+        info["status"] = str(response.status_code)
+
+        result: Httplib2Response = Httplib2Response(info)
+        result.reason = response.reason
+        return result, response.content
+
+    def close(self):
+        self.session.close()
@@ -1,39 +1,137 @@
+import os
 from functools import update_wrapper
-from json import loads as json_loads
-from typing import Any, Dict, NewType, Union
+from json import dumps as json_dumps, loads as json_loads
+from threading import Lock
+from typing import Any, Dict, List, NewType, Optional, Tuple, Union
 
 from google.auth import default
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError as GoogleApiHttpError
+from requests import get as http_get
 
+from kintaro_client.batch import (
+    KintaroBatch,
+    KintaroHttpRequest,
+    get_current_batch,
+    get_replaying_result,
+)
+from kintaro_client.cache import KintaroDiscoveryCache
 from kintaro_client.constants import (
     GOOGLE_AUTH_SCOPES,
     KINTARO_BACKEND_URI,
+    KINTARO_DISCOVERY_CACHE_TTL,
+    KINTARO_DISCOVERY_DOCUMENT,
     KINTARO_DISCOVERY_SERVICE_URL,
+    KINTARO_HTTP_POOL_SIZE,
     KINTARO_URI,
+    KintaroTransport,
 )
 from kintaro_client.exceptions import KintaroServiceInitError
+from kintaro_client.transport import KintaroRequestsHttp
 
 
 ServiceError = NewType("ServiceError", Dict)  # error from kintaro
 
+_shared_services: Dict[Tuple, Any] = {}
+_shared_services_lock: Lock = Lock()
+
+
+def get_kintaro_discovery_url(use_backend_url: bool = False) -> str:
+    return KINTARO_DISCOVERY_SERVICE_URL.replace(
+        "[BASE_URL]", KINTARO_BACKEND_URI if use_backend_url else KINTARO_URI
+    )
+
 
-def create_kintaro_service(use_backend_url: bool = False):
+def create_kintaro_service(
+    use_backend_url: bool = False,
+    cache_discovery: bool = True,
+    discovery_cache_dir: Optional[str] = None,
+    discovery_cache_ttl: int = KINTARO_DISCOVERY_CACHE_TTL,
+    discovery_document: Optional[Union[str, Dict]] = None,
+    scopes: Optional[List[str]] = None,
+    credentials=None,
+    transport: str = KintaroTransport.HTTPLIB2,
+    http_pool_size: int = KINTARO_HTTP_POOL_SIZE,
+):
     """Creates the google service `Resource` object that will handle the
     kintaro api calls.
+
+    Parameters
+    ----------
+    use_backend_url : bool
+        Use the backend kintaro host instead of the default one.
+    cache_discovery : bool
+        Keep a local copy of the discovery document, per discovery url, so
+        it is not downloaded every time a service is created.
+    discovery_cache_dir : Optional[str]
+        Directory for the cached discovery documents. Defaults to
+        ``KINTARO_DISCOVERY_CACHE_DIR``.
+    discovery_cache_ttl : int
+        Number of seconds a cached discovery document stays valid.
+    discovery_document : Optional[Union[str, Dict]]
+        A pre-bundled discovery document, either as a path to a json file,
+        its json string or the parsed dict. When provided (or set through
+        the ``KINTARO_DISCOVERY_DOCUMENT`` environment variable) the service
+        is built without any network call.
+    scopes : Optional[List[str]]
+        The auth scopes, ``GOOGLE_AUTH_SCOPES`` by default.
+    credentials
+        Already loaded google auth credentials. When not provided the
+        application default credentials are used.
+    transport : str
+        The http transport, one of ``KintaroTransport``. With **httplib2**
+        every thread gets its own connection, with **requests** all threads
+        share a pool of keep-alive connections.
+    http_pool_size : int
+        Maximum number of connections kept open by the **requests**
+        transport.
     """
-    document_url: str = KINTARO_DISCOVERY_SERVICE_URL.replace(
-        "[BASE_URL]", KINTARO_BACKEND_URI if use_backend_url else KINTARO_URI
-    )
+    if credentials is None:
+        credentials, project = default(scopes=scopes or GOOGLE_AUTH_SCOPES)
 
-    credentials, project = default(scopes=GOOGLE_AUTH_SCOPES)
+    if transport not in KintaroTransport.KNOWN:
+        raise ValueError(f"Invalid transport {transport}")
 
-    service = build(
-        "content",
-        "v1",
-        credentials=credentials,
-        discoveryServiceUrl=document_url,
-    )
+    auth_kwargs: Dict = dict(credentials=credentials)
+    if transport == KintaroTransport.REQUESTS:
+        auth_kwargs = dict(
+            http=KintaroRequestsHttp(
+                credentials=credentials, pool_size=http_pool_size
+            )
+        )
+
+    discovery_document = discovery_document or KINTARO_DISCOVERY_DOCUMENT
+    if discovery_document:
+        if isinstance(discovery_document, str) and os.path.isfile(
+            discovery_document
+        ):
+            with open(discovery_document, encoding="utf-8") as f:
+                discovery_document = f.read()
+
+        service = build_from_document(
+            discovery_document,
+            requestBuilder=KintaroHttpRequest,
+            **auth_kwargs,
+        )
+    else:
+        service = build(
+            "content",
+            "v1",
+            discoveryServiceUrl=get_kintaro_discovery_url(
+                use_backend_url=use_backend_url
+            ),
+            cache_discovery=cache_discovery,
+            requestBuilder=KintaroHttpRequest,
+            cache=(
+                KintaroDiscoveryCache(
+                    cache_dir=discovery_cache_dir,
+                    ttl=discovery_cache_ttl,
+                )
+                if cache_discovery
+                else None
+            ),
+            **auth_kwargs,
+        )
 
     if not service:
         raise KintaroServiceInitError(
@@ -44,6 +142,85 @@ def create_kintaro_service(use_backend_url: bool = False):
     return service
 
 
+def get_kintaro_service_key(
+    use_backend_url: bool = False,
+    scopes: Optional[List[str]] = None,
+    credentials=None,
+    discovery_document: Optional[Union[str, Dict]] = None,
+    transport: str = KintaroTransport.HTTPLIB2,
+    http_pool_size: int = KINTARO_HTTP_POOL_SIZE,
+    **kwargs,
+) -> Tuple:
+    """Returns the key of the service created by ``create_kintaro_service``
+    with the given arguments in ``get_kintaro_service``.
+
+    Given credentials are identified by their ``id``, which stays unique
+    while the service, that holds them, is kept.
+    """
+    if isinstance(discovery_document, dict):
+        discovery_document = json_dumps(discovery_document, sort_keys=True)
+
+    return (
+        get_kintaro_discovery_url(use_backend_url=use_backend_url),
+        tuple(sorted(scopes or GOOGLE_AUTH_SCOPES)),
+        id(credentials) if credentials is not None else None,
+        discovery_document,
+        transport,
+        http_pool_size if transport == KintaroTransport.REQUESTS else None,
+    )
+
+
+def get_kintaro_service(
+    use_backend_url: bool = False,
+    scopes: Optional[List[str]] = None,
+    **kwargs,
+):
+    """Returns the process wide service `Resource` for the given host, auth
+    scopes, credentials, discovery document and transport, creating it with
+    ``create_kintaro_service`` on first use.
+
+    Services and clients created with it share the same discovery document,
+    credentials and http transport.
+    """
+    scopes = sorted(scopes or GOOGLE_AUTH_SCOPES)
+    key: Tuple = get_kintaro_service_key(
+        use_backend_url=use_backend_url, scopes=scopes, **kwargs
+    )
+
+    with _shared_services_lock:
+        if key not in _shared_services:
+            _shared_services[key] = create_kintaro_service(
+                use_backend_url=use_backend_url,
+                scopes=scopes,
+                **kwargs,
+            )
+        return _shared_services[key]
+
+
+def clear_kintaro_services():
+    """Drops every service created by ``get_kintaro_service``"""
+    with _shared_services_lock:
+        _shared_services.clear()
+
+
+def save_kintaro_discovery_document(
+    file_path: str, use_backend_url: bool = False
+) -> str:
+    """Downloads the kintaro discovery document into ``file_path`` so it can
+    be shipped with an application and passed as ``discovery_document`` to
+    ``create_kintaro_service``.
+    """
+    response = http_get(
+        get_kintaro_discovery_url(use_backend_url=use_backend_url)
+    )
+    response.raise_for_status()
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(response.text)
+
+    return file_path
+
+
 def parse_google_api_error_dict(obj: Any):
     if isinstance(obj, (list, tuple)):
         return [parse_google_api_error_dict(obj=entry) for entry in obj]
@@ -78,6 +255,11 @@ def prepare_google_api_error_response(
 
 def api_request(fn):
     def wrapper_function(self, *args, **kwargs):
+        batch: Optional[KintaroBatch] = get_current_batch()
+        if batch is not None and get_replaying_result() is None:
+            # queued, it will run when the batch is executed
+            return batch.add(wrapper_function, self, *args, **kwargs)
+
         try:
             return fn(self, *args, **kwargs)
         except GoogleApiHttpError as e:
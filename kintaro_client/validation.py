@@ -0,0 +1,198 @@
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+from kintaro_client.constants import KintaroFieldType
+from kintaro_client.models import KintaroSchema, KintaroSchemaField
+
+
+def is_number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def is_bool(value: Any) -> bool:
+    return isinstance(value, bool) or (
+        isinstance(value, str) and value.lower() in ["true", "false"]
+    )
+
+
+def is_scalar(value: Any) -> bool:
+    """Whether a value can be written as text, like the converters do with
+    ``str``
+    """
+    return not isinstance(value, (dict, list, tuple, set))
+
+
+# type checks of the values of each field type, any scalar for the ones
+#  missing
+VALUE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    KintaroFieldType.NUMBER: is_number,
+    KintaroFieldType.BOOL: is_bool,
+    KintaroFieldType.NESTED: lambda value: isinstance(value, dict),
+    KintaroFieldType.REFERENCE: lambda value: isinstance(value, dict),
+    KintaroFieldType.IMAGE_FILE: lambda value: isinstance(value, (str, dict)),
+    KintaroFieldType.BLOB_FILE: lambda value: isinstance(value, (str, dict)),
+    KintaroFieldType.JSON: lambda value: True,
+}
+
+
+class KintaroFieldValidator:
+    """Checks of a schema field, resolved once when its schema is compiled"""
+
+    def __init__(self, schema_field: KintaroSchemaField):
+        self.name: str = schema_field.name
+        self.type: str = schema_field.type
+        self.required: bool = bool(schema_field.required)
+        self.repeated: bool = bool(schema_field.repeated)
+        self.check_value: Callable[[Any], bool] = VALUE_CHECKS.get(
+            schema_field.type, is_scalar
+        )
+
+        # set on every field, nested ones included, by ``KintaroSchema``
+        limits: Optional[Dict] = getattr(
+            schema_field, "character_limits", None
+        )
+        self.min_chars: Optional[int] = (limits or {}).get("min")
+        self.max_chars: Optional[int] = (limits or {}).get("max")
+
+        self.nested: Optional[KintaroSchemaValidator] = (
+            KintaroSchemaValidator(
+                schema_fields=schema_field.schema_fields or []
+            )
+            if schema_field.type == KintaroFieldType.NESTED
+            else None
+        )
+
+    def __repr__(self) -> str:
+        return f"KintaroFieldValidator<{self.name}>"
+
+    def validate(self, field_value: Any, path: str) -> List[str]:
+        """Returns the errors of a field value. Nested values are always
+        checked whole, as they are written whole.
+        """
+        if field_value is None or field_value == []:
+            return [f"{path}: is required"] if self.required else []
+
+        errors: List[str] = []
+        values: List = (
+            field_value if isinstance(field_value, list) else [field_value]
+        )
+        if isinstance(field_value, list) and not self.repeated:
+            errors.append(f"{path}: is not repeated, got a list")
+
+        for index, value in enumerate(values):
+            value_path: str = f"{path}.{index}" if self.repeated else path
+            if value is None:
+                continue
+
+            if not self.check_value(value):
+                errors.append(
+                    f"{value_path}: invalid {self.type} value "
+                    f"{type(value).__name__}"
+                )
+            elif self.nested is not None:
+                errors.extend(
+                    self.nested.validate(content=value, path=f"{value_path}.")
+                )
+            elif is_scalar(value):
+                # values are written as their text
+                text: str = str(value)
+                if self.min_chars is not None and len(text) < self.min_chars:
+                    errors.append(
+                        f"{value_path}: should have at least "
+                        f"{self.min_chars} characters"
+                    )
+                if self.max_chars is not None and len(text) > self.max_chars:
+                    errors.append(
+                        f"{value_path}: should have at most "
+                        f"{self.max_chars} characters"
+                    )
+
+        return errors
+
+
+class KintaroSchemaValidator:
+    """A schema compiled to check document content locally, before it is
+    sent to kintaro. See ``compile_validator``.
+    """
+
+    def __init__(self, schema_fields: List[KintaroSchemaField]):
+        self.fields: Dict[str, KintaroFieldValidator] = {
+            field.name: KintaroFieldValidator(schema_field=field)
+            for field in schema_fields
+        }
+
+    def __repr__(self) -> str:
+        return f"KintaroSchemaValidator<{', '.join(self.fields)}>"
+
+    def validate(
+        self, content: Dict, path: str = "", partial: bool = False
+    ) -> List[str]:
+        """Returns the errors of the content of a locale, as
+        ``"<field path>: <message>"`` strings, empty when it is valid.
+
+        With ``partial``, for updates, fields missing from the content are
+        not reported as required.
+        """
+        errors: List[str] = []
+        for field_name in content.keys():
+            if field_name not in self.fields:
+                errors.append(f"{path}{field_name}: unknown field")
+
+        for field_name, field in self.fields.items():
+            if field_name not in content and (partial or not field.required):
+                continue
+            errors.extend(
+                field.validate(
+                    field_value=content.get(field_name),
+                    path=f"{path}{field_name}",
+                )
+            )
+
+        return errors
+
+    def validate_document(
+        self, content: Dict[str, Dict], partial: bool = False
+    ) -> List[str]:
+        """Validates the content of a document, per locale. Only the root
+        content has to contain the required fields, and only when not
+        ``partial``.
+        """
+        errors: List[str] = []
+        for locale, locale_content in content.items():
+            errors.extend(
+                self.validate(
+                    content=locale_content or {},
+                    path=f"{locale}.",
+                    partial=partial or locale != "root",
+                )
+            )
+        return errors
+
+
+_compiled_validators: WeakKeyDictionary = WeakKeyDictionary()
+_compiled_validators_lock: Lock = Lock()
+
+
+def compile_validator(schema: KintaroSchema) -> KintaroSchemaValidator:
+    """Returns the validator of a schema, compiled on its first use and kept
+    for as long as the schema object exists
+    """
+    with _compiled_validators_lock:
+        validator: Optional[KintaroSchemaValidator] = _compiled_validators.get(
+            schema
+        )
+        if validator is None:
+            validator = KintaroSchemaValidator(
+                schema_fields=schema.schema_fields or []
+            )
+            _compiled_validators[schema] = validator
+        return validator
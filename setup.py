@@ -57,8 +57,9 @@ setup(
     # package_dir={"": "kintaro_client"},
     packages=find_packages(exclude=["tests*"]),
     install_requires=get_requirements(),
-    extras_requires={
+    extras_require={
         "dev": get_requirements(dev=True),
+        "async": ["httpx"],
     },
     include_package_data=True,
     zip_safe=False,
@@ -0,0 +1,253 @@
+import json
+import re
+from itertools import count
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
+from googleapiclient.discovery import build_from_document
+from httplib2 import Response
+
+from kintaro_client.batch import KintaroHttpRequest
+from kintaro_client.client import KintaroClient
+from kintaro_client.constants import KintaroFieldType
+
+
+DISCOVERY_API_METHODS: Dict[str, List[str]] = {
+    "documents": [
+        "rpcDocumentGet",
+        "createDocument",
+        "multiDocumentUpdate",
+        "getFieldsByDescriptor",
+        "editField",
+        "deleteDocument",
+        "searchDocuments",
+    ],
+    "collections": ["getCollection"],
+    "schemas": ["getSchema", "updateSchema"],
+    "resource": ["resourceCreate", "resourceGet"],
+    "projects": ["rpcGetProject"],
+    "repos": ["getRepo"],
+}
+
+PAGE_SCHEMA: Dict = dict(
+    name="Page",
+    schema_fields=[
+        dict(name="title", type=KintaroFieldType.STRING, translatable=True),
+        dict(name="image", type=KintaroFieldType.IMAGE_FILE),
+        dict(name="author", type=KintaroFieldType.REFERENCE),
+    ],
+)
+AUTHOR_SCHEMA: Dict = dict(
+    name="Author",
+    schema_fields=[dict(name="name", type=KintaroFieldType.STRING)],
+)
+SCHEMAS: Dict[str, Dict] = dict(pages=PAGE_SCHEMA, authors=AUTHOR_SCHEMA)
+
+
+def build_discovery_document() -> Dict:
+    def build_method(name: str) -> Dict:
+        return dict(
+            id=name,
+            path=name,
+            httpMethod="POST",
+            request={"$ref": "Message"},
+            response={"$ref": "Message"},
+            parameters={},
+        )
+
+    document: Dict = dict(
+        kind="discovery#restDescription",
+        discoveryVersion="v1",
+        id="content:v1",
+        name="content",
+        version="v1",
+        rootUrl="https://kintaro.test/",
+        servicePath="_ah/api/content/v1/",
+        batchPath="batch",
+        protocol="rest",
+        schemas=dict(Message=dict(id="Message", type="object")),
+        resources={
+            namespace: dict(
+                methods={name: build_method(name) for name in names}
+            )
+            for namespace, names in DISCOVERY_API_METHODS.items()
+        },
+    )
+    document["resources"]["resource"]["methods"]["resourceGet"].update(
+        httpMethod="GET",
+        parameters={
+            name: dict(type="string", location="query")
+            for name in ["resource_path", "resource_type", "tmp"]
+        },
+    )
+    return document
+
+
+class FakeKintaro:
+    """Answers the requests of a kintaro service, sent one by one or in http
+    batches, without any network call.
+
+    ``routes`` map api methods, like ``createDocument``, to functions
+    returning the status and the json response for a request body. Every
+    request is recorded in ``calls``.
+    """
+
+    def __init__(self):
+        self.calls: List[Tuple[str, Dict]] = []
+        self.batches: int = 0
+        self.lock: Lock = Lock()
+        self.ids: Iterator[int] = count(1)
+        self.routes: Dict[str, Callable[[Dict], Tuple[int, Any]]] = dict(
+            getCollection=self.get_collection,
+            getSchema=lambda body: (200, SCHEMAS["pages"]),
+            createDocument=self.create_document,
+            multiDocumentUpdate=lambda body: (200, {}),
+            rpcDocumentGet=self.get_document,
+            resourceCreate=self.create_resource,
+        )
+
+    def get_calls(self, method: str) -> List[Dict]:
+        return [body for name, body in self.calls if name == method]
+
+    def answer(self, method: str, body: Dict) -> Tuple[int, Any]:
+        with self.lock:
+            self.calls.append((method, body))
+        route: Optional[Callable] = self.routes.get(method)
+        if route is None:
+            return 200, {}
+        return route(body)
+
+    @staticmethod
+    def get_collection(body: Dict) -> Tuple[int, Dict]:
+        return 200, dict(
+            collection_id=body["collection_id"],
+            schema=SCHEMAS[body["collection_id"]],
+        )
+
+    def create_document(self, body: Dict) -> Tuple[int, Dict]:
+        with self.lock:
+            document_id: str = f"document-{next(self.ids)}"
+        return 200, dict(
+            document_id=document_id,
+            collection_id=body["collection_id"],
+            repo_id=body["repo_id"],
+            project_id=body["project_id"],
+        )
+
+    @staticmethod
+    def get_document(body: Dict) -> Tuple[int, Dict]:
+        return 200, dict(
+            document_id=body["document_id"],
+            collection_id=body["collection_id"],
+            content_json="{}",
+        )
+
+    def create_resource(self, body: Dict) -> Tuple[int, Dict]:
+        with self.lock:
+            resource_id: int = next(self.ids)
+        return 200, dict(
+            resource_path=f"/resources/{resource_id}/{body['file_name']}",
+            mime_type=body["file_type"],
+        )
+
+    @staticmethod
+    def error(status: int, message: str) -> Tuple[int, Dict]:
+        return status, dict(error=dict(code=status, message=message))
+
+
+class FakeKintaroHttp:
+    """The http object of the fake service"""
+
+    def __init__(self, kintaro: FakeKintaro):
+        self.kintaro = kintaro
+
+    def request(
+        self, uri: str, method: str = "GET", body=None, headers=None, **kwargs
+    ):
+        url = urlparse(uri)
+        if url.path.endswith("/batch"):
+            return self.send_batch(body=body, headers=headers)
+
+        status, content = self.kintaro.answer(
+            method=url.path.rsplit("/", 1)[-1],
+            body=json.loads(body) if body else dict(parse_qsl(url.query)),
+        )
+        return (
+            Response(dict(status=str(status))),
+            json.dumps(content).encode("utf-8"),
+        )
+
+    def send_batch(self, body, headers: Dict):
+        self.kintaro.batches += 1
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        boundary: str = headers["content-type"].split("boundary=")[1]
+        responses: List[str] = []
+        for part in body.replace("\r\n", "\n").split(
+            "--" + boundary.strip('"')
+        ):
+            content_id = re.search(r"Content-ID: <([^>]+)>", part)
+            if content_id is None:
+                continue
+
+            request: str = part.split("\n\n", 1)[1]
+            request_line, _, request = request.partition("\n")
+            request_body: str = request.partition("\n\n")[2]
+            path: str = urlparse(request_line.split(" ")[1]).path
+            status, content = self.kintaro.answer(
+                method=path.rsplit("/", 1)[-1],
+                body=json.loads(request_body) if request_body.strip() else {},
+            )
+            responses.append(
+                "--response\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id.group(1)}>\r\n\r\n"
+                f"HTTP/1.1 {status} Status\r\n"
+                "Content-Type: application/json\r\n\r\n"
+                f"{json.dumps(content)}\r\n"
+            )
+
+        return (
+            Response(
+                {
+                    "status": "200",
+                    "content-type": 'multipart/mixed; boundary="response"',
+                }
+            ),
+            ("".join(responses) + "--response--").encode("utf-8"),
+        )
+
+
+@pytest.fixture
+def kintaro() -> FakeKintaro:
+    return FakeKintaro()
+
+
+@pytest.fixture
+def make_client(kintaro: FakeKintaro) -> Callable[..., KintaroClient]:
+    """Creates clients answered by ``kintaro``, for the host of
+    ``root_url``, without the shared caches unless given
+    """
+
+    def make(root_url: str = "https://kintaro.test/", **kwargs):
+        return KintaroClient(
+            repo_id="repo",
+            workspace_id="workspace",
+            service=build_from_document(
+                dict(build_discovery_document(), rootUrl=root_url),
+                http=FakeKintaroHttp(kintaro=kintaro),
+                requestBuilder=KintaroHttpRequest,
+            ),
+            **dict(
+                dict(use_schema_cache=False, use_fingerprint_cache=False),
+                **kwargs,
+            ),
+        )
+
+    return make
+
+
+@pytest.fixture
+def client(make_client: Callable[..., KintaroClient]) -> KintaroClient:
+    return make_client()
@@ -0,0 +1,63 @@
+import asyncio
+import json
+import threading
+from base64 import b64encode
+
+import httpx
+
+from kintaro_client.async_client import AsyncKintaroClient
+from kintaro_client.constants import KintaroReturnDocument
+
+
+def test_async_client_uploads_files_once_outside_the_loop(client, kintaro):
+    prepare_request_bodies = client.documents.prepare_request_bodies
+    threads = []
+
+    def record_thread(**kwargs):
+        threads.append(threading.get_ident())
+        return prepare_request_bodies(**kwargs)
+
+    client.documents.prepare_request_bodies = record_thread
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, content = kintaro.answer(
+            method=request.url.path.rsplit("/", 1)[-1],
+            body=json.loads(request.content) if request.content else {},
+        )
+        return httpx.Response(status, json=content)
+
+    async def create_documents():
+        async_client = AsyncKintaroClient(
+            repo_id="repo", workspace_id="workspace", client=client
+        )
+        async_client.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        async with async_client:
+            return await asyncio.gather(
+                *[
+                    async_client.documents.create_document(
+                        collection_id="pages",
+                        content=dict(
+                            root=dict(
+                                title=f"Page {index}",
+                                image=dict(
+                                    data=b64encode(b"image").decode("ascii"),
+                                    mimetype="image/gif",
+                                    name=f"image-{index}.gif",
+                                ),
+                            )
+                        ),
+                        return_document=KintaroReturnDocument.SUMMARY,
+                    )
+                    for index in range(3)
+                ]
+            )
+
+    documents = asyncio.run(create_documents())
+
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
+    assert len(documents) == 3
+    assert len(kintaro.get_calls("resourceCreate")) == 3
+    assert len(kintaro.get_calls("createDocument")) == 3
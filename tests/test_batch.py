@@ -0,0 +1,164 @@
+from base64 import b64encode
+
+from kintaro_client.constants import KintaroReturnDocument
+from kintaro_client.models import KintaroDocumentSummary, KintaroSchema
+
+
+def test_batch_sends_the_calls_in_one_http_batch(client, kintaro):
+    with client.batch() as batch:
+        schema = client.schemas.get_schema(schema_id="Page")
+        collection = client.collections.get_collection(collection_id="pages")
+    batch.execute()
+
+    assert kintaro.batches == 1
+    assert isinstance(schema.result(), KintaroSchema)
+    assert schema.result().name == "Page"
+    assert collection.result().collection_id == "pages"
+
+
+def test_batch_returns_the_errors_of_the_calls(client, kintaro):
+    kintaro.routes["getSchema"] = lambda body: kintaro.error(404, "Not found")
+
+    with client.batch():
+        schema = client.schemas.get_schema(schema_id="Missing")
+
+    assert schema.result()["errors"][0]["message"] == "Not found"
+
+
+def test_batch_replays_calls_that_need_several_requests(client, kintaro):
+    with client.batch():
+        results = [
+            client.documents.create_document(
+                collection_id="pages",
+                content=dict(root=dict(title=f"Page {index}")),
+                return_document=KintaroReturnDocument.SUMMARY,
+            )
+            for index in range(3)
+        ]
+
+    # the collections in one batch, then the documents in another
+    assert kintaro.batches == 2
+    assert [result.result().document_id for result in results] == [
+        "document-1",
+        "document-2",
+        "document-3",
+    ]
+
+
+def test_batch_uploads_files_and_writes_references_once(client, kintaro):
+    with client.batch():
+        result = client.documents.create_document(
+            collection_id="pages",
+            content=dict(
+                root=dict(
+                    title="Page",
+                    image=dict(
+                        data=b64encode(b"image").decode("ascii"),
+                        mimetype="image/gif",
+                        name="image.gif",
+                    ),
+                    author=dict(
+                        collection_id="authors", content=dict(name="Author")
+                    ),
+                )
+            ),
+            return_document=KintaroReturnDocument.SUMMARY,
+        )
+
+    assert isinstance(result.result(), KintaroDocumentSummary)
+    assert len(kintaro.get_calls("resourceCreate")) == 1
+    assert [
+        body["collection_id"] for body in kintaro.get_calls("createDocument")
+    ] == ["authors", "pages"]
+
+    fields = {
+        field["field_name"]: field
+        for field in kintaro.get_calls("createDocument")[1]["contents"][
+            "fields"
+        ]
+    }
+    image_path = fields["image"]["nested_field_values"][0]["fields"][0]
+    assert image_path["field_values"][0]["value"].endswith("/image.gif")
+    author_id = fields["author"]["nested_field_values"][0]["fields"][2]
+    assert author_id["field_values"][0]["value"] == "document-1"
+
+
+def test_batch_replays_field_updates(client, kintaro):
+    with client.batch():
+        result = client.documents.update_document_field(
+            collection_id="pages",
+            document_id="document-1",
+            field_name="title",
+            field_values=dict(root="Page", nl_nl="Pagina"),
+        )
+
+    assert result.result() is None
+    updates = kintaro.get_calls("multiDocumentUpdate")
+    assert len(updates) == 1
+    assert [
+        contents["locale"]
+        for contents in updates[0]["updated_content"][0]["contents"]
+    ] == ["root", "nl_nl"]
+
+
+def test_batch_replays_bulk_updates_and_uploads_once(client, kintaro):
+    with client.batch():
+        result = client.documents.update_documents(
+            collection_id="pages",
+            documents={
+                f"document-{index}": dict(
+                    root=dict(
+                        image=dict(
+                            data=b64encode(b"image").decode("ascii"),
+                            mimetype="image/gif",
+                            name="image.gif",
+                        )
+                    )
+                )
+                for index in range(3)
+            },
+        )
+
+    assert result.result() == {f"document-{index}": None for index in range(3)}
+    assert len(kintaro.get_calls("resourceCreate")) == 3
+    assert len(kintaro.get_calls("multiDocumentUpdate")) == 1
+
+
+def test_batch_queues_the_calls_of_multi_document_action(client, kintaro):
+    with client.batch():
+        results = client.documents.multi_document_action(
+            request_bodies=[
+                dict(
+                    collection_id="pages",
+                    content=dict(root=dict(title=f"Page {index}")),
+                )
+                for index in range(3)
+            ],
+            validate=True,
+        )
+        assert kintaro.get_calls("createDocument") == []
+
+    assert kintaro.batches == 2
+    assert [result.result().document_id for result in results] == [
+        "document-1",
+        "document-2",
+        "document-3",
+    ]
+
+
+def test_batch_replays_nested_field_updates(client, kintaro):
+    with client.batch():
+        result = client.documents.update_document_field(
+            collection_id="pages",
+            document_id="document-1",
+            field_name="image.0.file_path",
+            field_values=dict(
+                root="/resources/1/image.gif", nl_nl="/resources/2/image.gif"
+            ),
+        )
+
+    assert result.result() is None
+    assert [body["locale"] for body in kintaro.get_calls("editField")] == [
+        "root",
+        "nl_nl",
+    ]
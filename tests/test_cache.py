@@ -0,0 +1,268 @@
+from base64 import b64encode
+from hashlib import md5, sha256
+
+from kintaro_client.cache import (
+    KintaroFingerprintCache,
+    KintaroResourceCache,
+    KintaroResourceReadCache,
+    KintaroSchemaCache,
+)
+from kintaro_client.constants import KintaroFieldType
+from kintaro_client.models import KintaroSchema
+
+
+def set_resource(cache: KintaroResourceCache, key: str):
+    cache.set_resource(
+        repo_id="repo",
+        workspace_id="workspace",
+        collection_id="pages",
+        key=key,
+        resource_path=f"/resources/{key}",
+        mime_type="image/gif",
+    )
+
+
+def get_resource(cache: KintaroResourceCache, key: str):
+    return cache.get_resource(
+        repo_id="repo",
+        workspace_id="workspace",
+        collection_id="pages",
+        key=key,
+    )
+
+
+def test_resource_cache_hits_and_misses(tmp_path):
+    cache = KintaroResourceCache(path=str(tmp_path / "resources.sqlite"))
+    set_resource(cache=cache, key="one")
+
+    assert get_resource(cache=cache, key="one") == (
+        "/resources/one",
+        "image/gif",
+    )
+    assert get_resource(cache=cache, key="two") is None
+    assert cache.stats() == dict(hits=1, misses=1, evictions=0, size=1)
+
+
+def test_resource_cache_evicts_the_least_recently_used(tmp_path):
+    path: str = str(tmp_path / "resources.sqlite")
+    cache = KintaroResourceCache(path=path, max_size=2)
+    for key in ["one", "two", "one", "three"]:
+        set_resource(cache=cache, key=key)
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert get_resource(cache=cache, key="two") is None
+    assert get_resource(cache=cache, key="three") is not None
+
+    cache.delete(
+        repo_id="repo",
+        workspace_id="workspace",
+        collection_id="pages",
+        key="one",
+    )
+    cache.close()
+    assert len(KintaroResourceCache(path=path, max_size=2)) == 1
+
+
+def test_resource_cache_content_keys_do_not_change():
+    # keys are persisted, so hashing in chunks gives the keys of before
+    data: str = b64encode(b"image" * 100000).decode("ascii")
+
+    assert (
+        KintaroResourceCache.get_content_key(data=data, mime_type="Image/GIF")
+        == "sha256:" + sha256(f"image/gif:{data}".encode("utf-8")).hexdigest()
+    )
+
+
+def test_create_resource_does_not_upload_cached_files(
+    client, kintaro, tmp_path
+):
+    client.resources.resource_cache = KintaroResourceCache(
+        path=str(tmp_path / "resources.sqlite")
+    )
+    file_info = dict(
+        name="image.gif",
+        data=b64encode(b"image").decode("ascii"),
+        mimetype="image/gif",
+    )
+
+    created = client.resources.create_resource(
+        collection_id="pages", file_info=file_info
+    )
+    cached = client.resources.create_resource(
+        collection_id="pages", file_info=file_info
+    )
+
+    assert len(kintaro.get_calls("resourceCreate")) == 1
+    assert cached.resource_path == created.resource_path
+    assert client.resources.resource_cache.stats()["hits"] == 1
+
+
+def test_get_resource_reads_through_the_read_cache(client, kintaro):
+    kintaro.routes["resourceGet"] = lambda body: (
+        200,
+        dict(
+            resource_path=body["resource_path"],
+            file_data="aW1hZ2U=",
+            mime_type="image/gif",
+        ),
+    )
+    client.resources.resource_read_cache = KintaroResourceReadCache()
+
+    resources = [
+        client.resources.get_resource(resource_path=resource_path)
+        for resource_path in ["/resources/1", "/resources/1", "/resources/2"]
+    ]
+
+    assert [resource.file_data for resource in resources] == ["aW1hZ2U="] * 3
+    assert len(kintaro.get_calls("resourceGet")) == 2
+    assert client.resources.resource_read_cache.stats() == dict(
+        hits=1,
+        misses=2,
+        evictions=0,
+        size=2,
+        disk_hits=0,
+        size_bytes=16,
+        disk_size_bytes=0,
+    )
+
+
+def test_resource_read_cache_only_counts_the_bytes_it_keeps():
+    cache = KintaroResourceReadCache(max_size=0)
+    cache.set(("/resources/1", "RASTER_IMAGE", True), dict(file_data="data"))
+
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+    cache = KintaroResourceReadCache(max_bytes=6)
+    for index in range(3):
+        cache.set(
+            (f"/resources/{index}", "RASTER_IMAGE", True),
+            dict(file_data="data"),
+        )
+
+    assert len(cache) == 1
+    assert cache.size_bytes == 4
+
+
+def create_page(client):
+    return client.documents.create_document(
+        collection_id="pages", content=dict(root=dict(title="Page"))
+    )
+
+
+def test_schema_cache_reads_schemas_until_they_change(make_client, kintaro):
+    client = make_client(schema_cache=KintaroSchemaCache())
+
+    create_page(client=client)
+    create_page(client=client)
+    assert len(kintaro.get_calls("getCollection")) == 1
+
+    client.schemas.update_schema(schema_id="Page", fields=[])
+    create_page(client=client)
+    assert len(kintaro.get_calls("getCollection")) == 2
+
+
+def test_schema_cache_keeps_the_schemas_of_each_host(make_client, kintaro):
+    cache = KintaroSchemaCache()
+    for root_url in ["https://kintaro.test/", "https://backend.test/"]:
+        client = make_client(root_url=root_url, schema_cache=cache)
+        create_page(client=client)
+        create_page(client=client)
+
+    assert len(kintaro.get_calls("getCollection")) == 2
+    assert cache.hits == 2
+
+
+def test_fingerprint_cache_keeps_a_fingerprint_per_root_version(make_client):
+    cache = KintaroFingerprintCache()
+    documents = make_client(fingerprint_cache=cache).documents
+    schema = KintaroSchema(
+        initial_data=dict(
+            name="Page",
+            schema_fields=[
+                dict(
+                    name="title",
+                    type=KintaroFieldType.STRING,
+                    translatable=True,
+                )
+            ],
+        )
+    )
+
+    def get_fingerprint(updated_at):
+        return documents.get_root_fingerprint(
+            root_content=dict(title="Page"),
+            schema=schema,
+            collection_id="pages",
+            document_id="document-1",
+            updated_at=updated_at,
+        )
+
+    fingerprint = get_fingerprint(updated_at="1")
+    assert get_fingerprint(updated_at="1") is fingerprint
+    assert get_fingerprint(updated_at="2") is not fingerprint
+    assert get_fingerprint(updated_at=None) is not get_fingerprint(
+        updated_at=None
+    )
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_translation_updates_reuse_the_root_fingerprint(make_client, kintaro):
+    cache = KintaroFingerprintCache()
+    documents = make_client(fingerprint_cache=cache).documents
+    kintaro.routes["rpcDocumentGet"] = lambda body: (
+        200,
+        dict(
+            document_id=body["document_id"],
+            collection_id=body["collection_id"],
+            content_json='{"title": "Page"}',
+            mod_info=dict(updated_at="1"),
+        ),
+    )
+
+    for title in ["Pagina", "Pagina 2"]:
+        documents.update_document(
+            collection_id="pages",
+            document_id="document-1",
+            content=dict(nl_nl=dict(title=title)),
+        )
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    root_md5s = [
+        body["updated_content"][0]["contents"][0]["fields"][0][
+            "field_values"
+        ][0]["root_md5"]
+        for body in kintaro.get_calls("multiDocumentUpdate")
+    ]
+    assert root_md5s == [md5(b"Page").hexdigest()] * 2
+
+
+def test_metadata_only_read_cache_fetches_the_file_data_again(
+    client, kintaro
+):
+    kintaro.routes["resourceGet"] = lambda body: (
+        200,
+        dict(
+            resource_path=body["resource_path"],
+            file_data="aW1hZ2U=",
+            mime_type="image/gif",
+        ),
+    )
+    client.resources.resource_read_cache = KintaroResourceReadCache(
+        metadata_only=True
+    )
+
+    fetched = client.resources.get_resource(resource_path="/resources/1")
+    refetched = client.resources.get_resource(resource_path="/resources/1")
+    cached = client.resources.get_resource(
+        resource_path="/resources/1", with_file_data=False
+    )
+
+    assert [resource.file_data for resource in [fetched, refetched]] == [
+        "aW1hZ2U=",
+        "aW1hZ2U=",
+    ]
+    assert cached.file_data is None
+    assert cached.mime_type == "image/gif"
+    assert len(kintaro.get_calls("resourceGet")) == 2
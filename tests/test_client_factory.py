@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from kintaro_client import utils
+from kintaro_client.client import KintaroClientFactory
+
+
+@pytest.fixture
+def created(monkeypatch):
+    services = []
+
+    def create_kintaro_service(**kwargs):
+        services.append(MagicMock())
+        return services[-1]
+
+    monkeypatch.setattr(
+        utils, "create_kintaro_service", create_kintaro_service
+    )
+    utils.clear_kintaro_services()
+    yield services
+    utils.clear_kintaro_services()
+
+
+def test_get_kintaro_service_reuses_the_service_of_the_same_key(created):
+    credentials = object()
+
+    service = utils.get_kintaro_service(credentials=credentials)
+    assert utils.get_kintaro_service(credentials=credentials) is service
+    assert (
+        utils.get_kintaro_service(
+            credentials=credentials,
+            scopes=list(reversed(utils.GOOGLE_AUTH_SCOPES)),
+        )
+        is service
+    )
+    assert utils.get_kintaro_service(credentials=object()) is not service
+    assert (
+        utils.get_kintaro_service(
+            credentials=credentials, use_backend_url=True
+        )
+        is not service
+    )
+    assert len(created) == 3
+
+    utils.clear_kintaro_services()
+    assert utils.get_kintaro_service(credentials=credentials) is not service
+
+
+def test_client_factories_share_the_service_and_their_clients(created):
+    credentials = object()
+    factory = KintaroClientFactory(credentials=credentials)
+    other_factory = KintaroClientFactory(credentials=credentials)
+
+    client = factory.get_client(repo_id="repo", workspace_id="one")
+
+    assert factory.get_client(repo_id="repo", workspace_id="one") is client
+    assert other_factory.service is factory.service
+    assert (
+        factory.get_client(repo_id="repo", workspace_id="two").service
+        is client.service
+        is factory.service
+    )
+    assert len(created) == 1
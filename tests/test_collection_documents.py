@@ -0,0 +1,119 @@
+import pytest
+
+from kintaro_client.exceptions import KintaroRequestError
+
+
+def search_documents(count):
+    def search(body):
+        options = body["result_options"]
+        start = options["offset"]
+        stop = start + options["limit"] if options["limit"] else count
+        return 200, dict(
+            document_list=dict(
+                documents=[
+                    dict(document_id=f"document-{index}", content_json="{}")
+                    for index in range(start, min(stop, count))
+                ]
+            )
+        )
+
+    return search
+
+
+def get_offsets(kintaro):
+    return [
+        body["result_options"]["offset"]
+        for body in kintaro.get_calls("searchDocuments")
+    ]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_collection_documents_reads_pages(client, kintaro, prefetch):
+    kintaro.routes["searchDocuments"] = search_documents(count=7)
+
+    documents = client.documents.iter_collection_documents(
+        collection_id="pages", page_size=3, prefetch=prefetch
+    )
+
+    assert [document.document_id for document in documents] == [
+        f"document-{index}" for index in range(7)
+    ]
+    assert get_offsets(kintaro=kintaro) == [0, 3, 6]
+
+
+def test_iter_collection_documents_reads_one_page_at_a_time(client, kintaro):
+    kintaro.routes["searchDocuments"] = search_documents(count=6)
+
+    documents = client.documents.iter_collection_documents(
+        collection_id="pages", page_size=3
+    )
+
+    assert next(documents).document_id == "document-0"
+    assert get_offsets(kintaro=kintaro) == [0]
+    assert len(list(documents)) == 5
+    assert get_offsets(kintaro=kintaro) == [0, 3, 6]
+
+
+def test_iter_collection_documents_raises_the_errors(client, kintaro):
+    kintaro.routes["searchDocuments"] = lambda body: kintaro.error(
+        500, "Backend error"
+    )
+
+    with pytest.raises(KintaroRequestError):
+        list(client.documents.iter_collection_documents(collection_id="pages"))
+
+
+def count_documents(kintaro, total_document_count):
+    kintaro.routes["getCollection"] = lambda body: (
+        200,
+        dict(
+            collection_id=body["collection_id"],
+            total_document_count=total_document_count,
+        ),
+    )
+
+
+def test_get_all_collection_documents_reads_the_pages_at_once(
+    client, kintaro
+):
+    kintaro.routes["searchDocuments"] = search_documents(count=7)
+    count_documents(kintaro=kintaro, total_document_count=7)
+
+    documents = client.documents.get_all_collection_documents(
+        collection_id="pages", page_size=3, max_workers=3
+    )
+
+    assert [document.document_id for document in documents] == [
+        f"document-{index}" for index in range(7)
+    ]
+    assert sorted(get_offsets(kintaro=kintaro)) == [0, 3, 6]
+
+
+def test_get_all_collection_documents_reads_the_added_pages(client, kintaro):
+    kintaro.routes["searchDocuments"] = search_documents(count=10)
+    count_documents(kintaro=kintaro, total_document_count=4)
+
+    documents = client.documents.get_all_collection_documents(
+        collection_id="pages", page_size=3, max_workers=2
+    )
+
+    assert [document.document_id for document in documents] == [
+        f"document-{index}" for index in range(10)
+    ]
+    # the two pages counted, then rounds of max_workers pages
+    assert sorted(get_offsets(kintaro=kintaro)) == [0, 3, 6, 9]
+
+
+def test_get_all_collection_documents_returns_the_errors(client, kintaro):
+    count_documents(kintaro=kintaro, total_document_count=7)
+    kintaro.routes["searchDocuments"] = lambda body: (
+        kintaro.error(500, "Backend error")
+        if body["result_options"]["offset"] == 3
+        else search_documents(count=7)(body)
+    )
+
+    result = client.documents.get_all_collection_documents(
+        collection_id="pages", page_size=3
+    )
+
+    assert result["errors"][0]["message"] == "Backend error"
@@ -0,0 +1,97 @@
+from hashlib import md5
+
+from kintaro_client.constants import KintaroFieldType
+from kintaro_client.converters import KintaroRootFingerprint, compile_schema
+from kintaro_client.models import KintaroSchema
+
+
+SCHEMA = KintaroSchema(
+    initial_data=dict(
+        name="Page",
+        schema_fields=[
+            dict(
+                name="title", type=KintaroFieldType.STRING, translatable=True
+            ),
+            dict(
+                name="links",
+                type=KintaroFieldType.NESTED,
+                repeated=True,
+                schema_fields=[
+                    dict(
+                        name="label",
+                        type=KintaroFieldType.STRING,
+                        translatable=True,
+                    )
+                ],
+            ),
+        ],
+    )
+)
+ROOT = dict(title="Home", links=[dict(label="Start"), dict(label="Begin")])
+# every translated value has the same text, but not the same root value
+TRANSLATION = dict(
+    title="Begin", links=[dict(label="Begin"), dict(label="Begin")]
+)
+
+
+def get_md5(value):
+    return md5(value.encode("utf-8")).hexdigest()
+
+
+def get_root_md5s(fields):
+    return {
+        field["field_name"]: (
+            [value["root_md5"] for value in field["field_values"]]
+            if "field_values" in field
+            else [
+                get_root_md5s(fields=item["fields"])
+                for item in field["nested_field_values"]
+            ]
+        )
+        for field in fields
+    }
+
+
+def test_root_fingerprint_has_the_md5_of_each_translatable_path(client):
+    fingerprint = client.documents.get_root_fingerprint(
+        root_content=ROOT, schema=SCHEMA
+    )
+
+    assert isinstance(fingerprint, KintaroRootFingerprint)
+    assert fingerprint.md5s == {
+        "title": get_md5("Home"),
+        "links.0.label": get_md5("Start"),
+        "links.1.label": get_md5("Begin"),
+    }
+
+
+def test_translations_get_the_md5_of_the_root_value_at_their_path(client):
+    fields = client.documents.convert_document_content_to_kintaro_format(
+        collection_id="pages",
+        content=TRANSLATION,
+        schema_info=SCHEMA.schema_fields,
+        locale="nl_nl",
+        root_md5_info=client.documents.get_root_fingerprint(
+            root_content=ROOT, schema=SCHEMA
+        ).md5s,
+        converter=compile_schema(SCHEMA),
+    )
+
+    assert get_root_md5s(fields=fields) == dict(
+        title=[get_md5("Home")],
+        links=[
+            dict(label=[get_md5("Start")]),
+            dict(label=[get_md5("Begin")]),
+        ],
+    )
+
+
+def test_root_values_get_no_md5(client):
+    fields = client.documents.convert_document_content_to_kintaro_format(
+        collection_id="pages",
+        content=ROOT,
+        schema_info=SCHEMA.schema_fields,
+        converter=compile_schema(SCHEMA),
+    )
+
+    assert all("root_md5" not in value for value in fields[0]["field_values"])
@@ -0,0 +1,77 @@
+import json
+import os
+
+from kintaro_client import utils
+from kintaro_client.cache import KintaroDiscoveryCache
+from kintaro_client.constants import KINTARO_BACKEND_URI, KINTARO_URI
+
+
+def test_discovery_cache_keeps_a_document_per_url(tmp_path):
+    cache = KintaroDiscoveryCache(cache_dir=str(tmp_path))
+    cache.set(url="https://one/discovery", content='{"name": "one"}')
+    cache.set(url="https://two/discovery", content='{"name": "two"}')
+
+    assert cache.get(url="https://one/discovery") == '{"name": "one"}'
+    assert cache.get(url="https://two/discovery") == '{"name": "two"}'
+    assert cache.get(url="https://three/discovery") is None
+    assert all(not name.endswith(".tmp") for name in os.listdir(tmp_path))
+
+
+def test_discovery_cache_ignores_expired_and_other_versions(tmp_path):
+    cache = KintaroDiscoveryCache(cache_dir=str(tmp_path), ttl=60)
+    cache.set(url="https://one/discovery", content="{}")
+    file_path: str = cache.get_file_path(url="https://one/discovery")
+    with open(file_path, encoding="utf-8") as f:
+        entry = json.load(f)
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(dict(entry, cached_at=entry["cached_at"] - 61), f)
+    assert cache.get(url="https://one/discovery") is None
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(dict(entry, version=entry["version"] + 1), f)
+    assert cache.get(url="https://one/discovery") is None
+
+
+def test_create_kintaro_service_caches_the_discovery_of_its_host(
+    monkeypatch, tmp_path
+):
+    builds = []
+    monkeypatch.setattr(
+        utils, "build", lambda *args, **kwargs: builds.append(kwargs) or 1
+    )
+
+    for use_backend_url in [False, True]:
+        utils.create_kintaro_service(
+            use_backend_url=use_backend_url,
+            credentials=object(),
+            discovery_cache_dir=str(tmp_path),
+        )
+    utils.create_kintaro_service(credentials=object(), cache_discovery=False)
+
+    assert [
+        kwargs["discoveryServiceUrl"].split("/")[2] for kwargs in builds
+    ] == [KINTARO_URI, KINTARO_BACKEND_URI, KINTARO_URI]
+    assert builds[0]["cache"].cache_dir == str(tmp_path)
+    assert builds[2]["cache"] is None
+
+
+def test_create_kintaro_service_builds_a_given_document(monkeypatch, tmp_path):
+    def download(*args, **kwargs):
+        raise AssertionError("The discovery document was downloaded")
+
+    documents = []
+    monkeypatch.setattr(utils, "build", download)
+    monkeypatch.setattr(
+        utils,
+        "build_from_document",
+        lambda document, **kwargs: documents.append(document) or 1,
+    )
+    file_path = tmp_path / "discovery.json"
+    file_path.write_text('{"name": "content"}', encoding="utf-8")
+
+    utils.create_kintaro_service(
+        credentials=object(), discovery_document=str(file_path)
+    )
+
+    assert documents == ['{"name": "content"}']
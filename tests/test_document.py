@@ -0,0 +1,618 @@
+import json
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, current_thread
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from kintaro_client.constants import KintaroFieldType, KintaroReturnDocument
+from kintaro_client.exceptions import KintaroCreateDocumentError
+from kintaro_client.models import KintaroResource
+from kintaro_client.references import KintaroReferencePlan
+
+
+LINKS = ["one", "two", "three"]
+
+
+def get_links(links):
+    def get_fields(body):
+        indexes = [
+            int(header["field_descriptor"].rsplit(".", 1)[1])
+            for header in body["field_headers"]
+        ]
+        if max(indexes) >= len(links):
+            return 400, dict(
+                error=dict(code=400, message="Index 3 is out of range")
+            )
+        # kintaro leaves out the empty values
+        return 200, dict(
+            field_values=[
+                dict(field_header=header, value=links[index])
+                for header, index in zip(body["field_headers"], indexes)
+                if links[index] is not None
+            ]
+        )
+
+    return get_fields
+
+
+def test_fetch_field_values_matches_values_to_their_field(client, kintaro):
+    kintaro.routes["getFieldsByDescriptor"] = lambda body: (
+        200,
+        dict(
+            field_values=[
+                dict(
+                    field_header=dict(
+                        document_id="document-two",
+                        locale="root",
+                        field_descriptor="title",
+                    ),
+                    value="Two",
+                )
+            ]
+        ),
+    )
+
+    values = client.documents.fetch_field_values(
+        field_headers=[
+            dict(
+                document_id=document_id,
+                locale="root",
+                field_descriptor="title",
+            )
+            for document_id in ["document-one", "document-two"]
+        ]
+    )
+
+    assert values == [None, "Two"]
+
+
+def test_fetch_repeated_field_values_stops_at_the_last_entry(client, kintaro):
+    kintaro.routes["getFieldsByDescriptor"] = get_links(links=LINKS)
+
+    values = client.documents.fetch_repeated_field_values(
+        field_header=dict(
+            document_id="document-one", locale="root", field_descriptor="links"
+        ),
+        chunk_size=2,
+    )
+
+    assert values == LINKS
+
+
+def test_fetch_repeated_field_values_keeps_the_empty_entries(client, kintaro):
+    kintaro.routes["getFieldsByDescriptor"] = get_links(
+        links=["one", None, "three", None, "five"]
+    )
+
+    values = client.documents.fetch_repeated_field_values(
+        field_header=dict(
+            document_id="document-one", locale="root", field_descriptor="links"
+        ),
+        chunk_size=2,
+    )
+
+    assert values == ["one", None, "three", None, "five"]
+
+
+def test_fetch_repeated_field_values_raises_other_bad_requests(
+    client, kintaro
+):
+    kintaro.routes["getFieldsByDescriptor"] = lambda body: kintaro.error(
+        400, "Invalid field descriptor links.0"
+    )
+
+    with pytest.raises(HttpError):
+        client.documents.fetch_repeated_field_values(
+            field_header=dict(
+                document_id="document-one",
+                locale="root",
+                field_descriptor="links",
+            )
+        )
+
+
+def test_fetch_repeated_field_values_raises_other_errors(client, kintaro):
+    kintaro.routes["getFieldsByDescriptor"] = lambda body: kintaro.error(
+        500, "Backend error"
+    )
+
+    with pytest.raises(HttpError):
+        client.documents.fetch_repeated_field_values(
+            field_header=dict(
+                document_id="document-one",
+                locale="root",
+                field_descriptor="links",
+            )
+        )
+
+
+def fail_documents(kintaro, document_ids):
+    def update(body):
+        if any(
+            entry["document_id"] in document_ids
+            for entry in body["updated_content"]
+        ):
+            return kintaro.error(400, "Invalid document")
+        return 200, {}
+
+    return update
+
+
+def test_update_documents_isolates_the_failing_documents(client, kintaro):
+    kintaro.routes["multiDocumentUpdate"] = fail_documents(
+        kintaro=kintaro, document_ids=["document-3"]
+    )
+
+    errors = client.documents.update_documents(
+        collection_id="pages",
+        documents={
+            f"document-{index}": dict(root=dict(title=f"Page {index}"))
+            for index in range(1, 6)
+        },
+        chunk_size=4,
+    )
+
+    assert [document_id for document_id, error in errors.items() if error] == [
+        "document-3"
+    ]
+    assert errors["document-3"]["errors"][0]["message"] == "Invalid document"
+    updated = [
+        entry["document_id"]
+        for body in kintaro.get_calls("multiDocumentUpdate")
+        for entry in body["updated_content"]
+    ]
+    assert sorted(set(updated)) == [f"document-{i}" for i in range(1, 6)]
+
+
+def test_update_in_chunks_keeps_the_errors_of_each_workspace(client, kintaro):
+    def update(body):
+        if body["project_id"] == "other":
+            return kintaro.error(400, "Invalid document")
+        return 200, {}
+
+    kintaro.routes["multiDocumentUpdate"] = update
+
+    results = client.documents.multi_document_action(
+        request_bodies=[
+            dict(
+                collection_id="pages",
+                document_id="document-1",
+                workspace_id=workspace_id,
+                content=dict(root=dict(title="Page")),
+            )
+            for workspace_id in ["workspace", "other"]
+        ],
+        action="update",
+        chunk_size=10,
+    )
+
+    assert results[0].document_id == "document-1"
+    assert results[1]["errors"][0]["message"] == "Invalid document"
+
+
+def test_update_in_chunks_passes_the_options_of_each_call(client, kintaro):
+    results = client.documents.multi_document_action(
+        request_bodies=[
+            dict(
+                collection_id="pages",
+                document_id="document-1",
+                content=dict(root=dict(title="Page")),
+                only_changed=True,
+                current_content=dict(root=dict(title="Page")),
+            ),
+            dict(
+                collection_id="pages",
+                document_id="document-2",
+                content=dict(root=dict(title="Page")),
+            ),
+        ],
+        action="update",
+        chunk_size=10,
+    )
+
+    assert [result.document_id for result in results] == [
+        "document-1",
+        "document-2",
+    ]
+    # the unchanged document is left out
+    assert [
+        entry["document_id"]
+        for body in kintaro.get_calls("multiDocumentUpdate")
+        for entry in body["updated_content"]
+    ] == ["document-2"]
+
+
+def test_update_document_skips_unchanged_files_and_references(client, kintaro):
+    kintaro.routes["rpcDocumentGet"] = lambda body: (
+        200,
+        dict(
+            document_id=body["document_id"],
+            collection_id=body["collection_id"],
+            content_json=json.dumps(
+                dict(
+                    title="Page",
+                    image=dict(image_path="/resources/1/image.gif"),
+                    author=dict(collection_id="authors", document_id="author"),
+                )
+            ),
+        ),
+    )
+
+    client.documents.update_document(
+        collection_id="pages",
+        document_id="document-1",
+        content=dict(
+            root=dict(
+                title="Page",
+                image="/resources/1/image.gif",
+                author=dict(collection_id="authors", document_id="author"),
+            )
+        ),
+        only_changed=True,
+        return_document=KintaroReturnDocument.SUMMARY,
+    )
+
+    assert kintaro.get_calls("rpcDocumentGet")[0]["depth"] == 0
+    assert not kintaro.get_calls("multiDocumentUpdate")
+
+
+def test_update_document_uploads_only_changed_files(client, kintaro):
+    client.documents.update_document(
+        collection_id="pages",
+        document_id="document-1",
+        content=dict(
+            root=dict(
+                title="New page",
+                image=dict(
+                    data=b64encode(b"image").decode("ascii"),
+                    mimetype="image/gif",
+                    name="image.gif",
+                ),
+            )
+        ),
+        only_changed=True,
+        current_content=dict(root=dict(title="Page", image=None)),
+        return_document=KintaroReturnDocument.SUMMARY,
+    )
+
+    assert len(kintaro.get_calls("resourceCreate")) == 1
+    assert not kintaro.get_calls("rpcDocumentGet")
+    fields = kintaro.get_calls("multiDocumentUpdate")[0]["updated_content"][0][
+        "contents"
+    ][0]["fields"]
+    assert [field["field_name"] for field in fields] == ["title", "image"]
+
+
+def test_update_documents_reports_upload_errors_per_document(client, kintaro):
+    def create_resource(body):
+        if body["file_name"] == "broken.gif":
+            return kintaro.error(400, "Invalid image")
+        return kintaro.create_resource(body)
+
+    kintaro.routes["resourceCreate"] = create_resource
+
+    errors = client.documents.update_documents(
+        collection_id="pages",
+        documents={
+            f"document-{name}": dict(
+                root=dict(
+                    image=dict(
+                        data=b64encode(b"image").decode("ascii"),
+                        mimetype="image/gif",
+                        name=f"{name}.gif",
+                    )
+                )
+            )
+            for name in ["valid", "broken"]
+        },
+    )
+
+    assert errors["document-valid"] is None
+    assert errors["document-broken"]["errors"][0]["message"] == (
+        "Invalid image"
+    )
+    assert [
+        entry["document_id"]
+        for entry in kintaro.get_calls("multiDocumentUpdate")[0][
+            "updated_content"
+        ]
+    ] == ["document-valid"]
+
+
+def test_update_documents_uploads_each_url_once(client, monkeypatch):
+    sources = []
+
+    def create_resource_from_url_or_bytes(source, **kwargs):
+        sources.append(source)
+        return KintaroResource(
+            initial_data=dict(resource_path=f"/resources/{len(sources)}")
+        )
+
+    monkeypatch.setattr(
+        client.resources,
+        "create_resource_from_url_or_bytes",
+        create_resource_from_url_or_bytes,
+    )
+
+    errors = client.documents.update_documents(
+        collection_id="pages",
+        documents={
+            f"document-{index}": dict(
+                root=dict(image=dict(url="https://example.com/image.gif"))
+            )
+            for index in range(3)
+        },
+    )
+
+    assert sources == ["https://example.com/image.gif"]
+    assert list(errors.values()) == [None, None, None]
+
+
+def test_multi_document_action_writes_references_outside_its_executor(
+    client, kintaro
+):
+    client.documents.executor = ThreadPoolExecutor(max_workers=1)
+    results = []
+    thread = Thread(
+        target=lambda: results.extend(
+            client.documents.multi_document_action(
+                request_bodies=[
+                    dict(
+                        collection_id="pages",
+                        content=dict(
+                            root=dict(
+                                title="Page",
+                                author=dict(
+                                    collection_id="authors",
+                                    content=dict(name="Author"),
+                                ),
+                            )
+                        ),
+                    )
+                ],
+                return_exceptions=True,
+            )
+        ),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert [result.document_id for result in results] == ["document-2"]
+    assert [
+        body["collection_id"] for body in kintaro.get_calls("createDocument")
+    ] == ["authors", "pages"]
+
+
+def test_create_document_returns_its_id_when_the_locales_fail(client, kintaro):
+    kintaro.routes["multiDocumentUpdate"] = lambda body: kintaro.error(
+        500, "Backend error"
+    )
+
+    result = client.documents.create_document(
+        collection_id="pages",
+        content=dict(root=dict(title="Page"), nl_nl=dict(title="Pagina")),
+    )
+
+    assert result["document_id"] == "document-1"
+    assert result["errors"][0]["message"] == "Backend error"
+
+
+def test_update_document_field_returns_the_error_of_the_root_read(
+    client, kintaro
+):
+    kintaro.routes["getFieldsByDescriptor"] = lambda body: kintaro.error(
+        500, "Backend error"
+    )
+
+    result = client.documents.update_document_field(
+        collection_id="pages",
+        document_id="document-1",
+        field_name="image.0.file_path",
+        field_values=dict(nl_nl="/resources/1/image.gif"),
+    )
+
+    assert result["errors"][0]["message"] == "Backend error"
+    assert kintaro.get_calls("editField") == []
+
+
+def test_update_document_field_batches_the_nested_locales(client, kintaro):
+    result = client.documents.update_document_field(
+        collection_id="pages",
+        document_id="document-1",
+        field_name="image.0.file_path",
+        field_values=dict(
+            root="/resources/1/image.gif",
+            nl_nl="/resources/2/image.gif",
+            de_de="/resources/3/image.gif",
+        ),
+    )
+
+    assert result is None
+    assert [body["locale"] for body in kintaro.get_calls("editField")] == [
+        "root",
+        "nl_nl",
+        "de_de",
+    ]
+    assert kintaro.batches == 1
+
+
+def create_page_by_title(kintaro):
+    """Routes createDocument to ids made of the page's title, recording
+    the thread of each call
+    """
+    threads = []
+
+    def create_document(body):
+        threads.append(current_thread().name)
+        title = body["contents"]["fields"][0]["field_values"][0]["value"]
+        return 200, dict(document_id=f"page-{title}")
+
+    kintaro.routes["createDocument"] = create_document
+    return threads
+
+
+def build_pages(count):
+    return [
+        dict(collection_id="pages", content=dict(root=dict(title=f"{index}")))
+        for index in range(count)
+    ]
+
+
+def test_multi_document_action_runs_the_calls_in_the_executor(client, kintaro):
+    threads = create_page_by_title(kintaro=kintaro)
+
+    with ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="pages"
+    ) as executor:
+        results = client.documents.multi_document_action(
+            request_bodies=build_pages(count=6), executor=executor
+        )
+
+    assert [result.document_id for result in results] == [
+        f"page-{index}" for index in range(6)
+    ]
+    assert len(threads) == 6
+    assert all(thread.startswith("pages") for thread in threads)
+    assert len(set(threads)) <= 2
+
+
+def test_multi_document_action_runs_in_a_pool_of_max_workers(client, kintaro):
+    threads = create_page_by_title(kintaro=kintaro)
+
+    results = client.documents.multi_document_action(
+        request_bodies=build_pages(count=6), max_workers=3
+    )
+
+    assert [result.document_id for result in results] == [
+        f"page-{index}" for index in range(6)
+    ]
+    assert current_thread().name not in threads
+    assert len(set(threads)) <= 3
+
+
+def test_multi_document_action_raises_the_errors_of_the_calls(client):
+    with pytest.raises(KintaroCreateDocumentError):
+        client.documents.multi_document_action(
+            request_bodies=[
+                *build_pages(count=2),
+                dict(collection_id="pages", content=dict(nl_nl={})),
+            ]
+        )
+
+
+def refer_authors_to_publishers(kintaro):
+    schemas = dict(
+        pages=dict(
+            name="Page",
+            schema_fields=[
+                dict(
+                    name="title",
+                    type=KintaroFieldType.STRING,
+                    translatable=True,
+                ),
+                dict(name="author", type=KintaroFieldType.REFERENCE),
+            ],
+        ),
+        authors=dict(
+            name="Author",
+            schema_fields=[
+                dict(name="name", type=KintaroFieldType.STRING),
+                dict(name="publisher", type=KintaroFieldType.REFERENCE),
+            ],
+        ),
+        publishers=dict(
+            name="Publisher",
+            schema_fields=[dict(name="name", type=KintaroFieldType.STRING)],
+        ),
+    )
+    kintaro.routes["getCollection"] = lambda body: (
+        200,
+        dict(
+            collection_id=body["collection_id"],
+            schema=schemas[body["collection_id"]],
+        ),
+    )
+
+
+def build_page(title, author="Author", publisher="Publisher"):
+    return dict(
+        collection_id="pages",
+        content=dict(
+            root=dict(
+                title=title,
+                author=dict(
+                    collection_id="authors",
+                    content=dict(
+                        name=author,
+                        publisher=dict(
+                            collection_id="publishers",
+                            content=dict(name=publisher),
+                        ),
+                    ),
+                ),
+            )
+        ),
+    )
+
+
+def test_plan_reference_writes_puts_each_document_after_its_references(
+    client, kintaro
+):
+    refer_authors_to_publishers(kintaro)
+    plan = KintaroReferencePlan()
+
+    client.documents.plan_reference_writes(
+        request=build_page("Page"), plan=plan
+    )
+
+    assert [
+        [write.collection_id for write in wave] for wave in plan.get_waves()
+    ] == [["publishers"], ["authors"]]
+
+
+def test_resolve_references_writes_the_referenced_documents_first(
+    client, kintaro
+):
+    refer_authors_to_publishers(kintaro)
+
+    (request,) = client.documents.resolve_references(
+        request_bodies=[build_page("Page")]
+    )
+
+    assert [
+        body["collection_id"] for body in kintaro.get_calls("createDocument")
+    ] == ["publishers", "authors"]
+    assert request["content"]["root"]["author"] == dict(
+        collection_id="authors", document_id="document-2"
+    )
+
+
+def test_resolve_references_writes_a_shared_document_once(client, kintaro):
+    refer_authors_to_publishers(kintaro)
+
+    requests = client.documents.resolve_references(
+        request_bodies=[
+            build_page("Page", publisher="Shared"),
+            build_page("Other page", author="Other", publisher="Shared"),
+        ]
+    )
+
+    assert sorted(
+        body["collection_id"] for body in kintaro.get_calls("createDocument")
+    ) == ["authors", "authors", "publishers"]
+    assert kintaro.get_calls("createDocument")[0]["collection_id"] == (
+        "publishers"
+    )
+    assert sorted(
+        request["content"]["root"]["author"]["document_id"]
+        for request in requests
+    ) == ["document-2", "document-3"]
+    # both authors refer to the publisher written first
+    assert all(
+        '"document-1"' in json.dumps(body["contents"])
+        for body in kintaro.get_calls("createDocument")[1:]
+    )
@@ -0,0 +1,109 @@
+import json
+from typing import Dict, List
+
+from kintaro_client.jobs import KintaroImportJob
+
+
+def build_items(broken: int) -> List[Dict]:
+    return [
+        (
+            dict(
+                collection_id="pages",
+                content=dict(root=dict(title=f"Page {i}")),
+            )
+            if i != broken
+            else dict(collection_id="pages")
+        )
+        for i in range(5)
+    ]
+
+
+def test_import_job_writes_the_other_items_of_a_failed_batch_once(
+    client, kintaro, tmp_path
+):
+    with KintaroImportJob(
+        document_service=client.documents,
+        checkpoint_path=str(tmp_path / "checkpoint.sqlite"),
+        batch_size=5,
+    ) as job:
+        stats = job.run(source=build_items(broken=2))
+
+        assert (stats.written, stats.failed) == (4, 1)
+        assert len(kintaro.get_calls("createDocument")) == 4
+        assert sorted(job.get_document_ids()) == [0, 1, 3, 4]
+        assert list(job.get_errors()) == [2]
+
+
+def test_import_job_resumes_from_its_checkpoint(client, kintaro, tmp_path):
+    checkpoint_path: str = str(tmp_path / "checkpoint.sqlite")
+    source = tmp_path / "pages.ndjson"
+    source.write_text(
+        "\n".join(json.dumps(item) for item in build_items(broken=2)),
+        encoding="utf-8",
+    )
+    with KintaroImportJob(
+        document_service=client.documents,
+        checkpoint_path=checkpoint_path,
+        batch_size=2,
+    ) as job:
+        job.run(source=str(source))
+
+    # only the failed item is written again, once fixed
+    source.write_text(
+        "\n".join(json.dumps(item) for item in build_items(broken=-1)),
+        encoding="utf-8",
+    )
+    with KintaroImportJob(
+        document_service=client.documents,
+        checkpoint_path=checkpoint_path,
+        batch_size=2,
+    ) as job:
+        stats = job.run(source=str(source))
+
+        assert (stats.written, stats.failed, stats.skipped) == (1, 0, 4)
+        assert len(kintaro.get_calls("createDocument")) == 5
+        assert sorted(job.get_document_ids()) == [0, 1, 2, 3, 4]
+        assert job.get_errors() == {}
+
+    with KintaroImportJob(
+        document_service=client.documents,
+        checkpoint_path=checkpoint_path,
+        retry_failed=False,
+    ) as job:
+        stats = job.run(source=str(source))
+
+        assert (stats.written, stats.skipped) == (0, 5)
+
+
+def test_import_job_updates_the_documents_it_created_on_retry(
+    client, kintaro, tmp_path
+):
+    checkpoint_path: str = str(tmp_path / "checkpoint.sqlite")
+    items: List[Dict] = [
+        dict(
+            collection_id="pages",
+            content=dict(root=dict(title="Page"), nl_nl=dict(title="Pagina")),
+        )
+    ]
+    kintaro.routes["multiDocumentUpdate"] = lambda body: kintaro.error(
+        500, "Backend error"
+    )
+    with KintaroImportJob(
+        document_service=client.documents, checkpoint_path=checkpoint_path
+    ) as job:
+        stats = job.run(source=items)
+
+        assert stats.failed == 1
+        assert list(job.get_errors()) == [0]
+
+    # the locales are written to the created document, not to a new one
+    kintaro.routes["multiDocumentUpdate"] = lambda body: (200, {})
+    with KintaroImportJob(
+        document_service=client.documents, checkpoint_path=checkpoint_path
+    ) as job:
+        stats = job.run(source=items)
+
+        assert stats.written == 1
+        assert len(kintaro.get_calls("createDocument")) == 1
+        assert job.get_document_ids() == {0: "document-1"}
+        assert job.get_errors() == {}
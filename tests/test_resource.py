@@ -0,0 +1,136 @@
+from base64 import b64encode
+from io import BytesIO
+
+import pytest
+
+from kintaro_client.exceptions import KintaroResourceTooLargeError
+from kintaro_client.services import resource
+
+
+class FakeDownload:
+    """The streamed response of ``requests.get`` for a file"""
+
+    def __init__(self, data: bytes, content_length: bool = True):
+        self.data = data
+        self.headers = {"content-type": "Text/Plain"}
+        if content_length:
+            self.headers["content-length"] = str(len(data))
+        self.chunk_sizes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        self.chunk_sizes.append(chunk_size)
+        for start in range(0, len(self.data), chunk_size):
+            yield self.data[start : start + chunk_size]
+
+
+@pytest.fixture
+def download(monkeypatch):
+    downloads = []
+
+    def set_download(data: bytes, content_length: bool = True):
+        downloads.append(FakeDownload(data, content_length=content_length))
+        monkeypatch.setattr(
+            resource, "http_get", lambda url, **kwargs: downloads[-1]
+        )
+        return downloads[-1]
+
+    return set_download
+
+
+@pytest.mark.parametrize("size", [0, 1, 5, 6, 7, 13])
+def test_encode_file_matches_the_base64_of_the_whole_file(monkeypatch, size):
+    monkeypatch.setattr(resource, "KINTARO_RESOURCE_CHUNK_SIZE", 6)
+    data = bytes(range(size))
+
+    encoded = resource.KintaroResourceService.encode_file(BytesIO(data))
+
+    assert encoded == b64encode(data).decode("ascii")
+
+
+def test_encode_file_reads_from_the_current_position(monkeypatch):
+    monkeypatch.setattr(resource, "KINTARO_RESOURCE_CHUNK_SIZE", 3)
+    file_data = BytesIO(b"skipped:kept data")
+    file_data.seek(8)
+
+    encoded = resource.KintaroResourceService.encode_file(file_data)
+
+    assert encoded == b64encode(b"kept data").decode("ascii")
+
+
+def test_download_file_writes_the_file_a_chunk_at_a_time(
+    monkeypatch, download
+):
+    monkeypatch.setattr(resource, "KINTARO_RESOURCE_CHUNK_SIZE", 4)
+    response = download(b"file contents")
+    file_data = BytesIO()
+
+    mime_type = resource.KintaroResourceService.download_file(
+        url="https://example.com/file.txt", file_data=file_data
+    )
+
+    assert mime_type == "text/plain"
+    assert response.chunk_sizes == [4]
+    assert file_data.tell() == 0
+    assert file_data.read() == b"file contents"
+
+
+def test_download_file_rejects_a_large_content_length(download):
+    download(b"file contents")
+
+    with pytest.raises(KintaroResourceTooLargeError):
+        resource.KintaroResourceService.download_file(
+            url="https://example.com/file.txt",
+            file_data=BytesIO(),
+            max_size=4,
+        )
+
+
+def test_download_file_stops_when_the_stream_exceeds_max_size(
+    monkeypatch, download
+):
+    monkeypatch.setattr(resource, "KINTARO_RESOURCE_CHUNK_SIZE", 4)
+    download(b"file contents", content_length=False)
+    file_data = BytesIO()
+
+    with pytest.raises(KintaroResourceTooLargeError):
+        resource.KintaroResourceService.download_file(
+            url="https://example.com/file.txt",
+            file_data=file_data,
+            max_size=6,
+        )
+    assert file_data.getvalue() == b"file"
+
+
+def test_create_resource_from_url_uploads_the_downloaded_file(
+    monkeypatch, client, kintaro, download
+):
+    # spooled to disk after the first chunk
+    monkeypatch.setattr(resource, "KINTARO_RESOURCE_CHUNK_SIZE", 3)
+    monkeypatch.setattr(resource, "KINTARO_RESOURCE_SPOOL_SIZE", 4)
+    download(b"file contents")
+
+    created = client.resources.create_resource_from_url_or_bytes(
+        source="https://example.com/file.txt", collection_id="pages"
+    )
+
+    (body,) = kintaro.get_calls("resourceCreate")
+    assert body["file_data"] == b64encode(b"file contents").decode("ascii")
+    assert body["file_type"] == "text/plain"
+    assert created.resource_path == f"/resources/1/{body['file_name']}"
+
+
+def test_create_resource_from_bytes_rejects_large_files(client, kintaro):
+    with pytest.raises(KintaroResourceTooLargeError):
+        client.resources.create_resource_from_url_or_bytes(
+            source=b"file contents", collection_id="pages", max_size=4
+        )
+    assert kintaro.get_calls("resourceCreate") == []
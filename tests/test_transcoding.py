@@ -0,0 +1,127 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from kintaro_client.transcoding import (
+    KintaroImageTranscoder,
+    is_optimized_image,
+    save_optimized_image,
+    transcode_image,
+)
+
+
+def build_image(image_format: str, mode: str = "RGB", **kwargs) -> bytes:
+    data = BytesIO()
+    Image.new(mode, (16, 16), color=1 if mode == "P" else (200, 30, 30)).save(
+        data, image_format, **kwargs
+    )
+    return data.getvalue()
+
+
+@pytest.mark.parametrize(
+    "data, mime_type, optimized",
+    [
+        (build_image("JPEG"), "image/jpeg", False),
+        (build_image("JPEG", progressive=True), "image/jpeg", True),
+        (build_image("PNG"), "image/png", False),
+        (build_image("PNG", mode="P"), "image/png", True),
+        (build_image("WEBP"), "image/webp", False),
+    ],
+)
+def test_is_optimized_image(data, mime_type, optimized):
+    assert (
+        is_optimized_image(Image.open(BytesIO(data)), mime_type) is optimized
+    )
+
+
+def test_save_optimized_image_skips_optimized_images():
+    target = BytesIO()
+
+    mime_type = save_optimized_image(
+        source=build_image("JPEG", progressive=True),
+        mime_type="image/jpeg",
+        target=target,
+        skip_optimized=True,
+    )
+
+    assert mime_type is None
+    assert target.getvalue() == b""
+
+
+def test_save_optimized_image_optimizes_the_others():
+    target = BytesIO()
+
+    mime_type = save_optimized_image(
+        source=build_image("JPEG"),
+        mime_type="image/jpeg",
+        target=target,
+        skip_optimized=True,
+    )
+
+    assert mime_type == "image/jpeg"
+    target.seek(0)
+    assert is_optimized_image(Image.open(target), "image/jpeg")
+
+
+def test_save_optimized_image_reencodes_optimized_images_by_default():
+    target = BytesIO()
+
+    mime_type = save_optimized_image(
+        source=BytesIO(build_image("PNG", mode="P")),
+        mime_type="image/png",
+        target=target,
+    )
+
+    assert mime_type == "image/png"
+    assert target.getvalue() != b""
+
+
+def test_transcode_image_saves_webp_images_as_png():
+    data, mime_type = transcode_image(
+        data=build_image("WEBP"), mime_type="image/webp", skip_optimized=True
+    )
+
+    assert mime_type == "image/png"
+    assert Image.open(BytesIO(data)).format == "PNG"
+
+
+def test_transcode_image_returns_no_data_when_skipped():
+    assert transcode_image(
+        data=build_image("PNG", mode="P"),
+        mime_type="image/png",
+        skip_optimized=True,
+    ) == (None, "image/png")
+
+
+def test_transcoder_keeps_the_executor_it_is_given():
+    executor = ThreadPoolExecutor(max_workers=1)
+    with KintaroImageTranscoder(
+        executor=executor, skip_optimized=True
+    ) as transcoder:
+        skipped = transcoder.transcode(
+            data=build_image("JPEG", progressive=True), mime_type="image/jpeg"
+        )
+        optimized = transcoder.transcode(
+            data=build_image("JPEG"), mime_type="image/jpeg"
+        )
+
+    assert skipped == (None, "image/jpeg")
+    assert optimized[0] is not None
+    assert executor.submit(lambda: "running").result() == "running"
+    executor.shutdown()
+
+
+def test_resource_service_uploads_skipped_images_as_they_are(client):
+    original = BytesIO(build_image("JPEG", progressive=True))
+    client.resources.transcoder = KintaroImageTranscoder(
+        executor=ThreadPoolExecutor(max_workers=1), skip_optimized=True
+    )
+
+    file_data, mime_type = client.resources.optimize_image(
+        file_data=original, mime_type="image/jpeg", optimized_data=BytesIO()
+    )
+
+    assert (file_data, mime_type) == (original, "image/jpeg")
+    assert file_data.tell() == 0
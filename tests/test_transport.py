@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from google.auth.credentials import AnonymousCredentials
+from google_auth_httplib2 import AuthorizedHttp
+from requests import Response
+
+from kintaro_client import utils
+from kintaro_client.constants import KintaroTransport
+from kintaro_client.transport import KintaroRequestsHttp, get_thread_http
+
+
+def test_get_thread_http_gives_each_thread_its_own_connections():
+    http = AuthorizedHttp(AnonymousCredentials())
+
+    own_http = get_thread_http(http)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_http = executor.submit(get_thread_http, http).result()
+
+    assert get_thread_http(http) is own_http
+    assert other_http is not own_http
+    assert other_http.http is not own_http.http
+    assert other_http.credentials is own_http.credentials is http.credentials
+
+
+def test_get_thread_http_keeps_other_http_objects():
+    http = object()
+
+    assert get_thread_http(http) is http
+
+
+def test_requests_http_keeps_a_pool_of_connections():
+    http = KintaroRequestsHttp(credentials=AnonymousCredentials(), pool_size=4)
+
+    adapter = http.session.get_adapter("https://kintaro.test/")
+    assert adapter._pool_maxsize == 4
+    assert adapter is http.session.get_adapter("http://kintaro.test/")
+
+
+def test_requests_http_answers_like_httplib2(monkeypatch):
+    http = KintaroRequestsHttp(credentials=AnonymousCredentials(), timeout=5)
+    requests = []
+
+    def request(method, uri, **kwargs):
+        requests.append((method, uri, kwargs))
+        response = Response()
+        response.status_code = 404
+        response.reason = "Not Found"
+        response.headers.update(
+            {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )
+        response._content = b"{}"
+        return response
+
+    monkeypatch.setattr(http.session, "request", request)
+
+    response, content = http.request(
+        "https://kintaro.test/", method="POST", body="{}", redirections=0
+    )
+
+    assert (response.status, response.reason) == (404, "Not Found")
+    assert response["content-type"] == "application/json"
+    assert "content-encoding" not in response
+    assert content == b"{}"
+    assert requests == [
+        (
+            "POST",
+            "https://kintaro.test/",
+            dict(data="{}", headers=None, timeout=5, allow_redirects=False),
+        )
+    ]
+
+
+def test_create_kintaro_service_uses_the_requested_transport(monkeypatch):
+    builds = []
+    monkeypatch.setattr(
+        utils, "build", lambda *args, **kwargs: builds.append(kwargs) or 1
+    )
+
+    utils.create_kintaro_service(
+        credentials=AnonymousCredentials(),
+        transport=KintaroTransport.REQUESTS,
+        http_pool_size=3,
+    )
+    with pytest.raises(ValueError):
+        utils.create_kintaro_service(
+            credentials=AnonymousCredentials(), transport="urllib"
+        )
+
+    assert isinstance(builds[0]["http"], KintaroRequestsHttp)
+    assert builds[0]["http"].session.get_adapter("https://")._pool_maxsize == 3
+    assert "credentials" not in builds[0]
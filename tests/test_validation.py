@@ -0,0 +1,52 @@
+from kintaro_client.constants import KintaroFieldType
+from kintaro_client.models import KintaroSchema
+from kintaro_client.validation import KintaroSchemaValidator, compile_validator
+
+
+def build_validator() -> KintaroSchemaValidator:
+    return compile_validator(
+        KintaroSchema(
+            initial_data=dict(
+                name="Code",
+                schema_fields=[
+                    dict(
+                        name="code",
+                        type=KintaroFieldType.STRING,
+                        validation_rule="^.{2,4}$",
+                    ),
+                    dict(name="date", type=KintaroFieldType.DATE),
+                    dict(
+                        name="links",
+                        type=KintaroFieldType.NESTED,
+                        repeated=True,
+                        schema_fields=[
+                            dict(
+                                name="label",
+                                type=KintaroFieldType.STRING,
+                                validation_rule="^.{0,3}$",
+                            )
+                        ],
+                    ),
+                ],
+            )
+        )
+    )
+
+
+def test_validator_accepts_the_scalars_the_converter_writes():
+    assert build_validator().validate(content=dict(code=123, date=2024)) == []
+
+
+def test_validator_checks_the_text_of_scalars():
+    assert build_validator().validate(
+        content=dict(code=12345, date=dict(year=2024))
+    ) == [
+        "code: should have at most 4 characters",
+        f"date: invalid {KintaroFieldType.DATE} value dict",
+    ]
+
+
+def test_validator_checks_the_limits_of_nested_fields():
+    assert build_validator().validate(
+        content=dict(links=[dict(label="One"), dict(label="Four")])
+    ) == ["links.1.label: should have at most 3 characters"]